@@ -0,0 +1,20 @@
+from app import db
+from app.models.alteracao_model import Alteracao
+
+def get_alteracoes(desde, limite):
+    """Alterações com seq maior que `desde`, em ordem; indica se há mais a ler."""
+    alteracoes = (
+        Alteracao.query
+        .filter(Alteracao.seq > desde)
+        .order_by(Alteracao.seq)
+        .limit(limite + 1)
+        .all()
+    )
+    mais = len(alteracoes) > limite
+    alteracoes = alteracoes[:limite]
+    ultimo = alteracoes[-1].seq if alteracoes else desde
+    return [alteracao.to_dict() for alteracao in alteracoes], ultimo, mais
+
+def seq_atual():
+    """Maior seq já gravado (0 com o log vazio)."""
+    return db.session.query(db.func.max(Alteracao.seq)).scalar() or 0
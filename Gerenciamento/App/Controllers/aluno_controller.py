@@ -1,18 +1,50 @@
 from app import db
 from app.models.aluno_model import Aluno
 from app.models.turma_model import Turma
+from app.controllers import turma_controller
+from app.utils.busca import buscar
+from app.utils.cache import registrar_alteracao
+from app.utils.campos import aplicar_campos
+from app.utils.exportacao import em_lotes
+from app.utils.existencia import ids_existentes
+from app.utils.etag import etag_pagina, gerar_etag
+from app.utils.paginacao import paginar
+from sqlalchemy.orm import joinedload
 from datetime import datetime
 
-def get_alunos():
-    alunos = Aluno.query.all()
-    return [aluno.to_dict() for aluno in alunos]
+def get_alunos(limite, apos=None, campos=None):
+    # A descrição da turma vem no mesmo SELECT (JOIN), só quando o campo é pedido
+    query = aplicar_campos(Aluno.query, Aluno, campos)
+    alunos, proximo = paginar(query, Aluno.id, limite, apos)
+    return [aluno.to_dict(campos) for aluno in alunos], proximo
 
-def get_aluno(aluno_id):
-    aluno = Aluno.query.get(aluno_id)
-    return aluno.to_dict()
+def etag_alunos(limite, apos=None):
+    query = db.session.query(Aluno.id, Aluno.versao, Turma.versao).outerjoin(Aluno.turma)
+    return etag_pagina('alunos', query, Aluno.id, limite, apos)
+
+def exportar_alunos(campos=None):
+    query = aplicar_campos(Aluno.query, Aluno, campos)
+    return (aluno.to_dict(campos) for aluno in em_lotes(query, Aluno.id))
+
+def buscar_alunos(termos, limite, campos=None):
+    query = aplicar_campos(buscar(Aluno, termos), Aluno, campos)
+    return [aluno.to_dict(campos) for aluno in query.limit(limite)]
+
+def alunos_existentes(ids):
+    return ids_existentes(Aluno.id, ids)
+
+def etag_aluno(aluno_id):
+    versoes = db.session.execute(
+        db.select(Aluno.versao, Turma.versao).outerjoin(Aluno.turma).where(Aluno.id == aluno_id)
+    ).first()
+    return gerar_etag('aluno', aluno_id, *versoes) if versoes else None
+
+def get_aluno(aluno_id, campos=None):
+    aluno = aplicar_campos(Aluno.query, Aluno, campos).get(aluno_id)
+    return aluno.to_dict(campos) if aluno else None
 
 def create_aluno(data):
-    turma = Turma.query.get(data.get('turma_id'))
+    turma = turma_controller.get_turma(data.get('turma_id'))
     if not turma:
         return None
     
@@ -25,20 +57,98 @@ def create_aluno(data):
         nota_segundo_semestre=data.get('nota_segundo_semestre')
     )
 
-    if novo_aluno.nota_primeiro_semestre is not None and novo_aluno.nota_segundo_semestre is not None:
-        novo_aluno.media_final = (novo_aluno.nota_primeiro_semestre + novo_aluno.nota_segundo_semestre) / 2
+    novo_aluno.media_final = Aluno.calcular_media(novo_aluno.nota_primeiro_semestre, novo_aluno.nota_segundo_semestre)
 
     db.session.add(novo_aluno)
     db.session.commit()
     return novo_aluno.to_dict()
 
+def _inteiro(valor):
+    """Converte um ID vindo do JSON (número ou texto, como aceita POST /alunos/); bool não vale."""
+    if isinstance(valor, bool):
+        return None
+    try:
+        return int(valor) if isinstance(valor, (int, str)) else None
+    except ValueError:
+        return None
+
+def _numero_ou_nulo(valor, tipos):
+    return valor is None or (isinstance(valor, tipos) and not isinstance(valor, bool))
+
+def _validar_registro(data):
+    """Valida um registro do lote; retorna (status, erro) ou None se ele pode ser inserido."""
+    if not isinstance(data, dict) or not 'nome' in data or not 'turma_id' in data:
+        return 400, 'Dados insuficientes'
+    if not isinstance(data.get('nome'), str) or not data.get('nome').strip():
+        return 400, 'Nome inválido'
+    if _inteiro(data.get('turma_id')) is None:
+        return 400, 'ID da turma inválido'
+    if not _numero_ou_nulo(data.get('idade'), int):
+        return 400, 'Idade inválida'
+    if not all(_numero_ou_nulo(data.get(nota), (int, float)) for nota in ('nota_primeiro_semestre', 'nota_segundo_semestre')):
+        return 400, 'Nota inválida'
+    return None
+
+def create_alunos_em_lote(registros):
+    """Cria vários alunos em uma única transação.
+
+    Cada registro é validado antes da inserção e as turmas são conferidas com
+    uma só consulta IN; os alunos válidos são inseridos de uma vez e cada
+    registro recebe o seu próprio resultado, de modo que registros inválidos
+    não impedem a criação dos demais.
+    """
+    erros = [_validar_registro(data) for data in registros]
+    turma_ids = {_inteiro(data['turma_id']) for data, erro in zip(registros, erros) if erro is None}
+    turmas_existentes = {turma_id for (turma_id,) in db.session.query(Turma.id).filter(Turma.id.in_(turma_ids))}
+
+    resultados = []
+    novos = []
+    for indice, (data, erro) in enumerate(zip(registros, erros)):
+        if erro:
+            resultados.append({'indice': indice, 'status': erro[0], 'error': erro[1]})
+            continue
+        turma_id = _inteiro(data.get('turma_id'))
+        if turma_id not in turmas_existentes:
+            resultados.append({'indice': indice, 'status': 404, 'error': 'Turma não encontrada'})
+            continue
+        try:
+            data_nascimento = datetime.strptime(data.get('data_nascimento'), '%Y-%m-%d').date() if data.get('data_nascimento') else None
+        except (TypeError, ValueError):
+            resultados.append({'indice': indice, 'status': 400, 'error': 'Data de nascimento inválida'})
+            continue
+
+        novos.append({
+            'nome': data.get('nome'),
+            'idade': data.get('idade'),
+            'turma_id': turma_id,
+            'data_nascimento': data_nascimento,
+            'nota_primeiro_semestre': data.get('nota_primeiro_semestre'),
+            'nota_segundo_semestre': data.get('nota_segundo_semestre'),
+            'media_final': Aluno.calcular_media(data.get('nota_primeiro_semestre'), data.get('nota_segundo_semestre'))
+        })
+        resultados.append({'indice': indice, 'status': 201})
+
+    if novos:
+        # return_defaults preenche o 'id' gerado em cada dicionário
+        db.session.bulk_insert_mappings(Aluno, novos, return_defaults=True)
+        db.session.commit()
+
+        criados = Aluno.query.options(joinedload(Aluno.turma)).filter(Aluno.id.in_([n['id'] for n in novos]))
+        alunos = {aluno.id: aluno.to_dict() for aluno in criados}
+        ids = iter(n['id'] for n in novos)
+        for resultado in resultados:
+            if resultado['status'] == 201:
+                resultado['aluno'] = alunos[next(ids)]
+
+    return resultados
+
 def update_aluno(aluno_id, data):
     aluno = Aluno.query.get(aluno_id)
     if not aluno:
         return {'error': 'Aluno não encontrado'}
 
     if 'turma_id' in data:
-        turma = Turma.query.get(data.get('turma_id'))
+        turma = turma_controller.get_turma(data.get('turma_id'))
         if not turma:
             return {'error': 'Turma não encontrada'}
         aluno.turma_id = data.get('turma_id')
@@ -52,9 +162,10 @@ def update_aluno(aluno_id, data):
     aluno.nota_segundo_semestre = data.get('nota_segundo_semestre', aluno.nota_segundo_semestre)
 
     if aluno.nota_primeiro_semestre is not None and aluno.nota_segundo_semestre is not None:
-        aluno.media_final = (aluno.nota_primeiro_semestre + aluno.nota_segundo_semestre) / 2
+        aluno.media_final = Aluno.calcular_media(aluno.nota_primeiro_semestre, aluno.nota_segundo_semestre)
     
     db.session.commit()
+    registrar_alteracao('alunos')
     return aluno.to_dict()
 
 def delete_aluno(aluno_id):
@@ -62,5 +173,6 @@ def delete_aluno(aluno_id):
     if aluno:
         db.session.delete(aluno)
         db.session.commit()
+        registrar_alteracao('alunos')
         return True
     return False
\ No newline at end of file
@@ -1,15 +1,49 @@
 from app import db
 from app.models.professor_model import Professor
+from app.utils.busca import buscar
+from app.utils.cache import cache_professores, registrar_alteracao
+from app.utils.campos import aplicar_campos, filtrar_campos
+from app.utils.existencia import ids_existentes
+from app.utils.etag import etag_pagina, gerar_etag
+from app.utils.paginacao import paginar
 
-def get_professores():
-    professores = Professor.query.all()
-    return [professor.to_dict() for professor in professores]
+def get_professores(limite, apos=None, campos=None):
+    query = aplicar_campos(Professor.query, Professor, campos)
+    professores, proximo = paginar(query, Professor.id, limite, apos)
+    return [professor.to_dict(campos) for professor in professores], proximo
 
-def get_professor(professor_id):
+def etag_professores(limite, apos=None):
+    query = db.session.query(Professor.id, Professor.versao)
+    return etag_pagina('professores', query, Professor.id, limite, apos)
+
+def buscar_professores(termos, limite, campos=None):
+    query = aplicar_campos(buscar(Professor, termos), Professor, campos)
+    return [professor.to_dict(campos) for professor in query.limit(limite)]
+
+def professores_existentes(ids):
+    return ids_existentes(Professor.id, ids)
+
+def _carregar_professor(professor_id):
     professor = Professor.query.get(professor_id)
-    if professor:
-        return professor.to_dict()
-    return None
+    if not professor:
+        return None
+    return {'dados': professor.to_dict(), 'etag': gerar_etag('professor', professor.id, professor.versao)}
+
+def _professor_em_cache(professor_id):
+    """Professor serializado e seu ETag, lidos do cache (ou do banco, se ausente)."""
+    try:
+        professor_id = int(professor_id)
+    except (TypeError, ValueError):
+        return None
+    return cache_professores.obter(professor_id, lambda: _carregar_professor(professor_id))
+
+def etag_professor(professor_id):
+    entrada = _professor_em_cache(professor_id)
+    return entrada['etag'] if entrada else None
+
+def get_professor(professor_id, campos=None):
+    entrada = _professor_em_cache(professor_id)
+    return filtrar_campos(entrada['dados'], campos) if entrada else None
 
 def create_professor(data):
     novo_professor = Professor(
@@ -31,6 +65,7 @@ def update_professor(professor_id, data):
         professor.materia = data.get('materia', professor.materia)
         professor.observacoes = data.get('observacoes', professor.observacoes)
         db.session.commit()
+        registrar_alteracao('professores')
         return professor.to_dict()
     return None
 
@@ -39,5 +74,6 @@ def delete_professor(professor_id):
     if professor:
         db.session.delete(professor)
         db.session.commit()
+        registrar_alteracao('professores')
         return True
     return False
\ No newline at end of file
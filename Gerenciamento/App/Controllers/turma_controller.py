@@ -1,17 +1,95 @@
+from flask import current_app
 from app import db
 from app.models.turma_model import Turma
 from app.models.professor_model import Professor
+from app.models.aluno_model import Aluno
+from app.controllers import professor_controller
+from app.utils.cache import cache_turmas, registrar_alteracao
+from app.utils.campos import aplicar_campos, filtrar_campos
+from app.utils.existencia import ids_existentes
+from app.utils.etag import etag_pagina, gerar_etag
+from app.utils.paginacao import paginar
+from sqlalchemy import case, func
+from sqlalchemy.orm import joinedload
 
-def get_turmas():
-    turmas = Turma.query.all()
-    return [turma.to_dict() for turma in turmas]
+def get_turmas(limite, apos=None, campos=None):
+    # O nome do professor vem no mesmo SELECT (JOIN), só quando o campo é pedido
+    query = aplicar_campos(Turma.query, Turma, campos)
+    turmas, proximo = paginar(query, Turma.id, limite, apos)
+    return [turma.to_dict(campos) for turma in turmas], proximo
 
-def get_turma(turma_id):
+def etag_turmas(limite, apos=None):
+    query = db.session.query(Turma.id, Turma.versao, Professor.versao).outerjoin(Turma.professor)
+    return etag_pagina('turmas', query, Turma.id, limite, apos)
+
+def turmas_existentes(ids):
+    return ids_existentes(Turma.id, ids)
+
+def _carregar_turma(turma_id):
+    turma = Turma.query.options(joinedload(Turma.professor)).get(turma_id)
+    if not turma:
+        return None
+    versao_professor = turma.professor.versao if turma.professor else None
+    return {'dados': turma.to_dict(), 'etag': gerar_etag('turma', turma.id, turma.versao, versao_professor)}
+
+def _turma_em_cache(turma_id):
+    """Turma serializada e seu ETag, lidos do cache (ou do banco, se ausente)."""
+    try:
+        turma_id = int(turma_id)
+    except (TypeError, ValueError):
+        return None
+    return cache_turmas.obter(turma_id, lambda: _carregar_turma(turma_id))
+
+def etag_turma(turma_id):
+    entrada = _turma_em_cache(turma_id)
+    return entrada['etag'] if entrada else None
+
+def get_turma(turma_id, campos=None):
+    entrada = _turma_em_cache(turma_id)
+    return filtrar_campos(entrada['dados'], campos) if entrada else None
+
+def get_alunos_da_turma(turma_id, limite, apos=None, campos=None):
     turma = Turma.query.get(turma_id)
-    return turma.to_dict() if turma else None
+    if not turma:
+        return None, None
+
+    # A turma já está na sessão, então to_dict() não consulta de novo a descrição;
+    # turma_id continua carregado para que aluno.turma saia do mapa de identidade
+    query = Aluno.query.filter(Aluno.turma_id == turma_id)
+    if campos is not None:
+        query = aplicar_campos(query, Aluno, (campos - {'turma_descricao'}) | {'turma_id'})
+    alunos, proximo = paginar(query, Aluno.id, limite, apos)
+    return {
+        'turma_id': turma_id,
+        'resumo': resumo_turma(turma_id),
+        'alunos': [aluno.to_dict(campos) for aluno in alunos]
+    }, proximo
+
+def resumo_turma(turma_id):
+    """Estatísticas da turma calculadas com agregações no banco, sem carregar os alunos."""
+    media_aprovacao = current_app.config['MEDIA_APROVACAO']
+    total, avaliados, media, minima, maxima, aprovados = db.session.execute(
+        db.select(
+            func.count(Aluno.id),
+            func.count(Aluno.media_final),
+            func.avg(Aluno.media_final),
+            func.min(Aluno.media_final),
+            func.max(Aluno.media_final),
+            func.count(case((Aluno.media_final >= media_aprovacao, 1)))
+        ).where(Aluno.turma_id == turma_id)
+    ).one()
+
+    return {
+        'total_alunos': total,
+        'alunos_com_media': avaliados,
+        'media': media,
+        'media_minima': minima,
+        'media_maxima': maxima,
+        'taxa_aprovacao': aprovados / avaliados if avaliados else None
+    }
 
 def create_turma(data):
-    professor = Professor.query.get(data.get('professor_id'))
+    professor = professor_controller.get_professor(data.get('professor_id'))
     if not professor:
         return None
     
@@ -30,7 +108,7 @@ def update_turma(turma_id, data):
         return {'error': 'Turma não encontrado'}
     
     if 'professor_id' in data:
-        professor = Professor.query.get(data.get('professor_id'))
+        professor = professor_controller.get_professor(data.get('professor_id'))
         if not professor:
             return {'error': 'Professor não encontrado'}
         turma.professor_id = data.get('professor_id')
@@ -38,12 +116,41 @@ def update_turma(turma_id, data):
     turma.descricao = data.get('descricao', turma.descricao)
     turma.ativo = data.get('ativo', turma.ativo)
     db.session.commit()
+    registrar_alteracao('turmas')
     return turma.to_dict()
 
 def delete_turma(turma_id):
-    turma = Turma.query.get(turma_id)
-    if turma:
-        db.session.delete(turma)
-        db.session.commit()
-        return True
-    return False
\ No newline at end of file
+    # DELETEs em conjunto: os alunos da turma não são carregados na sessão
+    sem_sincronizar = {'synchronize_session': False}
+    db.session.execute(db.delete(Aluno).where(Aluno.turma_id == turma_id), execution_options=sem_sincronizar)
+    resultado = db.session.execute(db.delete(Turma).where(Turma.id == turma_id), execution_options=sem_sincronizar)
+    db.session.commit()
+    registrar_alteracao('turmas')
+    return resultado.rowcount > 0
+
+def recalcular_medias(turma_id=None):
+    """Recalcula a media_final dos alunos de uma turma (ou de todas) com um único UPDATE.
+
+    O cálculo é feito pelo próprio banco, em uma passada sobre as linhas, e só
+    altera (e versiona) os alunos cuja média realmente mudou.
+    """
+    if turma_id is not None and not get_turma(turma_id):
+        return None
+
+    media = Aluno.calcular_media(Aluno.nota_primeiro_semestre, Aluno.nota_segundo_semestre)
+    condicoes = [
+        Aluno.nota_primeiro_semestre.isnot(None),
+        Aluno.nota_segundo_semestre.isnot(None),
+        Aluno.media_final.is_distinct_from(media)
+    ]
+    if turma_id is not None:
+        condicoes.append(Aluno.turma_id == turma_id)
+
+    resultado = db.session.execute(
+        db.update(Aluno).where(*condicoes).values(media_final=media, versao=Aluno.versao + 1),
+        execution_options={'synchronize_session': False}
+    )
+    db.session.commit()
+    if resultado.rowcount:
+        registrar_alteracao('alunos')
+    return resultado.rowcount
@@ -0,0 +1,81 @@
+from flask import Blueprint, request, jsonify
+from app.controllers import alteracao_controller
+from app.utils.paginacao import ler_paginacao
+
+alteracao_bp = Blueprint('alteracao_bp', __name__, url_prefix='/changes')
+
+# strict_slashes=False: responde em /changes e em /changes/, sem o redirecionamento 308
+@alteracao_bp.route('/', methods=['GET'], strict_slashes=False)
+def get_alteracoes():
+    """
+    Log de alterações de professores, turmas e alunos
+    ---
+    tags:
+      - Alterações
+    description: >
+      Cada create, update e delete gera uma entrada, gravada na mesma transação
+      da escrita. Para manter uma cópia local, leia a partir de since=0 e depois
+      repita a chamada com since=ultimo_seq enquanto mais for true. Quem só
+      precisa das alterações futuras pode começar de seq_atual.
+    parameters:
+      - in: query
+        name: since
+        type: integer
+        description: Retorna apenas alterações com seq maior que este valor (padrão 0).
+      - in: query
+        name: limit
+        type: integer
+        description: Quantidade de alterações por chamada (o servidor aplica um máximo).
+    responses:
+      200:
+        description: Alterações em ordem de seq
+        schema:
+          type: object
+          properties:
+            alteracoes:
+              type: array
+              items:
+                type: object
+                properties:
+                  seq:
+                    type: integer
+                  recurso:
+                    type: string
+                    enum: [professores, turmas, alunos]
+                  id:
+                    type: integer
+                  operacao:
+                    type: string
+                    enum: [create, update, delete]
+                  dados:
+                    type: object
+                    description: Campos do registro após a alteração (null em delete).
+                  criado_em:
+                    type: string
+            ultimo_seq:
+              type: integer
+              description: Valor de since para a próxima chamada.
+            mais:
+              type: boolean
+              description: Indica se já há mais alterações depois desta página.
+            seq_atual:
+              type: integer
+              description: Maior seq já gravado no log.
+      400:
+        description: Parâmetros inválidos
+    """
+    try:
+        desde = int(request.args.get('since', 0))
+    except ValueError:
+        desde = -1
+    if desde < 0:
+        return jsonify({'error': 'Parâmetro since inválido'}), 400
+
+    limite, _ = ler_paginacao()
+    alteracoes, ultimo, mais = alteracao_controller.get_alteracoes(desde, limite)
+    return jsonify({
+        'alteracoes': alteracoes,
+        'ultimo_seq': ultimo,
+        'mais': mais,
+        'seq_atual': alteracao_controller.seq_atual()
+    })
@@ -1,7 +1,15 @@
 # app/routes/aluno_routes.py
 
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, current_app, request, jsonify
 from app.controllers import aluno_controller
+from app.models.aluno_model import Aluno
+from app.utils.exportacao import quer_ndjson, resposta_ndjson
+from app.utils.busca import ler_termos_busca
+from app.utils.cache_compartilhado import cache_de_resposta
+from app.utils.campos import ler_campos
+from app.utils.etag import com_etag, etag_da_representacao
+from app.utils.existencia import ler_ids
+from app.utils.paginacao import ler_paginacao, resposta_paginada
 
 aluno_bp = Blueprint('aluno_bp', __name__, url_prefix='/alunos')
 
@@ -12,9 +20,35 @@ def get_alunos():
     ---
     tags:
       - Alunos
+    parameters:
+      - in: query
+        name: limit
+        type: integer
+        description: Quantidade de itens por página (o servidor aplica um máximo).
+      - in: query
+        name: after
+        type: integer
+        description: Cursor da página; retorna apenas itens com ID maior que este valor.
+      - in: header
+        name: If-None-Match
+        type: string
+        description: ETag já conhecido pelo cliente.
+      - in: query
+        name: stream
+        type: integer
+        enum: [1]
+        description: Exporta a coleção inteira em NDJSON (equivale a Accept application/x-ndjson).
+      - in: query
+        name: fields
+        type: string
+        description: Campos a retornar, separados por vírgula (ex. id,nome).
     responses:
       200:
         description: Uma lista de todos os alunos
+        headers:
+          Link:
+            type: string
+            description: URL da próxima página (rel="next"), ausente na última página.
         schema:
           type: array
           items:
@@ -39,11 +73,86 @@ def get_alunos():
                 type: integer
               turma_descricao:
                 type: string
+      304:
+        description: A página não mudou desde o ETag informado.
+    """
+    if quer_ndjson():
+        return resposta_ndjson(aluno_controller.exportar_alunos(ler_campos(Aluno)))
+
+    limite, apos = ler_paginacao()
+    campos = ler_campos(Aluno)
+    etag = etag_da_representacao(aluno_controller.etag_alunos(limite, apos), campos)
+    return com_etag(etag, lambda: resposta_paginada(*aluno_controller.get_alunos(limite, apos, campos)))
+
+@aluno_bp.route('/busca', methods=['GET'])
+def buscar_alunos():
+    """
+    Busca os alunos pelo nome
+    ---
+    tags:
+      - Alunos
+    parameters:
+      - in: query
+        name: q
+        type: string
+        required: true
+        description: Palavras ou inícios de palavras do nome, sem diferenciar acentos (ex. "jo sil" encontra "João Silva").
+      - in: query
+        name: limit
+        type: integer
+        description: Quantidade máxima de resultados (o servidor aplica um máximo).
+      - in: query
+        name: fields
+        type: string
+        description: Campos a retornar, separados por vírgula (ex. id,nome).
+    responses:
+      200:
+        description: Alunos encontrados, do mais ao menos relevante
+      400:
+        description: Termo de busca ausente ou parâmetros inválidos
+    """
+    termos = ler_termos_busca()
+    limite, _ = ler_paginacao()
+    return jsonify(aluno_controller.buscar_alunos(termos, limite, ler_campos(Aluno)))
+
+@aluno_bp.route('/exists', methods=['POST'])
+def alunos_existentes():
+    """
+    Verifica quais IDs de alunos existem
+    ---
+    tags:
+      - Alunos
+    parameters:
+      - in: body
+        name: body
+        required: true
+        schema:
+          type: object
+          required:
+            - ids
+          properties:
+            ids:
+              type: array
+              items:
+                type: integer
+    responses:
+      200:
+        description: Subconjunto dos IDs enviados que existem.
+        schema:
+          type: object
+          properties:
+            ids:
+              type: array
+              items:
+                type: integer
+      400:
+        description: Lista de IDs ausente, inválida ou maior que o máximo permitido.
     """
-    alunos = aluno_controller.get_alunos()
-    return jsonify(alunos)
+    ids = ler_ids()
+    return jsonify({'ids': aluno_controller.alunos_existentes(ids)})
 
 @aluno_bp.route('/<int:aluno_id>', methods=['GET'])
+@cache_de_resposta('alunos')
 def get_aluno(aluno_id):
     """
     Busca um aluno por ID
@@ -56,16 +165,27 @@ def get_aluno(aluno_id):
         type: integer
         required: true
         description: ID único do aluno.
+      - in: header
+        name: If-None-Match
+        type: string
+        description: ETag já conhecido pelo cliente.
+      - in: query
+        name: fields
+        type: string
+        description: Campos a retornar, separados por vírgula (ex. id,nome).
     responses:
       200:
         description: Detalhes do aluno.
       404:
         description: Aluno não encontrado.
+      304:
+        description: O recurso não mudou desde o ETag informado.
     """
-    aluno = aluno_controller.get_aluno(aluno_id)
-    if aluno:
-        return jsonify(aluno)
-    return jsonify({'error': 'Aluno não encontrado'}), 404
+    campos = ler_campos(Aluno)
+    etag = aluno_controller.etag_aluno(aluno_id)
+    if not etag:
+        return jsonify({'error': 'Aluno não encontrado'}), 404
+    return com_etag(etag_da_representacao(etag, campos), lambda: jsonify(aluno_controller.get_aluno(aluno_id, campos)))
 
 @aluno_bp.route('/', methods=['POST'])
 def create_aluno():
@@ -120,6 +240,76 @@ def create_aluno():
         return jsonify({'error': 'Turma não encontrada'}), 404
     return jsonify(novo_aluno), 201
 
+@aluno_bp.route('/bulk', methods=['POST'])
+def create_alunos_em_lote():
+    """
+    Cria vários alunos em uma única transação
+    ---
+    tags:
+      - Alunos
+    parameters:
+      - in: body
+        name: body
+        required: true
+        schema:
+          type: array
+          items:
+            type: object
+            required:
+              - nome
+              - turma_id
+            properties:
+              nome:
+                type: string
+              idade:
+                type: integer
+              data_nascimento:
+                type: string
+                format: date
+              nota_primeiro_semestre:
+                type: number
+                format: float
+              nota_segundo_semestre:
+                type: number
+                format: float
+              turma_id:
+                type: integer
+    responses:
+      200:
+        description: Resultado de cada registro, na mesma ordem do envio.
+        schema:
+          type: object
+          properties:
+            criados:
+              type: integer
+            falhas:
+              type: integer
+            resultados:
+              type: array
+              items:
+                type: object
+                properties:
+                  indice:
+                    type: integer
+                  status:
+                    type: integer
+                  aluno:
+                    type: object
+                  error:
+                    type: string
+      400:
+        description: Corpo da requisição não é uma lista ou excede o tamanho máximo do lote.
+    """
+    data = request.get_json()
+    if not isinstance(data, list) or not data:
+        return jsonify({'error': 'Dados insuficientes'}), 400
+    if len(data) > current_app.config['ALUNOS_LOTE_MAXIMO']:
+        return jsonify({'error': 'Lote excede o tamanho máximo permitido'}), 400
+
+    resultados = aluno_controller.create_alunos_em_lote(data)
+    criados = sum(1 for resultado in resultados if resultado['status'] == 201)
+    return jsonify({'criados': criados, 'falhas': len(resultados) - criados, 'resultados': resultados})
+
 @aluno_bp.route('/<int:aluno_id>', methods=['PUT'])
 def update_aluno(aluno_id):
     """
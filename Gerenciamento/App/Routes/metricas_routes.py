@@ -0,0 +1,17 @@
+from flask import Blueprint, jsonify
+from app.utils.cache import metricas_caches
+
+metricas_bp = Blueprint('metricas_bp', __name__, url_prefix='/metricas')
+
+@metricas_bp.route('/', methods=['GET'])
+def get_metricas():
+    """
+    Métricas internas deste worker
+    ---
+    tags:
+      - Métricas
+    responses:
+      200:
+        description: Acertos, falhas e ocupação dos caches de professores e turmas
+    """
+    return jsonify({'caches': metricas_caches()})
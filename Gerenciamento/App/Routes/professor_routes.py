@@ -1,5 +1,12 @@
 from flask import Blueprint, request, jsonify
 from app.controllers import professor_controller
+from app.models.professor_model import Professor
+from app.utils.busca import ler_termos_busca
+from app.utils.cache_compartilhado import cache_de_resposta
+from app.utils.campos import ler_campos
+from app.utils.etag import com_etag, etag_da_representacao
+from app.utils.existencia import ler_ids
+from app.utils.paginacao import ler_paginacao, resposta_paginada
 
 professor_bp = Blueprint('professor_bp', __name__, url_prefix='/professores')
 
@@ -10,9 +17,30 @@ def get_professores():
     ---
     tags:
       - Professores
+    parameters:
+      - in: query
+        name: limit
+        type: integer
+        description: Quantidade de itens por página (o servidor aplica um máximo).
+      - in: query
+        name: after
+        type: integer
+        description: Cursor da página; retorna apenas itens com ID maior que este valor.
+      - in: header
+        name: If-None-Match
+        type: string
+        description: ETag já conhecido pelo cliente.
+      - in: query
+        name: fields
+        type: string
+        description: Campos a retornar, separados por vírgula (ex. id,nome).
     responses:
       200:
         description: Uma lista de professores
+        headers:
+          Link:
+            type: string
+            description: URL da próxima página (rel="next"), ausente na última página.
         schema:
           type: array
           items:
@@ -28,11 +56,83 @@ def get_professores():
                 type: string
               observacoes:
                 type: string
+      304:
+        description: A página não mudou desde o ETag informado.
+    """
+    limite, apos = ler_paginacao()
+    campos = ler_campos(Professor)
+    etag = etag_da_representacao(professor_controller.etag_professores(limite, apos), campos)
+    return com_etag(etag, lambda: resposta_paginada(*professor_controller.get_professores(limite, apos, campos)))
+
+@professor_bp.route('/busca', methods=['GET'])
+def buscar_professores():
+    """
+    Busca os professores pelo nome
+    ---
+    tags:
+      - Professores
+    parameters:
+      - in: query
+        name: q
+        type: string
+        required: true
+        description: Palavras ou inícios de palavras do nome, sem diferenciar acentos (ex. "jo sil" encontra "João Silva").
+      - in: query
+        name: limit
+        type: integer
+        description: Quantidade máxima de resultados (o servidor aplica um máximo).
+      - in: query
+        name: fields
+        type: string
+        description: Campos a retornar, separados por vírgula (ex. id,nome).
+    responses:
+      200:
+        description: Professores encontrados, do mais ao menos relevante
+      400:
+        description: Termo de busca ausente ou parâmetros inválidos
+    """
+    termos = ler_termos_busca()
+    limite, _ = ler_paginacao()
+    return jsonify(professor_controller.buscar_professores(termos, limite, ler_campos(Professor)))
+
+@professor_bp.route('/exists', methods=['POST'])
+def professores_existentes():
+    """
+    Verifica quais IDs de professores existem
+    ---
+    tags:
+      - Professores
+    parameters:
+      - in: body
+        name: body
+        required: true
+        schema:
+          type: object
+          required:
+            - ids
+          properties:
+            ids:
+              type: array
+              items:
+                type: integer
+    responses:
+      200:
+        description: Subconjunto dos IDs enviados que existem.
+        schema:
+          type: object
+          properties:
+            ids:
+              type: array
+              items:
+                type: integer
+      400:
+        description: Lista de IDs ausente, inválida ou maior que o máximo permitido.
     """
-    professores = professor_controller.get_professores()
-    return jsonify(professores)
+    ids = ler_ids()
+    return jsonify({'ids': professor_controller.professores_existentes(ids)})
 
 @professor_bp.route('/<int:professor_id>', methods=['GET'])
+@cache_de_resposta('professores')
 def get_professor(professor_id):
     """
     Busca um professor por ID
@@ -45,16 +145,27 @@ def get_professor(professor_id):
         type: integer
         required: true
         description: ID do professor a ser buscado
+      - in: header
+        name: If-None-Match
+        type: string
+        description: ETag já conhecido pelo cliente.
+      - in: query
+        name: fields
+        type: string
+        description: Campos a retornar, separados por vírgula (ex. id,nome).
     responses:
       200:
         description: Detalhes do professor
       404:
         description: Professor não encontrado
+      304:
+        description: O recurso não mudou desde o ETag informado.
     """
-    professor = professor_controller.get_professor(professor_id)
-    if professor:
-        return jsonify(professor)
-    return jsonify({'error': 'Professor não encontrado'}), 404
+    campos = ler_campos(Professor)
+    etag = professor_controller.etag_professor(professor_id)
+    if not etag:
+        return jsonify({'error': 'Professor não encontrado'}), 404
+    return com_etag(etag_da_representacao(etag, campos), lambda: jsonify(professor_controller.get_professor(professor_id, campos)))
 
 @professor_bp.route('/', methods=['POST'])
 def create_professor():
@@ -2,6 +2,13 @@
 
 from flask import Blueprint, request, jsonify
 from app.controllers import turma_controller
+from app.models.aluno_model import Aluno
+from app.models.turma_model import Turma
+from app.utils.cache_compartilhado import cache_de_resposta
+from app.utils.campos import ler_campos
+from app.utils.etag import com_etag, etag_da_representacao
+from app.utils.existencia import ler_ids
+from app.utils.paginacao import ler_paginacao, resposta_paginada
 
 turma_bp = Blueprint('turma_bp', __name__, url_prefix='/turmas')
 
@@ -12,9 +19,30 @@ def get_turmas():
     ---
     tags:
       - Turmas
+    parameters:
+      - in: query
+        name: limit
+        type: integer
+        description: Quantidade de itens por página (o servidor aplica um máximo).
+      - in: query
+        name: after
+        type: integer
+        description: Cursor da página; retorna apenas itens com ID maior que este valor.
+      - in: header
+        name: If-None-Match
+        type: string
+        description: ETag já conhecido pelo cliente.
+      - in: query
+        name: fields
+        type: string
+        description: Campos a retornar, separados por vírgula (ex. id,nome).
     responses:
       200:
         description: Uma lista de turmas
+        headers:
+          Link:
+            type: string
+            description: URL da próxima página (rel="next"), ausente na última página.
         schema:
           type: array
           items:
@@ -30,11 +58,52 @@ def get_turmas():
                 type: integer
               professor_nome:
                 type: string
+      304:
+        description: A página não mudou desde o ETag informado.
+    """
+    limite, apos = ler_paginacao()
+    campos = ler_campos(Turma)
+    etag = etag_da_representacao(turma_controller.etag_turmas(limite, apos), campos)
+    return com_etag(etag, lambda: resposta_paginada(*turma_controller.get_turmas(limite, apos, campos)))
+
+@turma_bp.route('/exists', methods=['POST'])
+def turmas_existentes():
+    """
+    Verifica quais IDs de turmas existem
+    ---
+    tags:
+      - Turmas
+    parameters:
+      - in: body
+        name: body
+        required: true
+        schema:
+          type: object
+          required:
+            - ids
+          properties:
+            ids:
+              type: array
+              items:
+                type: integer
+    responses:
+      200:
+        description: Subconjunto dos IDs enviados que existem.
+        schema:
+          type: object
+          properties:
+            ids:
+              type: array
+              items:
+                type: integer
+      400:
+        description: Lista de IDs ausente, inválida ou maior que o máximo permitido.
     """
-    turmas = turma_controller.get_turmas()
-    return jsonify(turmas)
+    ids = ler_ids()
+    return jsonify({'ids': turma_controller.turmas_existentes(ids)})
 
 @turma_bp.route('/<int:turma_id>', methods=['GET'])
+@cache_de_resposta('turmas')
 def get_turma(turma_id):
     """
     Busca uma turma por ID
@@ -47,16 +116,93 @@ def get_turma(turma_id):
         type: integer
         required: true
         description: ID da turma a ser buscada
+      - in: header
+        name: If-None-Match
+        type: string
+        description: ETag já conhecido pelo cliente.
+      - in: query
+        name: fields
+        type: string
+        description: Campos a retornar, separados por vírgula (ex. id,nome).
     responses:
       200:
         description: Detalhes da turma
       404:
         description: Turma não encontrada
+      304:
+        description: O recurso não mudou desde o ETag informado.
     """
-    turma = turma_controller.get_turma(turma_id)
-    if turma:
-        return jsonify(turma)
-    return jsonify({'error': 'Turma não encontrada'}), 404
+    campos = ler_campos(Turma)
+    etag = turma_controller.etag_turma(turma_id)
+    if not etag:
+        return jsonify({'error': 'Turma não encontrada'}), 404
+    return com_etag(etag_da_representacao(etag, campos), lambda: jsonify(turma_controller.get_turma(turma_id, campos)))
+
+@turma_bp.route('/<int:turma_id>/alunos', methods=['GET'])
+def get_alunos_da_turma(turma_id):
+    """
+    Lista os alunos de uma turma, com um resumo das médias
+    ---
+    tags:
+      - Turmas
+    parameters:
+      - in: path
+        name: turma_id
+        type: integer
+        required: true
+        description: ID da turma
+      - in: query
+        name: limit
+        type: integer
+        description: Quantidade de alunos por página (o servidor aplica um máximo).
+      - in: query
+        name: after
+        type: integer
+        description: Cursor da página; retorna apenas alunos com ID maior que este valor.
+      - in: query
+        name: fields
+        type: string
+        description: Campos de cada aluno a retornar, separados por vírgula (ex. id,nome).
+    responses:
+      200:
+        description: Alunos da turma e resumo calculado sobre a turma inteira
+        headers:
+          Link:
+            type: string
+            description: URL da próxima página (rel="next"), ausente na última página.
+        schema:
+          type: object
+          properties:
+            turma_id:
+              type: integer
+            resumo:
+              type: object
+              properties:
+                total_alunos:
+                  type: integer
+                alunos_com_media:
+                  type: integer
+                media:
+                  type: number
+                media_minima:
+                  type: number
+                media_maxima:
+                  type: number
+                taxa_aprovacao:
+                  type: number
+                  description: Fração dos alunos com média que atingiram a média de aprovação.
+            alunos:
+              type: array
+              items:
+                type: object
+      404:
+        description: Turma não encontrada
+    """
+    limite, apos = ler_paginacao()
+    turma, proximo = turma_controller.get_alunos_da_turma(turma_id, limite, apos, ler_campos(Aluno))
+    if not turma:
+        return jsonify({'error': 'Turma não encontrada'}), 404
+    return resposta_paginada(turma, proximo)
 
 @turma_bp.route('/', methods=['POST'])
 def create_turma():
@@ -159,4 +305,54 @@ def delete_turma(turma_id):
     sucesso = turma_controller.delete_turma(turma_id)
     if sucesso:
         return jsonify({'message': 'Turma deletada com sucesso'})
-    return jsonify({'error': 'Turma não encontrada'}), 404
\ No newline at end of file
+    return jsonify({'error': 'Turma não encontrada'}), 404
+
+@turma_bp.route('/<int:turma_id>/recalcular-medias', methods=['POST'])
+def recalcular_medias_turma(turma_id):
+    """
+    Recalcula a média final de todos os alunos de uma turma
+    ---
+    tags:
+      - Turmas
+    parameters:
+      - in: path
+        name: turma_id
+        type: integer
+        required: true
+        description: ID da turma
+    responses:
+      200:
+        description: Quantidade de alunos cuja média foi alterada
+        schema:
+          type: object
+          properties:
+            turma_id:
+              type: integer
+            alunos_atualizados:
+              type: integer
+      404:
+        description: Turma não encontrada
+    """
+    atualizados = turma_controller.recalcular_medias(turma_id)
+    if atualizados is None:
+        return jsonify({'error': 'Turma não encontrada'}), 404
+    return jsonify({'turma_id': turma_id, 'alunos_atualizados': atualizados})
+
+@turma_bp.route('/recalcular-medias', methods=['POST'])
+def recalcular_medias():
+    """
+    Recalcula a média final dos alunos de todas as turmas (fechamento do ano)
+    ---
+    tags:
+      - Turmas
+    responses:
+      200:
+        description: Quantidade de alunos cuja média foi alterada
+        schema:
+          type: object
+          properties:
+            alunos_atualizados:
+              type: integer
+    """
+    atualizados = turma_controller.recalcular_medias()
+    return jsonify({'alunos_atualizados': atualizados})
@@ -1,15 +1,26 @@
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
-from flasgger import Swagger
 from config import Config
+from .utils.cache import configurar_caches
+from .utils.documentacao import comando_gerar_apispec, documentacao_bp
+from .utils.serializacao import ProvedorJSON
+from .utils.sqlite import configurar_sqlite
 
 db = SQLAlchemy()
 
 def create_app(config_class=Config):
   app = Flask(__name__)
   app.config.from_object(config_class)
+  app.json = ProvedorJSON(app)
   db.init_app(app)
-  Swagger(app)
+  with app.app_context():
+    configurar_sqlite(db.engine, app.config.get('SQLITE_PRAGMAS'))
+  configurar_caches(app)
+  app.register_blueprint(documentacao_bp)
+  app.cli.add_command(comando_gerar_apispec)
+
+  from .migracoes import comando_migrar
+  app.cli.add_command(comando_migrar)
 
   from .routes.professor_routes import professor_bp
   app.register_blueprint(professor_bp)
@@ -19,5 +30,11 @@ def create_app(config_class=Config):
 
   from .routes.aluno_routes import aluno_bp
   app.register_blueprint(aluno_bp)
+
+  from .routes.alteracao_routes import alteracao_bp
+  app.register_blueprint(alteracao_bp)
+
+  from .routes.metricas_routes import metricas_bp
+  app.register_blueprint(metricas_bp)
   
   return app
\ No newline at end of file
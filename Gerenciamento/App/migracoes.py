@@ -0,0 +1,122 @@
+"""Migrações versionadas do esquema.
+
+A versão aplicada fica em PRAGMA user_version. `flask --app app migrar`
+cria as tabelas que ainda não existem e aplica, em ordem, as migrações
+com número maior que o atual. Cada migração é idempotente, então um banco
+novo (criado já com o esquema atual) passa por elas sem efeito.
+"""
+import click
+from flask.cli import with_appcontext
+from sqlalchemy import MetaData, inspect, text
+from sqlalchemy.schema import CreateTable
+from app import db
+from app.utils.alteracoes import TABELAS_ALTERACOES, ddl_log_alteracoes, sql_carga_inicial
+from app.utils.busca import INDICES_BUSCA, ddl_indice_busca
+
+def _adicionar_coluna(conexao, tabela, coluna, definicao):
+    colunas = {c['name'] for c in inspect(conexao).get_columns(tabela)}
+    if coluna not in colunas:
+        conexao.execute(text(f'ALTER TABLE {tabela} ADD COLUMN {coluna} {definicao}'))
+
+def _criar_indice(conexao, tabela, coluna):
+    conexao.execute(text(f'CREATE INDEX IF NOT EXISTS ix_{tabela}_{coluna} ON {tabela} ({coluna})'))
+
+def _versao_das_linhas(conexao):
+    for tabela in ('professores', 'turmas', 'alunos'):
+        _adicionar_coluna(conexao, tabela, 'versao', "INTEGER NOT NULL DEFAULT '1'")
+
+def _indices_chaves_estrangeiras(conexao):
+    _criar_indice(conexao, 'alunos', 'turma_id')
+    _criar_indice(conexao, 'turmas', 'professor_id')
+
+def _indices_busca(conexao):
+    for tabela, colunas in INDICES_BUSCA.items():
+        for comando in ddl_indice_busca(tabela, colunas):
+            conexao.execute(text(comando))
+        # Indexa as linhas que já existiam antes dos triggers
+        conexao.execute(text(f"INSERT INTO {tabela}_busca ({tabela}_busca) VALUES ('rebuild')"))
+
+def _log_alteracoes(conexao):
+    # A tabela alteracoes já foi criada pelo create_all
+    for tabela, colunas in TABELAS_ALTERACOES.items():
+        for comando in ddl_log_alteracoes(tabela, colunas):
+            conexao.execute(text(comando))
+        conexao.execute(text(sql_carga_inicial(tabela, colunas)))
+
+def _recriar_com_autoincrement(conexao, tabela):
+    """Recria a tabela com INTEGER PRIMARY KEY AUTOINCREMENT (o SQLite não altera a chave de uma tabela existente).
+
+    Os dados e os ids são copiados; índices, busca textual e triggers do log
+    são recriados. O contador do AUTOINCREMENT parte do maior id já visto,
+    inclusive de linhas apagadas registradas no log de alterações.
+    """
+    definicao = conexao.execute(
+        text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = :tabela"), {'tabela': tabela.name}
+    ).scalar()
+    if 'AUTOINCREMENT' in definicao.upper():
+        return
+
+    # Cópia do esquema atual em que só a tabela recriada muda de nome
+    esquema = MetaData()
+    for outra in db.metadata.sorted_tables:
+        outra.to_metadata(esquema)
+    nova = tabela.to_metadata(esquema, name=f'{tabela.name}_nova')
+
+    colunas = ', '.join(coluna.name for coluna in tabela.columns)
+    conexao.execute(CreateTable(nova))
+    conexao.execute(text(f'INSERT INTO {nova.name} ({colunas}) SELECT {colunas} FROM {tabela.name}'))
+    conexao.execute(text(f'DROP TABLE {tabela.name}'))
+    conexao.execute(text(f'ALTER TABLE {nova.name} RENAME TO {tabela.name}'))
+
+    for indice in tabela.indexes:
+        indice.create(conexao, checkfirst=True)
+    if tabela.name in INDICES_BUSCA:
+        for comando in ddl_indice_busca(tabela.name, INDICES_BUSCA[tabela.name]):
+            conexao.execute(text(comando))
+    if tabela.name in TABELAS_ALTERACOES:
+        for comando in ddl_log_alteracoes(tabela.name, TABELAS_ALTERACOES[tabela.name]):
+            conexao.execute(text(comando))
+
+    conexao.execute(text('DELETE FROM sqlite_sequence WHERE name = :tabela'), {'tabela': tabela.name})
+    conexao.execute(
+        text(
+            f'INSERT INTO sqlite_sequence (name, seq) SELECT :tabela, MAX('
+            f' (SELECT COALESCE(MAX(id), 0) FROM {tabela.name}),'
+            f' (SELECT COALESCE(MAX(recurso_id), 0) FROM alteracoes WHERE recurso = :tabela))'
+        ),
+        {'tabela': tabela.name}
+    )
+
+def _ids_sem_reuso(conexao):
+    # As chaves estrangeiras só são conferidas no commit, com as tabelas já recriadas
+    conexao.execute(text('PRAGMA defer_foreign_keys = ON'))
+    for nome in ('professores', 'turmas', 'alunos'):
+        _recriar_com_autoincrement(conexao, db.metadata.tables[nome])
+
+MIGRACOES = [
+    (1, 'Coluna versao (ETags) em professores, turmas e alunos', _versao_das_linhas),
+    (2, 'Índices de alunos.turma_id e turmas.professor_id', _indices_chaves_estrangeiras),
+    (3, 'Busca textual (FTS5) em alunos e professores', _indices_busca),
+    (4, 'Log de alterações (GET /changes) de professores, turmas e alunos', _log_alteracoes),
+    (5, 'AUTOINCREMENT em professores, turmas e alunos (ids não reutilizados nos ETags)', _ids_sem_reuso),
+]
+
+def migrar():
+    """Leva o banco até a última migração e retorna a versão final."""
+    db.create_all()
+    with db.engine.begin() as conexao:
+        atual = conexao.execute(text('PRAGMA user_version')).scalar()
+        for versao, descricao, aplicar in MIGRACOES:
+            if versao > atual:
+                click.echo(f'Aplicando migração {versao}: {descricao}')
+                aplicar(conexao)
+                conexao.execute(text(f'PRAGMA user_version = {versao}'))
+                atual = versao
+    return atual
+
+@click.command('migrar')
+@with_appcontext
+def comando_migrar():
+    """Cria ou atualiza o esquema do banco de dados."""
+    versao = migrar()
+    click.echo(f'Esquema na versão {versao}')
@@ -0,0 +1,25 @@
+from app import db
+
+class Alteracao(db.Model):
+    """Entrada do log de alterações (somente inclusão), escrita por triggers
+    na mesma transação da escrita em professores, turmas e alunos."""
+    __tablename__ = 'alteracoes'
+    # AUTOINCREMENT: um seq nunca é reutilizado, então o cursor dos consumidores só avança
+    __table_args__ = {'sqlite_autoincrement': True}
+
+    seq = db.Column(db.Integer, primary_key=True)
+    recurso = db.Column(db.String(20), nullable=False)
+    recurso_id = db.Column(db.Integer, nullable=False)
+    operacao = db.Column(db.String(10), nullable=False)
+    dados = db.Column(db.JSON)
+    criado_em = db.Column(db.DateTime, nullable=False, server_default=db.func.current_timestamp())
+
+    def to_dict(self):
+        return {
+            'seq': self.seq,
+            'recurso': self.recurso,
+            'id': self.recurso_id,
+            'operacao': self.operacao,
+            'dados': self.dados,
+            'criado_em': self.criado_em.isoformat() if self.criado_em else None
+        }
@@ -1,7 +1,13 @@
 from app import db
+from app.utils.alteracoes import registrar_log_alteracoes
+from app.utils.busca import registrar_indice_busca
+from app.utils.etag import registrar_versao
 
 class Aluno(db.Model):
     __tablename__ = 'alunos'
+    # AUTOINCREMENT: o id de uma linha apagada não é reutilizado, então um ETag antigo
+    # (recurso, id, versao) nunca coincide com o de outro registro
+    __table_args__ = {'sqlite_autoincrement': True}
 
     id = db.Column(db.Integer, primary_key=True)
     nome = db.Column(db.String(100), nullable=False)
@@ -10,19 +16,42 @@ class Aluno(db.Model):
     nota_primeiro_semestre = db.Column(db.Float)
     nota_segundo_semestre = db.Column(db.Float)
     media_final = db.Column(db.Float)
+    # Incrementada a cada UPDATE (registrar_versao, no fim do arquivo); usada para gerar os ETags
+    versao = db.Column(db.Integer, nullable=False, server_default='1')
 
-    turma_id = db.Column(db.Integer, db.ForeignKey('turmas.id'), nullable=False)
+    turma_id = db.Column(db.Integer, db.ForeignKey('turmas.id'), nullable=False, index=True)
     turma = db.relationship('Turma', back_populates='alunos')
 
-    def to_dict(self):
-        return {
-            'id': self.id,
-            'nome': self.nome,
-            'idade': self.idade,
-            'turma_id': self.turma_id,
-            'data_nascimento': str(self.data_nascimento) if self.data_nascimento else None,
-            'nota_primeiro_semestre': self.nota_primeiro_semestre,
-            'nota_segundo_semestre': self.nota_segundo_semestre,
-            'media_final': self.media_final,
-            'turma_descricao': self.turma.descricao if self.turma else None
-        }
\ No newline at end of file
+    @staticmethod
+    def calcular_media(nota_primeiro_semestre, nota_segundo_semestre):
+        """Regra da média final.
+
+        Aceita valores ou as próprias colunas do modelo; com colunas, devolve a
+        expressão SQL usada no recálculo em lote (ver turma_controller.recalcular_medias).
+        """
+        if nota_primeiro_semestre is None or nota_segundo_semestre is None:
+            return None
+        return (nota_primeiro_semestre + nota_segundo_semestre) / 2
+
+    # Campos expostos pela API e como cada um é serializado (?fields= escolhe entre eles)
+    CAMPOS = {
+        'id': lambda aluno: aluno.id,
+        'nome': lambda aluno: aluno.nome,
+        'idade': lambda aluno: aluno.idade,
+        'turma_id': lambda aluno: aluno.turma_id,
+        'data_nascimento': lambda aluno: str(aluno.data_nascimento) if aluno.data_nascimento else None,
+        'nota_primeiro_semestre': lambda aluno: aluno.nota_primeiro_semestre,
+        'nota_segundo_semestre': lambda aluno: aluno.nota_segundo_semestre,
+        'media_final': lambda aluno: aluno.media_final,
+        'turma_descricao': lambda aluno: aluno.turma.descricao if aluno.turma else None
+    }
+
+    # Campos que vêm de outra tabela: (relação, coluna)
+    CAMPOS_RELACIONADOS = {'turma_descricao': ('turma', 'descricao')}
+
+    def to_dict(self, campos=None):
+        return {nome: valor(self) for nome, valor in self.CAMPOS.items() if campos is None or nome in campos}
+
+registrar_indice_busca(Aluno.__table__, 'nome')
+registrar_log_alteracoes(Aluno.__table__, 'nome', 'turma_id')
+registrar_versao(Aluno)
@@ -1,21 +1,36 @@
 from app import db
+from app.utils.alteracoes import registrar_log_alteracoes
+from app.utils.busca import registrar_indice_busca
+from app.utils.etag import registrar_versao
 
 class Professor(db.Model):
   __tablename__ = 'professores'
+  # AUTOINCREMENT: o id de uma linha apagada não é reutilizado, então um ETag antigo
+  # (recurso, id, versao) nunca coincide com o de outro registro
+  __table_args__ = {'sqlite_autoincrement': True}
 
   id = db.Column(db.Integer, primary_key=True)
   nome = db.Column(db.String(100), nullable=False)
   idade = db.Column(db.Integer)
   materia = db.Column(db.String(100))
   observacoes = db.Column(db.Text)
+  # Incrementada a cada UPDATE (registrar_versao, no fim do arquivo); usada para gerar os ETags
+  versao = db.Column(db.Integer, nullable=False, server_default='1')
 
   turmas = db.relationship('Turma', back_populates='professor', lazy=True)
 
-  def to_dict(self):
-    return {
-      'id': self.id,
-      'nome': self.nome,
-      'idade': self.idade,
-      'materia': self.materia,
-      'observacoes': self.observacoes
-    }
\ No newline at end of file
+  # Campos expostos pela API e como cada um é serializado (?fields= escolhe entre eles)
+  CAMPOS = {
+    'id': lambda professor: professor.id,
+    'nome': lambda professor: professor.nome,
+    'idade': lambda professor: professor.idade,
+    'materia': lambda professor: professor.materia,
+    'observacoes': lambda professor: professor.observacoes
+  }
+
+  def to_dict(self, campos=None):
+    return {nome: valor(self) for nome, valor in self.CAMPOS.items() if campos is None or nome in campos}
+
+registrar_indice_busca(Professor.__table__, 'nome')
+registrar_log_alteracoes(Professor.__table__, 'nome')
+registrar_versao(Professor)
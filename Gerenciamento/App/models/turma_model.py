@@ -1,21 +1,37 @@
 from app import db
+from app.utils.alteracoes import registrar_log_alteracoes
+from app.utils.etag import registrar_versao
 
 class Turma(db.Model):
     __tablename__ = 'turmas'
+    # AUTOINCREMENT: o id de uma linha apagada não é reutilizado, então um ETag antigo
+    # (recurso, id, versao) nunca coincide com o de outro registro
+    __table_args__ = {'sqlite_autoincrement': True}
 
     id = db.Column(db.Integer, primary_key=True)
     descricao = db.Column(db.String(100), nullable=False)
     ativo = db.Column(db.Boolean, default=True)
+    # Incrementada a cada UPDATE (registrar_versao, no fim do arquivo); usada para gerar os ETags
+    versao = db.Column(db.Integer, nullable=False, server_default='1')
 
-    professor_id = db.Column(db.Integer, db.ForeignKey('professores.id'), nullable=False)
+    professor_id = db.Column(db.Integer, db.ForeignKey('professores.id'), nullable=False, index=True)
     professor = db.relationship('Professor', back_populates='turmas')
     alunos = db.relationship('Aluno', back_populates='turma', lazy=True, cascade="all, delete-orphan")
 
-    def to_dict(self):
-        return {
-            'id': self.id,
-            'descricao': self.descricao,
-            'ativo': self.ativo,
-            'professor_id': self.professor_id,
-            'professor_nome': self.professor.nome if self.professor else None
-        }
\ No newline at end of file
+    # Campos expostos pela API e como cada um é serializado (?fields= escolhe entre eles)
+    CAMPOS = {
+        'id': lambda turma: turma.id,
+        'descricao': lambda turma: turma.descricao,
+        'ativo': lambda turma: turma.ativo,
+        'professor_id': lambda turma: turma.professor_id,
+        'professor_nome': lambda turma: turma.professor.nome if turma.professor else None
+    }
+
+    # Campos que vêm de outra tabela: (relação, coluna)
+    CAMPOS_RELACIONADOS = {'professor_nome': ('professor', 'nome')}
+
+    def to_dict(self, campos=None):
+        return {nome: valor(self) for nome, valor in self.CAMPOS.items() if campos is None or nome in campos}
+
+registrar_log_alteracoes(Turma.__table__, 'descricao', 'ativo', 'professor_id')
+registrar_versao(Turma)
@@ -0,0 +1,54 @@
+from sqlalchemy import Boolean, DDL, event
+
+# Tabelas acompanhadas pelo log de alterações:
+# nome da tabela -> {coluna copiada em `dados`: se é booleana}
+TABELAS_ALTERACOES = {}
+
+def _valor(linha, coluna, booleana):
+    # O SQLite guarda booleanos como 0/1; no JSON eles saem como true/false
+    if booleana:
+        return f"json(CASE WHEN {linha}.{coluna} IS NULL THEN 'null' WHEN {linha}.{coluna} THEN 'true' ELSE 'false' END)"
+    return f'{linha}.{coluna}'
+
+def _dados(linha, colunas):
+    return 'json_object(' + ', '.join(
+        f"'{coluna}', {_valor(linha, coluna, booleana)}" for coluna, booleana in colunas.items()
+    ) + ')'
+
+def _inserir(tabela, operacao, linha, dados):
+    return (
+        f"INSERT INTO alteracoes (recurso, recurso_id, operacao, dados) "
+        f"VALUES ('{tabela}', {linha}.id, '{operacao}', {dados});"
+    )
+
+def ddl_log_alteracoes(tabela, colunas):
+    """Triggers que registram cada INSERT, UPDATE e DELETE da tabela em `alteracoes`.
+
+    Por serem triggers, valem também para as escritas em lote e em conjunto
+    (bulk insert, UPDATE/DELETE sem carregar as linhas). UPDATEs só são
+    registrados quando mudam alguma das colunas copiadas.
+    """
+    lista = ', '.join(colunas)
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS {tabela}_alteracoes_ai AFTER INSERT ON {tabela} "
+        f"BEGIN {_inserir(tabela, 'create', 'new', _dados('new', colunas))} END",
+        f"CREATE TRIGGER IF NOT EXISTS {tabela}_alteracoes_au AFTER UPDATE OF {lista} ON {tabela} "
+        f"BEGIN {_inserir(tabela, 'update', 'new', _dados('new', colunas))} END",
+        f"CREATE TRIGGER IF NOT EXISTS {tabela}_alteracoes_ad AFTER DELETE ON {tabela} "
+        f"BEGIN {_inserir(tabela, 'delete', 'old', 'NULL')} END",
+    ]
+
+def sql_carga_inicial(tabela, colunas):
+    """Registra como 'create' as linhas que já existiam antes dos triggers."""
+    return (
+        f"INSERT INTO alteracoes (recurso, recurso_id, operacao, dados) "
+        f"SELECT '{tabela}', id, 'create', {_dados(tabela, colunas)} FROM {tabela} "
+        f"WHERE NOT EXISTS (SELECT 1 FROM alteracoes WHERE recurso = '{tabela}') ORDER BY id"
+    )
+
+def registrar_log_alteracoes(tabela, *colunas):
+    """Cria os triggers junto com a tabela (create_all); bancos existentes os recebem pela migração."""
+    colunas = {coluna: isinstance(tabela.c[coluna].type, Boolean) for coluna in colunas}
+    TABELAS_ALTERACOES[tabela.name] = colunas
+    for comando in ddl_log_alteracoes(tabela.name, colunas):
+        event.listen(tabela, 'after_create', DDL(comando))
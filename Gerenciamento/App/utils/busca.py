@@ -0,0 +1,57 @@
+import re
+from flask import abort, jsonify, make_response, request
+from sqlalchemy import DDL, column, event, literal_column, table
+
+# Tabelas com índice de busca textual: nome da tabela -> colunas indexadas
+INDICES_BUSCA = {}
+
+# unicode61 com remove_diacritics: "Jose" encontra "José"; os índices de
+# prefixo deixam rápidas as buscas por início de palavra com 2 ou 3 letras
+_OPCOES_FTS = "tokenize='unicode61 remove_diacritics 2', prefix='2 3'"
+
+def ddl_indice_busca(tabela, colunas):
+    """Comandos que criam a tabela FTS5 (external content) e os triggers que a mantêm em dia."""
+    indice = f'{tabela}_busca'
+    lista = ', '.join(colunas)
+    novos = ', '.join(f'new.{coluna}' for coluna in colunas)
+    antigos = ', '.join(f'old.{coluna}' for coluna in colunas)
+    inserir = f'INSERT INTO {indice} (rowid, {lista}) VALUES (new.id, {novos});'
+    remover = f"INSERT INTO {indice} ({indice}, rowid, {lista}) VALUES ('delete', old.id, {antigos});"
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {indice} USING fts5({lista}, content='{tabela}', content_rowid='id', {_OPCOES_FTS})",
+        f'CREATE TRIGGER IF NOT EXISTS {indice}_ai AFTER INSERT ON {tabela} BEGIN {inserir} END',
+        f'CREATE TRIGGER IF NOT EXISTS {indice}_ad AFTER DELETE ON {tabela} BEGIN {remover} END',
+        f'CREATE TRIGGER IF NOT EXISTS {indice}_au AFTER UPDATE OF {lista} ON {tabela} BEGIN {remover} {inserir} END',
+    ]
+
+def registrar_indice_busca(tabela, *colunas):
+    """Cria o índice de busca junto com a tabela (create_all) e o remove com ela (drop_all).
+
+    Bancos já existentes recebem o índice pela migração correspondente.
+    """
+    INDICES_BUSCA[tabela.name] = colunas
+    for comando in ddl_indice_busca(tabela.name, colunas):
+        event.listen(tabela, 'after_create', DDL(comando))
+    event.listen(tabela, 'before_drop', DDL(f'DROP TABLE IF EXISTS {tabela.name}_busca'))
+
+def ler_termos_busca():
+    """Lê ?q= e monta a expressão MATCH: todas as palavras, cada uma como prefixo.
+
+    Cada palavra vai entre aspas, então a sintaxe do FTS5 (OR, NEAR, *, ...)
+    digitada pelo usuário é tratada como texto comum.
+    """
+    palavras = re.findall(r'\w+', request.args.get('q', ''))
+    if not palavras:
+        abort(make_response(jsonify({'error': 'Informe o termo de busca em q'}), 400))
+    return ' '.join(f'"{palavra}"*' for palavra in palavras)
+
+def buscar(modelo, termos):
+    """Consulta do modelo restrita aos registros que casam com os termos, do mais ao menos relevante (bm25)."""
+    nome = f'{modelo.__tablename__}_busca'
+    indice = table(nome, column('rowid'), column('rank'))
+    return (
+        modelo.query
+        .join(indice, indice.c.rowid == modelo.id)
+        .filter(literal_column(nome).op('MATCH')(termos))
+        .order_by(indice.c.rank)
+    )
@@ -0,0 +1,113 @@
+import threading
+import time
+from collections import OrderedDict
+from app.utils.cache_compartilhado import cache_compartilhado
+
+class CacheTTL:
+    """Cache LRU limitado, com expiração por tempo (TTL) e contadores de uso.
+
+    Funciona como read-through: `obter(chave, carregar)` devolve o valor em
+    cache ou chama `carregar()` e guarda o resultado. Resultados None não são
+    guardados, para que um registro criado depois não fique escondido.
+
+    Cada entrada guarda a geração do recurso no cache compartilhado; quando
+    outro worker registra uma escrita, a geração muda e a entrada deixa de valer.
+    """
+
+    def __init__(self, nome, tamanho_maximo=1024, ttl=60):
+        self.nome = nome
+        self.tamanho_maximo = tamanho_maximo
+        self.ttl = ttl
+        self._itens = OrderedDict()
+        self._lock = threading.Lock()
+        self.acertos = 0
+        self.falhas = 0
+        self.expulsoes = 0
+
+    def configurar(self, tamanho_maximo, ttl):
+        with self._lock:
+            self.tamanho_maximo = tamanho_maximo
+            self.ttl = ttl
+            self._itens.clear()
+
+    def _geracao(self):
+        return cache_compartilhado.geracao(self.nome) if cache_compartilhado.ativo else 0
+
+    def obter(self, chave, carregar):
+        agora = time.monotonic()
+        geracao = self._geracao()
+        with self._lock:
+            item = self._itens.get(chave)
+            if item is not None and item[0] > agora and item[1] == geracao:
+                self._itens.move_to_end(chave)
+                self.acertos += 1
+                return item[2]
+            self.falhas += 1
+
+        valor = carregar()
+        if valor is not None:
+            self.guardar(chave, valor, geracao)
+        return valor
+
+    def guardar(self, chave, valor, geracao=0):
+        with self._lock:
+            self._itens[chave] = (time.monotonic() + self.ttl, geracao, valor)
+            self._itens.move_to_end(chave)
+            while len(self._itens) > self.tamanho_maximo:
+                self._itens.popitem(last=False)
+                self.expulsoes += 1
+
+    def invalidar(self, chave):
+        with self._lock:
+            self._itens.pop(chave, None)
+
+    def limpar(self):
+        with self._lock:
+            self._itens.clear()
+
+    def metricas(self):
+        with self._lock:
+            consultas = self.acertos + self.falhas
+            return {
+                'nome': self.nome,
+                'itens': len(self._itens),
+                'tamanho_maximo': self.tamanho_maximo,
+                'ttl': self.ttl,
+                'acertos': self.acertos,
+                'falhas': self.falhas,
+                'expulsoes': self.expulsoes,
+                'taxa_acerto': self.acertos / consultas if consultas else None
+            }
+
+# Professores e turmas mudam pouco e são lidos em toda validação dos outros serviços
+cache_professores = CacheTTL('professores')
+cache_turmas = CacheTTL('turmas')
+
+# Recursos cujas representações mudam quando o recurso da chave é alterado:
+# a turma traz o nome do professor e o aluno traz a descrição da turma
+DEPENDENCIAS = {
+    'professores': ('professores', 'turmas'),
+    'turmas': ('turmas', 'alunos'),
+    'alunos': ('alunos',),
+}
+
+def configurar_caches(app):
+    for cache in (cache_professores, cache_turmas):
+        cache.configurar(app.config['CACHE_TAMANHO_MAXIMO'], app.config['CACHE_TTL'])
+    cache_compartilhado.configurar(
+        app.config['CACHE_COMPARTILHADO_ARQUIVO'],
+        app.config['CACHE_COMPARTILHADO_TAMANHO_MAXIMO'],
+        DEPENDENCIAS
+    )
+
+def registrar_alteracao(recurso):
+    """Invalida, em todos os workers, os caches afetados por uma escrita já confirmada."""
+    afetados = DEPENDENCIAS[recurso]
+    for cache in (cache_professores, cache_turmas):
+        if cache.nome in afetados:
+            cache.limpar()
+    if cache_compartilhado.ativo:
+        cache_compartilhado.incrementar(*afetados)
+
+def metricas_caches():
+    return [cache_professores.metricas(), cache_turmas.metricas(), cache_compartilhado.metricas()]
@@ -0,0 +1,147 @@
+import os
+import sqlite3
+import threading
+import time
+from functools import wraps
+from flask import current_app, make_response, request
+from app.utils.etag import com_etag
+from app.utils.serializacao import quer_msgpack, variar_por_formato
+
+class CacheCompartilhado:
+    """Cache de respostas compartilhado por todos os workers do host.
+
+    Os dados ficam em um arquivo SQLite local (WAL), junto com um contador de
+    geração por recurso. As escritas nos controllers incrementam a geração, e
+    uma entrada só vale enquanto a geração com que foi gravada for a atual;
+    assim a escrita feita em um worker invalida o cache de todos os outros.
+    """
+
+    def __init__(self):
+        self.arquivo = None
+        self.tamanho_maximo = 0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.acertos = 0
+        self.falhas = 0
+        self.gravacoes = 0
+
+    @property
+    def ativo(self):
+        return self.arquivo is not None
+
+    def configurar(self, arquivo, tamanho_maximo, recursos):
+        self.arquivo = arquivo
+        self.tamanho_maximo = tamanho_maximo
+        # Conexões abertas para o arquivo anterior não podem ser reaproveitadas
+        self._local = threading.local()
+        if not self.ativo:
+            return
+
+        conexao = self._conexao()
+        conexao.execute('CREATE TABLE IF NOT EXISTS geracoes (recurso TEXT PRIMARY KEY, valor INTEGER NOT NULL)')
+        conexao.execute(
+            'CREATE TABLE IF NOT EXISTS respostas ('
+            ' chave TEXT PRIMARY KEY, recurso TEXT NOT NULL, geracao INTEGER NOT NULL,'
+            ' etag TEXT NOT NULL, tipo TEXT NOT NULL, corpo BLOB NOT NULL, criado REAL NOT NULL)'
+        )
+        # O banco pode ter mudado enquanto este worker estava fora (migrações, restauração)
+        self.incrementar(*recursos)
+
+    def _conexao(self):
+        # Uma conexão por thread e por processo: conexões SQLite não sobrevivem ao fork
+        conexao = getattr(self._local, 'conexao', None)
+        if conexao is None or self._local.pid != os.getpid():
+            conexao = sqlite3.connect(self.arquivo, timeout=5, isolation_level=None, check_same_thread=False)
+            conexao.execute('PRAGMA journal_mode=WAL')
+            conexao.execute('PRAGMA synchronous=OFF')
+            self._local.conexao = conexao
+            self._local.pid = os.getpid()
+        return conexao
+
+    def geracao(self, recurso):
+        linha = self._conexao().execute('SELECT valor FROM geracoes WHERE recurso = ?', (recurso,)).fetchone()
+        return linha[0] if linha else 0
+
+    def incrementar(self, *recursos):
+        conexao = self._conexao()
+        for recurso in recursos:
+            conexao.execute(
+                'INSERT INTO geracoes (recurso, valor) VALUES (?, 1) '
+                'ON CONFLICT(recurso) DO UPDATE SET valor = valor + 1',
+                (recurso,)
+            )
+            conexao.execute('DELETE FROM respostas WHERE recurso = ?', (recurso,))
+
+    def obter(self, chave, recurso):
+        linha = self._conexao().execute(
+            'SELECT r.etag, r.tipo, r.corpo FROM respostas r '
+            'JOIN geracoes g ON g.recurso = r.recurso AND g.valor = r.geracao '
+            'WHERE r.chave = ? AND r.recurso = ?',
+            (chave, recurso)
+        ).fetchone()
+        with self._lock:
+            if linha:
+                self.acertos += 1
+            else:
+                self.falhas += 1
+        return linha
+
+    def guardar(self, chave, recurso, geracao, etag, tipo, corpo):
+        conexao = self._conexao()
+        conexao.execute(
+            'INSERT OR REPLACE INTO respostas (chave, recurso, geracao, etag, tipo, corpo, criado) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?)',
+            (chave, recurso, geracao, etag, tipo, corpo, time.time())
+        )
+        with self._lock:
+            self.gravacoes += 1
+            podar = self.gravacoes % 100 == 0
+        if podar:
+            conexao.execute(
+                'DELETE FROM respostas WHERE chave IN ('
+                ' SELECT chave FROM respostas ORDER BY criado DESC LIMIT -1 OFFSET ?)',
+                (self.tamanho_maximo,)
+            )
+
+    def metricas(self):
+        with self._lock:
+            consultas = self.acertos + self.falhas
+            return {
+                'nome': 'respostas (compartilhado)',
+                'arquivo': self.arquivo,
+                'tamanho_maximo': self.tamanho_maximo,
+                'acertos': self.acertos,
+                'falhas': self.falhas,
+                'taxa_acerto': self.acertos / consultas if consultas else None
+            }
+
+cache_compartilhado = CacheCompartilhado()
+
+def cache_de_resposta(recurso):
+    """Serve a rota de detalhe a partir do cache compartilhado entre os workers.
+
+    Só respostas 200 com ETag são guardadas; requisições com parâmetros na
+    query string passam direto para a rota.
+    """
+    def decorador(rota):
+        @wraps(rota)
+        def rota_com_cache(*args, **kwargs):
+            if not cache_compartilhado.ativo or request.args:
+                return rota(*args, **kwargs)
+
+            # A geração é lida antes de montar a resposta: se houver uma escrita
+            # no meio do caminho, a entrada já nasce inválida
+            geracao = cache_compartilhado.geracao(recurso)
+            chave = f"{request.path}|{'msgpack' if quer_msgpack() else 'json'}"
+            entrada = cache_compartilhado.obter(chave, recurso)
+            if entrada:
+                etag, tipo, corpo = entrada
+                return com_etag(etag, lambda: variar_por_formato(current_app.response_class(corpo, mimetype=tipo)))
+
+            resposta = make_response(rota(*args, **kwargs))
+            etag = resposta.get_etag()[0]
+            if resposta.status_code == 200 and etag:
+                cache_compartilhado.guardar(chave, recurso, geracao, etag, resposta.mimetype, resposta.get_data())
+            return resposta
+        return rota_com_cache
+    return decorador
@@ -0,0 +1,36 @@
+from flask import abort, jsonify, make_response, request
+from sqlalchemy.orm import joinedload, load_only
+
+def ler_campos(modelo):
+    """Lê ?fields=a,b da requisição; None (parâmetro ausente) significa todos os campos."""
+    valor = request.args.get('fields')
+    if valor is None:
+        return None
+
+    campos = {campo.strip() for campo in valor.split(',') if campo.strip()}
+    desconhecidos = campos - modelo.CAMPOS.keys()
+    if not campos or desconhecidos:
+        mensagem = 'Campos inválidos: ' + ', '.join(sorted(desconhecidos)) if desconhecidos else 'Nenhum campo informado'
+        abort(make_response(jsonify({'error': mensagem}), 400))
+    return campos
+
+def aplicar_campos(query, modelo, campos=None):
+    """Seleciona só as colunas pedidas e só faz o JOIN das relações cujos campos foram pedidos."""
+    relacionados = getattr(modelo, 'CAMPOS_RELACIONADOS', {})
+    opcoes = []
+    if campos is not None:
+        colunas = [getattr(modelo, campo) for campo in campos if campo not in relacionados]
+        opcoes.append(load_only(modelo.id, *colunas))
+
+    for campo, (relacao, coluna) in relacionados.items():
+        if campos is None or campo in campos:
+            atributo = getattr(modelo, relacao)
+            opcoes.append(joinedload(atributo).load_only(getattr(atributo.property.mapper.class_, coluna)))
+
+    return query.options(*opcoes)
+
+def filtrar_campos(dados, campos=None):
+    """Recorta um dicionário já serializado (ex.: vindo do cache) aos campos pedidos."""
+    if campos is None:
+        return dados
+    return {nome: valor for nome, valor in dados.items() if nome in campos}
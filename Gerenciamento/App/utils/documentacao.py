@@ -0,0 +1,73 @@
+"""Documentação OpenAPI sem custo na inicialização.
+
+A especificação é extraída das docstrings das rotas uma vez, no build da
+imagem (`flask --app app gerar-apispec`), e servida da memória em
+/apispec_1.json. O Flasgger (e suas dependências) só é importado quando
+alguém abre /apidocs/ ou quando o arquivo ainda não foi gerado.
+"""
+import json
+import threading
+import click
+from flask import Blueprint, Flask, Response, current_app, request
+from flask.cli import with_appcontext
+
+documentacao_bp = Blueprint('documentacao_bp', __name__)
+
+_lock = threading.Lock()
+_spec = None
+_app_interface = None
+
+def gerar_spec(app):
+    """Monta a especificação a partir das docstrings das rotas, como o Flasgger faria em tempo de execução."""
+    from flasgger import Swagger
+
+    swagger = Swagger()
+    swagger.app = app
+    with app.test_request_context():
+        return swagger.get_apispecs()
+
+def _carregar_spec():
+    global _spec
+    with _lock:
+        if _spec is None:
+            try:
+                with open(current_app.config['APISPEC_ARQUIVO'], 'rb') as arquivo:
+                    _spec = arquivo.read()
+            except FileNotFoundError:
+                # Ambiente de desenvolvimento, sem o passo do build
+                _spec = json.dumps(gerar_spec(current_app._get_current_object())).encode()
+        return _spec
+
+def _interface():
+    """App Flask mínimo com a interface do Flasgger, criado no primeiro acesso."""
+    global _app_interface
+    with _lock:
+        if _app_interface is None:
+            from flasgger import Swagger
+
+            app_interface = Flask(__name__)
+            Swagger(app_interface, template=json.loads(_spec))
+            _app_interface = app_interface
+        return _app_interface
+
+@documentacao_bp.route('/apispec_1.json')
+def get_apispec():
+    return Response(_carregar_spec(), mimetype='application/json')
+
+@documentacao_bp.route('/apidocs/')
+@documentacao_bp.route('/apidocs/index.html')
+@documentacao_bp.route('/oauth2-redirect.html')
+@documentacao_bp.route('/flasgger_static/<path:arquivo>')
+def get_interface(arquivo=None):
+    _carregar_spec()
+    return Response.from_app(_interface().wsgi_app, request.environ)
+
+@click.command('gerar-apispec')
+@with_appcontext
+def comando_gerar_apispec():
+    """Gera o arquivo da especificação OpenAPI (passo do build)."""
+    arquivo = current_app.config['APISPEC_ARQUIVO']
+    spec = gerar_spec(current_app._get_current_object())
+    with open(arquivo, 'w', encoding='utf-8') as saida:
+        json.dump(spec, saida, ensure_ascii=False)
+    click.echo(f'Especificação gravada em {arquivo} ({len(spec["paths"])} caminhos)')
@@ -0,0 +1,48 @@
+import hashlib
+from flask import make_response, request
+from sqlalchemy import event
+from sqlalchemy.orm import object_session
+from app.utils.paginacao import paginar
+from app.utils.serializacao import MSGPACK, quer_msgpack
+
+def gerar_etag(*partes):
+    """ETag forte derivado das versões das linhas que compõem a representação."""
+    return hashlib.sha1(repr(partes).encode()).hexdigest()
+
+def registrar_versao(modelo):
+    """Incrementa `versao` em cada UPDATE do modelo feito pelo ORM.
+
+    O incremento vai no próprio UPDATE (versao = versao + 1), sem comparar com a
+    versão lida: escritas concorrentes continuam valendo a última, sem conflito.
+    """
+    @event.listens_for(modelo, 'before_update')
+    def incrementar_versao(_mapper, _conexao, alvo):
+        # before_update também é chamado para objetos só com coleções alteradas
+        if object_session(alvo).is_modified(alvo, include_collections=False):
+            alvo.versao = modelo.versao + 1
+
+def etag_pagina(recurso, query, coluna_id, limite, apos=None):
+    """ETag de uma página da lista, calculado só com (id, versões), sem serializar as linhas."""
+    linhas, proximo = paginar(query, coluna_id, limite, apos)
+    return gerar_etag(recurso, [tuple(linha) for linha in linhas], proximo)
+
+def com_etag(etag, montar_resposta):
+    """Responde 304 se o cliente já tem esta versão; caso contrário monta a resposta.
+
+    `montar_resposta` só é chamado quando o corpo precisa ser enviado.
+    """
+    if request.if_none_match.contains_weak(etag):
+        resposta = make_response('', 304)
+    else:
+        resposta = make_response(montar_resposta())
+    resposta.set_etag(etag)
+    return resposta
+
+def etag_da_representacao(etag, campos=None):
+    """ETag da representação pedida: campos parciais (?fields=) e MessagePack geram ETags
+    diferentes do da representação completa em JSON."""
+    if campos:
+        etag = gerar_etag(etag, sorted(campos))
+    if quer_msgpack():
+        etag = gerar_etag(etag, MSGPACK)
+    return etag
@@ -0,0 +1,24 @@
+from flask import abort, current_app, jsonify, make_response, request
+from app import db
+
+def ler_ids():
+    """Lê a lista de IDs do corpo ({"ids": [...]}), validando tipo e tamanho."""
+    data = request.get_json(silent=True)
+    ids = data.get('ids') if isinstance(data, dict) else None
+
+    if not isinstance(ids, list) or not all(isinstance(i, int) and not isinstance(i, bool) for i in ids):
+        abort(make_response(jsonify({'error': 'Dados insuficientes (lista de IDs inteiros)'}), 400))
+    if len(ids) > current_app.config['EXISTENCIA_IDS_MAXIMO']:
+        abort(make_response(jsonify({'error': 'Quantidade de IDs excede o máximo permitido'}), 400))
+
+    return ids
+
+def ids_existentes(coluna_id, ids):
+    """Retorna, em ordem, os IDs que existem na tabela.
+
+    Consulta apenas a chave primária, sem carregar objetos do ORM.
+    """
+    if not ids:
+        return []
+    consulta = db.select(coluna_id).where(coluna_id.in_(set(ids))).order_by(coluna_id)
+    return db.session.execute(consulta).scalars().all()
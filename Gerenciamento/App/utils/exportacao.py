@@ -0,0 +1,21 @@
+from flask import Response, current_app, request, stream_with_context
+
+NDJSON = 'application/x-ndjson'
+
+def quer_ndjson():
+    """Indica se o cliente pediu a exportação em NDJSON (Accept ou ?stream=1)."""
+    if request.args.get('stream') == '1':
+        return True
+    return request.accept_mimetypes.best_match(['application/json', NDJSON]) == NDJSON
+
+def em_lotes(query, coluna_id):
+    """Percorre a consulta em lotes (yield_per), sem materializar a tabela inteira."""
+    return query.order_by(coluna_id).yield_per(current_app.config['EXPORTACAO_TAMANHO_LOTE'])
+
+def resposta_ndjson(registros):
+    """Transmite os registros um por linha, à medida que são lidos do banco."""
+    def gerar():
+        for registro in registros:
+            yield current_app.json.dumps(registro) + '\n'
+
+    return Response(stream_with_context(gerar()), mimetype=NDJSON)
@@ -0,0 +1,59 @@
+from flask import has_request_context, request
+from flask.json.provider import DefaultJSONProvider
+
+# Dependências opcionais: sem elas o serviço continua respondendo JSON com o módulo json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+MSGPACK = 'application/msgpack'
+
+def quer_msgpack():
+    """Indica se o cliente prefere MessagePack a JSON (Accept), quando há suporte."""
+    if msgpack is None or not has_request_context():
+        return False
+    return request.accept_mimetypes.best_match(['application/json', MSGPACK]) == MSGPACK
+
+def variar_por_formato(resposta):
+    """Avisa os caches HTTP de que o corpo depende do Accept."""
+    if msgpack is not None:
+        resposta.vary.add('Accept')
+    return resposta
+
+class ProvedorJSON(DefaultJSONProvider):
+    """Serialização de todas as respostas do serviço (jsonify e dicts retornados pelas rotas).
+
+    Usa orjson para JSON e responde em MessagePack quando o Accept pede
+    application/msgpack. Datas continuam no formato do Flask (RFC 822) em
+    qualquer formato, porque todas passam pelo mesmo `default`.
+    """
+
+    def dumps(self, obj, **kwargs):
+        if orjson is None or kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_PASSTHROUGH_DATETIME).decode()
+
+    def loads(self, s, **kwargs):
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        if quer_msgpack():
+            obj = self._prepare_response_obj(args, kwargs)
+            resposta = self._app.response_class(msgpack.packb(obj, default=self.default), mimetype=MSGPACK)
+        elif orjson is not None and not self._app.debug:
+            obj = self._prepare_response_obj(args, kwargs)
+            resposta = self._app.response_class(
+                orjson.dumps(obj, default=self.default, option=orjson.OPT_PASSTHROUGH_DATETIME),
+                mimetype=self.mimetype
+            )
+        else:
+            resposta = super().response(*args, **kwargs)
+        return variar_por_formato(resposta)
@@ -1,6 +1,48 @@
 import os
+import tempfile
 
 class Config:               
     SQLALCHEMY_DATABASE_URI = 'sqlite:///database.db'
     SQLALCHEMY_TRACK_MODIFICATIONS = False
-    SECRET_KEY = os.urandom(24)
\ No newline at end of file
+    SECRET_KEY = os.urandom(24)
+
+    # Perfil de produção do SQLite, aplicado a cada conexão (ver app/utils/sqlite.py).
+    # WAL permite leituras durante uma escrita; busy_timeout faz o worker esperar
+    # pelo lock em vez de falhar com "database is locked".
+    SQLITE_PRAGMAS = {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'busy_timeout': 5000,
+        'cache_size': -20000,
+        'mmap_size': 268435456,
+    }
+
+    # Paginação das listas (?limit=&after=)
+    PAGINACAO_LIMITE_PADRAO = 100
+    PAGINACAO_LIMITE_MAXIMO = 1000
+
+    # Exportação em NDJSON: registros lidos do banco por lote
+    EXPORTACAO_TAMANHO_LOTE = 1000
+
+    # Quantidade máxima de alunos por requisição em POST /alunos/bulk
+    ALUNOS_LOTE_MAXIMO = 1000
+
+    # Quantidade máxima de IDs por consulta em POST /<recurso>/exists
+    EXISTENCIA_IDS_MAXIMO = 1000
+
+    # Média final mínima para aprovação (resumo de GET /turmas/<id>/alunos)
+    MEDIA_APROVACAO = 6.0
+
+    # Cache em memória de professores e turmas (por worker)
+    CACHE_TAMANHO_MAXIMO = 1024
+    CACHE_TTL = 60
+
+    # Cache de respostas compartilhado pelos workers do mesmo host (arquivo SQLite local).
+    # None desativa o cache compartilhado.
+    CACHE_COMPARTILHADO_ARQUIVO = os.environ.get(
+        'CACHE_COMPARTILHADO_ARQUIVO', os.path.join(tempfile.gettempdir(), 'gerenciamento-cache.db')
+    )
+    CACHE_COMPARTILHADO_TAMANHO_MAXIMO = 10000
+
+    # Especificação OpenAPI gerada no build (flask --app app gerar-apispec) e servida da memória
+    APISPEC_ARQUIVO = os.environ.get('APISPEC_ARQUIVO', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'apispec.json'))
@@ -0,0 +1,41 @@
+import pytest
+from sqlalchemy import event
+from config import Config
+from app import create_app, db
+
+@pytest.fixture
+def app(tmp_path):
+    class ConfigTeste(Config):
+        TESTING = True
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'teste.db'}"
+        # Sem cache compartilhado: cada teste enxerga só o próprio banco
+        CACHE_COMPARTILHADO_ARQUIVO = None
+
+    app = create_app(ConfigTeste)
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.engine.dispose()
+
+@pytest.fixture
+def cliente(app):
+    return app.test_client()
+
+@pytest.fixture
+def contar_consultas(app):
+    """Retorna uma função que faz a requisição e devolve (resposta, quantidade de SELECTs/escritas executados)."""
+    consultas = []
+
+    def registrar(_conexao, _cursor, sql, *_):
+        consultas.append(sql)
+
+    event.listen(db.engine, 'before_cursor_execute', registrar)
+
+    def contar(cliente, url, **kwargs):
+        consultas.clear()
+        resposta = cliente.get(url, **kwargs)
+        return resposta, len(consultas)
+
+    yield contar
+    event.remove(db.engine, 'before_cursor_execute', registrar)
@@ -0,0 +1,36 @@
+"""GET /changes?since=<seq>&limit=: log de alterações lido por quem mantém uma cópia local."""
+import pytest
+from app import db
+from app.models.professor_model import Professor
+
+@pytest.fixture
+def professores(app):
+    for indice in range(3):
+        db.session.add(Professor(nome=f'Professor {indice}'))
+    db.session.commit()
+    professor = Professor.query.first()
+    professor.nome = 'Renomeado'
+    db.session.commit()
+
+@pytest.mark.parametrize('url', ['/changes?since=0', '/changes/?since=0'])
+def test_changes_responde_sem_redirecionar(cliente, professores, url):
+    resposta = cliente.get(url)
+
+    assert resposta.status_code == 200
+    corpo = resposta.get_json()
+    assert [(a['recurso'], a['operacao']) for a in corpo['alteracoes']] == [('professores', 'create')] * 3 + [('professores', 'update')]
+    assert corpo['ultimo_seq'] == corpo['seq_atual'] == 4
+    assert corpo['mais'] is False
+
+def test_changes_pagina_com_since_e_limit(cliente, professores):
+    primeira = cliente.get('/changes?since=0&limit=3').get_json()
+    segunda = cliente.get(f"/changes?since={primeira['ultimo_seq']}&limit=3").get_json()
+
+    assert [a['seq'] for a in primeira['alteracoes']] == [1, 2, 3]
+    assert primeira['mais'] is True
+    assert [a['seq'] for a in segunda['alteracoes']] == [4]
+    assert segunda['alteracoes'][0]['dados']['nome'] == 'Renomeado'
+    assert segunda['mais'] is False
+
+def test_changes_since_invalido(cliente):
+    assert cliente.get('/changes?since=-1').status_code == 400
@@ -0,0 +1,51 @@
+"""POST /alunos/bulk: um registro inválido não derruba o lote."""
+import pytest
+from app import db
+from app.models.aluno_model import Aluno
+from app.models.professor_model import Professor
+from app.models.turma_model import Turma
+
+@pytest.fixture
+def turma_id(app):
+    turma = Turma(descricao='Turma', professor=Professor(nome='Professor'))
+    db.session.add(turma)
+    db.session.commit()
+    return turma.id
+
+def enviar(cliente, registros):
+    resposta = cliente.post('/alunos/bulk', json=registros)
+    assert resposta.status_code == 200
+    return resposta.get_json()
+
+@pytest.mark.parametrize('invalido, erro', [
+    ({'nome': None}, 'Nome inválido'),
+    ({'nome': '  '}, 'Nome inválido'),
+    ({'nome': 7}, 'Nome inválido'),
+    ({'nota_primeiro_semestre': 'a'}, 'Nota inválida'),
+    ({'nota_segundo_semestre': True}, 'Nota inválida'),
+    ({'idade': '15'}, 'Idade inválida'),
+    ({'idade': 15.5}, 'Idade inválida'),
+    ({'turma_id': True}, 'ID da turma inválido'),
+    ({'turma_id': 'um'}, 'ID da turma inválido'),
+    ({'data_nascimento': '2005-13-40'}, 'Data de nascimento inválida'),
+])
+def test_registro_invalido_nao_impede_os_demais(cliente, turma_id, invalido, erro):
+    registros = [
+        {'nome': 'Primeiro', 'turma_id': turma_id, 'nota_primeiro_semestre': 8, 'nota_segundo_semestre': 7.0},
+        {'nome': 'Inválido', 'turma_id': turma_id, **invalido},
+        {'nome': 'Terceiro', 'turma_id': turma_id, 'idade': 15},
+    ]
+    corpo = enviar(cliente, registros)
+
+    assert (corpo['criados'], corpo['falhas']) == (2, 1)
+    assert [r['status'] for r in corpo['resultados']] == [201, 400, 201]
+    assert corpo['resultados'][1]['error'] == erro
+    assert corpo['resultados'][0]['aluno']['media_final'] == 7.5
+    assert sorted(aluno.nome for aluno in Aluno.query) == ['Primeiro', 'Terceiro']
+
+def test_turma_id_em_texto_como_no_post_individual(cliente, turma_id):
+    corpo = enviar(cliente, [{'nome': 'Texto', 'turma_id': str(turma_id)}, {'nome': 'Sem turma', 'turma_id': turma_id + 1}])
+
+    assert [r['status'] for r in corpo['resultados']] == [201, 404]
+    assert corpo['resultados'][0]['aluno']['turma_id'] == turma_id
+    assert cliente.post('/alunos/', json={'nome': 'Individual', 'turma_id': str(turma_id)}).status_code == 201
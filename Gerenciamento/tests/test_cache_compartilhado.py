@@ -0,0 +1,159 @@
+"""Cache de respostas compartilhado (app/utils/cache_compartilhado.py): uma escrita em um
+worker invalida o que os outros guardaram."""
+import multiprocessing
+import sqlite3
+import pytest
+from config import Config
+from app import create_app, db
+from app.controllers import aluno_controller
+from app.models.aluno_model import Aluno
+from app.models.professor_model import Professor
+from app.models.turma_model import Turma
+from app.utils.cache_compartilhado import cache_compartilhado
+
+FORMATOS = {'json': 'application/json', 'msgpack': 'application/msgpack'}
+
+def configuracao(diretorio, tamanho_maximo=10000):
+    class ConfigTeste(Config):
+        TESTING = True
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{diretorio / 'teste.db'}"
+        CACHE_COMPARTILHADO_ARQUIVO = str(diretorio / 'cache.db')
+        CACHE_COMPARTILHADO_TAMANHO_MAXIMO = tamanho_maximo
+    return ConfigTeste
+
+def executar_worker(diretorio, conexao):
+    """Outro worker: processo próprio, com o mesmo banco e o mesmo arquivo de cache.
+
+    Executa as requisições recebidas pela conexão e devolve o status de cada uma.
+    """
+    app = create_app(configuracao(diretorio))
+    cliente = app.test_client()
+    conexao.send('pronto')
+    for metodo, url, corpo in iter(conexao.recv, None):
+        conexao.send(cliente.open(url, method=metodo, json=corpo).status_code)
+
+@pytest.fixture
+def app(tmp_path):
+    app = create_app(configuracao(tmp_path, tamanho_maximo=5))
+    with app.app_context():
+        db.create_all()
+        turma = Turma(descricao='Turma A', professor=Professor(nome='Professor'))
+        db.session.add(Aluno(nome='Aluno', turma=turma))
+        db.session.commit()
+    # Sem contexto ativo entre as requisições: cada uma tem a sua sessão, como em um worker
+    yield app
+    with app.app_context():
+        db.engine.dispose()
+    cache_compartilhado.configurar(None, 0, ())
+
+@pytest.fixture
+def outro_worker(app, tmp_path):
+    # spawn: um interpretador novo, como outro worker do gunicorn, sem herdar conexões
+    contexto = multiprocessing.get_context('spawn')
+    conexao, conexao_worker = contexto.Pipe()
+    processo = contexto.Process(target=executar_worker, args=(tmp_path, conexao_worker))
+    processo.start()
+    assert conexao.poll(30) and conexao.recv() == 'pronto'
+
+    def requisitar(metodo, url, corpo=None):
+        conexao.send((metodo, url, corpo))
+        return conexao.recv()
+
+    yield requisitar
+    conexao.send(None)
+    processo.join(10)
+
+def decodificar(resposta, formato):
+    if formato == 'msgpack':
+        return pytest.importorskip('msgpack').unpackb(resposta.get_data())
+    return resposta.get_json()
+
+def ler_do_cache(cliente, url, formato):
+    """Lê a URL duas vezes e confirma que a segunda resposta veio do cache compartilhado."""
+    primeira = cliente.get(url, headers={'Accept': FORMATOS[formato]})
+    acertos = cache_compartilhado.acertos
+    segunda = cliente.get(url, headers={'Accept': FORMATOS[formato]})
+
+    assert cache_compartilhado.acertos == acertos + 1
+    assert segunda.status_code == 200
+    assert segunda.mimetype == FORMATOS[formato]
+    assert segunda.get_data() == primeira.get_data()
+    assert segunda.get_etag() == primeira.get_etag()
+    return segunda
+
+@pytest.fixture(params=list(FORMATOS))
+def formato(request):
+    if request.param == 'msgpack':
+        pytest.importorskip('msgpack')
+    return request.param
+
+def test_entrada_do_cache_responde_304(app, formato):
+    cliente = app.test_client()
+    resposta = ler_do_cache(cliente, '/alunos/1', formato)
+
+    revalidada = cliente.get('/alunos/1', headers={'Accept': FORMATOS[formato], 'If-None-Match': resposta.headers['ETag']})
+    assert revalidada.status_code == 304
+    assert revalidada.get_etag() == resposta.get_etag()
+
+def test_json_e_msgpack_tem_entradas_separadas(app):
+    pytest.importorskip('msgpack')
+    cliente = app.test_client()
+    em_json = ler_do_cache(cliente, '/alunos/1', 'json')
+    em_msgpack = ler_do_cache(cliente, '/alunos/1', 'msgpack')
+
+    assert decodificar(em_msgpack, 'msgpack') == decodificar(em_json, 'json')
+    assert em_msgpack.get_etag() != em_json.get_etag()
+    assert 'Accept' in em_msgpack.vary
+
+def test_escrita_em_outro_worker_invalida_o_aluno(app, outro_worker, formato):
+    cliente = app.test_client()
+    antes = ler_do_cache(cliente, '/alunos/1', formato)
+
+    assert outro_worker('PUT', '/alunos/1', {'nome': 'Renomeado'}) == 200
+
+    depois = cliente.get('/alunos/1', headers={'Accept': FORMATOS[formato], 'If-None-Match': antes.headers['ETag']})
+    assert depois.status_code == 200
+    assert decodificar(depois, formato)['nome'] == 'Renomeado'
+    assert depois.get_etag() != antes.get_etag()
+
+def test_turma_alterada_em_outro_worker_muda_o_aluno(app, outro_worker, formato):
+    cliente = app.test_client()
+    antes = ler_do_cache(cliente, '/alunos/1', formato)
+    assert decodificar(antes, formato)['turma_descricao'] == 'Turma A'
+
+    assert outro_worker('PUT', '/turmas/1', {'descricao': 'Turma B'}) == 200
+
+    depois = cliente.get('/alunos/1', headers={'Accept': FORMATOS[formato]})
+    assert decodificar(depois, formato)['turma_descricao'] == 'Turma B'
+    assert depois.get_etag() != antes.get_etag()
+
+def test_escrita_durante_a_montagem_nao_deixa_entrada_valida(app, outro_worker, monkeypatch):
+    """A geração é lida antes de montar a resposta: uma escrita no meio do caminho invalida o que for guardado."""
+    get_aluno = aluno_controller.get_aluno
+
+    def get_aluno_com_escrita_no_meio(aluno_id, campos=None):
+        dados = get_aluno(aluno_id, campos)
+        assert outro_worker('PUT', f'/alunos/{aluno_id}', {'nome': 'Renomeado'}) == 200
+        return dados
+
+    monkeypatch.setattr(aluno_controller, 'get_aluno', get_aluno_com_escrita_no_meio)
+    cliente = app.test_client()
+    assert cliente.get('/alunos/1').get_json()['nome'] == 'Aluno'
+    monkeypatch.setattr(aluno_controller, 'get_aluno', get_aluno)
+
+    assert cliente.get('/alunos/1').get_json()['nome'] == 'Renomeado'
+
+def test_poda_mantem_as_entradas_mais_recentes(app, monkeypatch):
+    # A poda roda a cada 100 gravações e mantém CACHE_COMPARTILHADO_TAMANHO_MAXIMO (5) entradas
+    monkeypatch.setattr(cache_compartilhado, 'gravacoes', 0)
+    with app.app_context():
+        db.session.add_all(Professor(nome=f'Professor {indice}') for indice in range(100))
+        db.session.commit()
+
+    cliente = app.test_client()
+    for professor_id in range(2, 102):
+        assert cliente.get(f'/professores/{professor_id}').status_code == 200
+
+    with sqlite3.connect(cache_compartilhado.arquivo) as conexao:
+        chaves = [chave for (chave,) in conexao.execute('SELECT chave FROM respostas ORDER BY chave')]
+    assert chaves == sorted(f'/professores/{professor_id}|json' for professor_id in range(97, 102))
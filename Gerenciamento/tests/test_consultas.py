@@ -0,0 +1,63 @@
+"""Quantidade de consultas por requisição: não pode crescer com o número de linhas (N+1)."""
+import pytest
+from app import db
+from app.models.aluno_model import Aluno
+from app.models.professor_model import Professor
+from app.models.turma_model import Turma
+from app.utils.cache import cache_professores, cache_turmas
+
+def criar_dados(quantidade):
+    """Cria `quantidade` professores, cada um com uma turma e um aluno; retorna o último de cada."""
+    for indice in range(quantidade):
+        professor = Professor(nome=f'Professor {indice}')
+        turma = Turma(descricao=f'Turma {indice}', professor=professor)
+        aluno = Aluno(nome=f'Aluno {indice}', turma=turma)
+        db.session.add_all([professor, turma, aluno])
+    db.session.commit()
+    # Os caches por worker guardariam o resultado da primeira medição
+    cache_professores.limpar()
+    cache_turmas.limpar()
+    return professor.id, turma.id, aluno.id
+
+def medir(cliente, contar_consultas, url):
+    resposta, consultas = contar_consultas(cliente, url)
+    assert resposta.status_code == 200
+    return consultas
+
+@pytest.mark.parametrize('recurso', ['alunos', 'turmas', 'professores'])
+def test_lista_nao_cresce_com_as_linhas(cliente, contar_consultas, recurso):
+    criar_dados(5)
+    com_poucas = medir(cliente, contar_consultas, f'/{recurso}/')
+    criar_dados(55)
+    com_muitas = medir(cliente, contar_consultas, f'/{recurso}/')
+
+    assert len(cliente.get(f'/{recurso}/').get_json()) == 60
+    assert com_muitas == com_poucas
+
+@pytest.mark.parametrize('recurso, posicao', [('alunos', 2), ('turmas', 1), ('professores', 0)])
+def test_detalhe_nao_cresce_com_as_linhas(cliente, contar_consultas, recurso, posicao):
+    recurso_id = criar_dados(5)[posicao]
+    com_poucas = medir(cliente, contar_consultas, f'/{recurso}/{recurso_id}')
+    recurso_id = criar_dados(55)[posicao]
+    com_muitas = medir(cliente, contar_consultas, f'/{recurso}/{recurso_id}')
+
+    assert com_muitas == com_poucas
+
+def test_lista_com_relacionado_usa_uma_consulta_por_pagina(cliente, contar_consultas):
+    criar_dados(60)
+    # ETag da página + página com o JOIN da turma
+    assert medir(cliente, contar_consultas, '/alunos/?fields=nome,turma_descricao') == 2
+
+@pytest.mark.parametrize('campos', [None, 'turma_descricao', 'nome,turma_descricao'])
+def test_alunos_da_turma_nao_cresce_com_a_pagina(cliente, contar_consultas, campos):
+    turma = Turma(descricao='Turma', professor=Professor(nome='Professor'))
+    db.session.add(turma)
+    db.session.add_all(Aluno(nome=f'Aluno {indice}', turma=turma) for indice in range(20))
+    db.session.commit()
+    turma_id = turma.id
+    db.session.expunge_all()
+
+    filtro = f'&fields={campos}' if campos else ''
+    pequena = medir(cliente, contar_consultas, f'/turmas/{turma_id}/alunos?limit=3{filtro}')
+    grande = medir(cliente, contar_consultas, f'/turmas/{turma_id}/alunos?limit=20{filtro}')
+    assert grande == pequena
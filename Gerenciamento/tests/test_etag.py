@@ -0,0 +1,51 @@
+"""ETags das rotas de detalhe: 304 só quando a representação é a mesma."""
+from app.utils.cache import cache_professores, cache_turmas
+
+def criar_turma(cliente):
+    professor = cliente.post('/professores/', json={'nome': 'Professor'}).get_json()
+    return cliente.post('/turmas/', json={'descricao': 'Turma', 'professor_id': professor['id'], 'ativo': True}).get_json()
+
+def test_etag_de_registro_apagado_nao_vale_para_o_novo_com_mesmo_id(cliente):
+    turma = criar_turma(cliente)
+    antigo = cliente.post('/alunos/', json={'nome': 'Ana', 'turma_id': turma['id']}).get_json()
+    etag = cliente.get(f"/alunos/{antigo['id']}").headers['ETag']
+    assert cliente.delete(f"/alunos/{antigo['id']}").status_code == 200
+
+    novo = cliente.post('/alunos/', json={'nome': 'Bruno', 'turma_id': turma['id']}).get_json()
+    assert novo['id'] != antigo['id']
+    resposta = cliente.get(f"/alunos/{novo['id']}", headers={'If-None-Match': etag})
+    assert resposta.status_code == 200
+    assert resposta.get_json()['nome'] == 'Bruno'
+
+def test_etag_igual_responde_304(cliente):
+    turma = criar_turma(cliente)
+    cache_professores.limpar()
+    cache_turmas.limpar()
+    etag = cliente.get(f"/turmas/{turma['id']}").headers['ETag']
+    assert cliente.get(f"/turmas/{turma['id']}", headers={'If-None-Match': etag}).status_code == 304
+
+def test_update_incrementa_a_versao_e_muda_o_etag(cliente):
+    turma = criar_turma(cliente)
+    aluno = cliente.post('/alunos/', json={'nome': 'Ana', 'turma_id': turma['id']}).get_json()
+    etag = cliente.get(f"/alunos/{aluno['id']}").headers['ETag']
+
+    cliente.put(f"/alunos/{aluno['id']}", json={'nome': 'Ana Maria'})
+    resposta = cliente.get(f"/alunos/{aluno['id']}", headers={'If-None-Match': etag})
+    assert resposta.status_code == 200
+    assert resposta.headers['ETag'] != etag
+
+def test_escrita_concorrente_vale_a_ultima(app, cliente):
+    """Uma versão alterada por outra conexão no meio do PUT não vira erro (sem lock otimista)."""
+    from app import db
+    from app.models.aluno_model import Aluno
+    turma = criar_turma(cliente)
+    aluno_id = cliente.post('/alunos/', json={'nome': 'Ana', 'turma_id': turma['id']}).get_json()['id']
+
+    aluno = db.session.get(Aluno, aluno_id)
+    aluno.nome
+    with db.engine.begin() as outra:
+        outra.execute(db.update(Aluno).where(Aluno.id == aluno_id).values(versao=Aluno.versao + 1))
+    aluno.nome = 'Ana Maria'
+    db.session.commit()
+
+    assert db.session.get(Aluno, aluno_id).versao == 3
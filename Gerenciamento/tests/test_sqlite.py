@@ -0,0 +1,49 @@
+"""Perfil do SQLite (app/utils/sqlite.py, aplicado em create_app): WAL deixa as leituras seguirem durante uma escrita."""
+import time
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from app import db
+
+def test_journal_mode_wal(app):
+    with db.engine.connect() as conexao:
+        assert conexao.execute(text('PRAGMA journal_mode')).scalar() == 'wal'
+        assert conexao.execute(text('PRAGMA busy_timeout')).scalar() == app.config['SQLITE_PRAGMAS']['busy_timeout']
+
+def segurar_escrita(engine):
+    """Abre uma transação de escrita com lock exclusivo e uma linha ainda não confirmada."""
+    escritor = engine.connect()
+    escritor.exec_driver_sql('BEGIN EXCLUSIVE')
+    escritor.exec_driver_sql("INSERT INTO professores (nome, versao) VALUES ('Em andamento', 1)")
+    return escritor
+
+def test_escrita_nao_bloqueia_leitura(app):
+    escritor = segurar_escrita(db.engine)
+    try:
+        inicio = time.perf_counter()
+        with db.engine.connect() as leitor:
+            total = leitor.execute(text('SELECT count(*) FROM professores')).scalar()
+        duracao = time.perf_counter() - inicio
+    finally:
+        escritor.rollback()
+        escritor.close()
+
+    assert total == 0
+    # Bem abaixo do busy_timeout (5 s): a leitura não esperou pelo lock
+    assert duracao < 0.5
+
+def test_sem_wal_a_leitura_fica_bloqueada(app, tmp_path):
+    """Controle: o mesmo cenário com o rollback journal padrão falha na leitura."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'sem_wal.db'}", connect_args={'timeout': 0})
+    with engine.begin() as conexao:
+        conexao.exec_driver_sql('CREATE TABLE professores (id INTEGER PRIMARY KEY, nome TEXT, versao INTEGER)')
+
+    escritor = segurar_escrita(engine)
+    try:
+        with pytest.raises(OperationalError, match='locked'):
+            with engine.connect() as leitor:
+                leitor.execute(text('SELECT count(*) FROM professores')).scalar()
+    finally:
+        escritor.rollback()
+        escritor.close()
+        engine.dispose()
@@ -1,32 +1,40 @@
 from app import db
 from app.models.reserva_model import Reserva
-import requests
-import os
+from app.utils.campos import aplicar_campos
+from app.utils.paginacao import paginar
+from app.utils.sincronizacao import EspelhoIndisponivel, espelho_turmas
 from datetime import datetime
 
-SERVICO_GERENCIAMENTO_URL = os.environ.get('SERVICO_GERENCIAMENTO_URL', 'http://localhost:5001')
-
-def turma_existe(turma_id):
+def validar_turma(turma_id):
+    """Valida a turma contra o espelho local; retorna (erro, status) ou None se for válida."""
+    if not isinstance(turma_id, int):
+        return {"error": "Turma não encontrada"}, 404
     try:
-        url = f"{SERVICO_GERENCIAMENTO_URL}/turmas/{turma_id}"
-        response = requests.get(url)
-        return response.status_code == 200
-    except requests.RequestException:
-        return False
-    
-def get_reservas():
-    reservas = Reserva.query.all()
-    return [reserva.to_dict() for reserva in reservas]
+        ativo = espelho_turmas.ativo(turma_id)
+    except EspelhoIndisponivel:
+        return {"error": "Não foi possível validar a turma: serviço de gerenciamento indisponível"}, 503
+    if ativo is None:
+        return {"error": "Turma não encontrada"}, 404
+    if not ativo:
+        return {"error": "Turma inativa"}, 400
+    return None
 
-def get_reserva(reserva_id):
-    reserva = Reserva.query.get(reserva_id)
-    return reserva.to_dict() if reserva else None
+
+def get_reservas(limite, apos=None, campos=None):
+    query = aplicar_campos(Reserva.query, Reserva, campos)
+    reservas, proximo = paginar(query, Reserva.id, limite, apos)
+    return [reserva.to_dict(campos) for reserva in reservas], proximo
+
+def get_reserva(reserva_id, campos=None):
+    reserva = aplicar_campos(Reserva.query, Reserva, campos).get(reserva_id)
+    return reserva.to_dict(campos) if reserva else None
 
 def create_reserva(data):
     turma_id = data.get('turma_id')
-    if not turma_id or not turma_existe(turma_id):
-        return {"error": "Turma não encontrada"}, 404
-    
+    erro = validar_turma(turma_id)
+    if erro:
+        return erro
+
     nova_reserva = Reserva(
         num_sala = data.get('num_sala'),
         lab = data.get('lab', False),
@@ -45,8 +53,9 @@ def update_reserva(reserva_id, data):
 
     if 'turma_id' in data:
         turma_id = data['turma_id']
-        if not turma_existe(turma_id):
-            return {"error": "Turma não encontrada"}, 404
+        erro = validar_turma(turma_id)
+        if erro:
+            return erro
         reserva.turma_id = turma_id
 
     reserva.num_sala = data.get('num_sala', reserva.num_sala)
@@ -0,0 +1,17 @@
+from flask import Blueprint, jsonify
+from app.utils.cliente_http import cliente_gerenciamento
+
+metricas_bp = Blueprint('metricas_bp', __name__, url_prefix='/metricas')
+
+@metricas_bp.route('/', methods=['GET'])
+def get_metricas():
+    """
+    Métricas internas deste worker
+    ---
+    tags:
+      - Métricas
+    responses:
+      200:
+        description: Chamadas ao Gerenciamento (falhas, latências média, p50, p95, p99, máxima) e estado e transições do disjuntor
+    """
+    return jsonify({'http': [cliente_gerenciamento.metricas()]})
@@ -1,5 +1,8 @@
 from flask import Blueprint, request, jsonify
 from app.controllers import reserva_controller
+from app.models.reserva_model import Reserva
+from app.utils.campos import ler_campos
+from app.utils.paginacao import ler_paginacao, resposta_paginada
 
 reserva_bp = Blueprint('reserva_bp', __name__, url_prefix='/reservas')
 
@@ -10,9 +13,26 @@ def get_reservas():
     ---
     tags:
       - Reservas
+    parameters:
+      - in: query
+        name: limit
+        type: integer
+        description: Quantidade de itens por página (o servidor aplica um máximo).
+      - in: query
+        name: after
+        type: integer
+        description: Cursor da página; retorna apenas itens com ID maior que este valor.
+      - in: query
+        name: fields
+        type: string
+        description: Campos a retornar, separados por vírgula (ex. id,nome).
     responses:
       200:
         description: Uma lista de todas as reservas
+        headers:
+          Link:
+            type: string
+            description: URL da próxima página (rel="next"), ausente na última página.
         schema:
           type: array
           items:
@@ -30,8 +50,9 @@ def get_reservas():
               turma_id:
                 type: integer
     """
-    reservas = reserva_controller.get_reservas()
-    return jsonify(reservas), 200
+    limite, apos = ler_paginacao()
+    reservas, proximo = reserva_controller.get_reservas(limite, apos, ler_campos(Reserva))
+    return resposta_paginada(reservas, proximo), 200
 
 @reserva_bp.route('/<int:reserva_id>', methods=['GET'])
 def get_reserva(reserva_id):
@@ -46,13 +67,17 @@ def get_reserva(reserva_id):
         type: integer
         required: true
         description: ID da reserva
+      - in: query
+        name: fields
+        type: string
+        description: Campos a retornar, separados por vírgula (ex. id,nome).
     responses:
       200:
         description: Detalhes da reserva
       404:
         description: Reserva não encontrada
     """
-    reserva = reserva_controller.get_reserva(reserva_id)
+    reserva = reserva_controller.get_reserva(reserva_id, ler_campos(Reserva))
     if reserva:
         return jsonify(reserva)
     else:
@@ -88,9 +113,11 @@ def create_reserva():
       201:
         description: Reserva criada com sucesso
       400:
-        description: Dados insuficientes
+        description: Dados insuficientes ou turma inativa
       404:
         description: Turma não encontrada no serviço de gerenciamento
+      503:
+        description: Espelho de turmas defasado e serviço de gerenciamento indisponível
     """
     data = request.get_json()
     if not data or not 'turma_id' in data or not 'data' in data:
@@ -128,8 +155,12 @@ def update_reserva(reserva_id):
     responses:
       200:
         description: Reserva atualizada com sucesso
+      400:
+        description: Dados insuficientes ou turma inativa
       404:
         description: Reserva não encontrada ou Turma não encontrada
+      503:
+        description: Espelho de turmas defasado e serviço de gerenciamento indisponível
     """
     data = request.get_json()
     if not data:
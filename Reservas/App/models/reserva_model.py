@@ -6,15 +6,18 @@ class Reserva(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     num_sala = db.Column(db.Integer)
     lab = db.Column(db.Boolean, default=False)
-    data = db.Column(db.Date)
+    data = db.Column(db.Date, index=True)
 
-    turma_id = db.Column(db.Integer, nullable=False)
+    turma_id = db.Column(db.Integer, nullable=False, index=True)
 
-    def to_dict(self):
-        return {
-            'id': self.id,
-            'num_sala': self.num_sala,
-            'lab': self.lab,
-            'data': str(self.data) if self.data else None,
-            'turma_id': self.turma_id
-        }
\ No newline at end of file
+    # Campos expostos pela API e como cada um é serializado (?fields= escolhe entre eles)
+    CAMPOS = {
+        'id': lambda reserva: reserva.id,
+        'num_sala': lambda reserva: reserva.num_sala,
+        'lab': lambda reserva: reserva.lab,
+        'data': lambda reserva: str(reserva.data) if reserva.data else None,
+        'turma_id': lambda reserva: reserva.turma_id
+    }
+
+    def to_dict(self, campos=None):
+        return {nome: valor(self) for nome, valor in self.CAMPOS.items() if campos is None or nome in campos}
\ No newline at end of file
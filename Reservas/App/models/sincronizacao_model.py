@@ -0,0 +1,11 @@
+from app import db
+
+class Sincronizacao(db.Model):
+    """Estado da sincronização de um recurso espelhado do Gerenciamento."""
+    __tablename__ = 'sincronizacoes'
+
+    recurso = db.Column(db.String(20), primary_key=True)
+    # Último seq do log de alterações já aplicado ao espelho
+    ultimo_seq = db.Column(db.Integer, nullable=False, default=0)
+    # Quando o espelho alcançou o log pela última vez (epoch, em segundos)
+    sincronizado_em = db.Column(db.Float)
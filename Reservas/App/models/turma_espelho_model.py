@@ -0,0 +1,12 @@
+from app import db
+
+class TurmaEspelho(db.Model):
+    """Cópia local das turmas do Gerenciamento (só o que a validação usa).
+
+    Mantida pela sincronização com GET /changes (ver app/utils/sincronizacao.py);
+    não é alterada pela API deste serviço.
+    """
+    __tablename__ = 'turmas_espelho'
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    ativo = db.Column(db.Boolean, nullable=False, default=True)
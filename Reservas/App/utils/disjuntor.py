@@ -0,0 +1,96 @@
+import threading
+import time
+from collections import deque
+import requests
+
+FECHADO = 'fechado'
+ABERTO = 'aberto'
+MEIO_ABERTO = 'meio_aberto'
+
+class CircuitoAberto(requests.RequestException):
+    """Chamada recusada sem ir à rede: o disjuntor do serviço está aberto."""
+
+class Disjuntor:
+    """Disjuntor (circuit breaker) das chamadas a um serviço, por worker.
+
+    Fechado, deixa tudo passar e conta as falhas seguidas; ao chegar a
+    `limite_falhas`, abre e passa a recusar as chamadas na hora, com
+    CircuitoAberto, em vez de prender a thread até o timeout. Depois de
+    `tempo_aberto` segundos fica meio aberto: até `testes` chamadas vão ao
+    serviço como teste; um sucesso fecha o disjuntor e uma falha o reabre.
+    """
+
+    # Transições guardadas para as métricas
+    HISTORICO = 20
+
+    def __init__(self, nome, limite_falhas=5, tempo_aberto=10, testes=1):
+        self.nome = nome
+        self.limite_falhas = limite_falhas
+        self.tempo_aberto = tempo_aberto
+        self.testes = testes
+        self._lock = threading.Lock()
+        self.estado = FECHADO
+        self._falhas_seguidas = 0
+        self._aberto_em = None
+        self._testes_em_andamento = 0
+        self.recusadas = 0
+        self.transicoes = {}
+        self._historico = deque(maxlen=self.HISTORICO)
+
+    def configurar(self, limite_falhas, tempo_aberto, testes):
+        with self._lock:
+            self.limite_falhas = limite_falhas
+            self.tempo_aberto = tempo_aberto
+            self.testes = testes
+
+    def _mudar(self, estado):
+        # Chamado com self._lock adquirido
+        transicao = f'{self.estado}->{estado}'
+        self.transicoes[transicao] = self.transicoes.get(transicao, 0) + 1
+        self._historico.append({'transicao': transicao, 'em': time.time()})
+        self.estado = estado
+        if estado == ABERTO:
+            self._aberto_em = time.monotonic()
+        self._falhas_seguidas = 0
+        self._testes_em_andamento = 0
+
+    def permitir(self):
+        """Reserva a passagem de uma chamada; levanta CircuitoAberto se ela deve ser recusada."""
+        with self._lock:
+            if self.estado == ABERTO and time.monotonic() - self._aberto_em >= self.tempo_aberto:
+                self._mudar(MEIO_ABERTO)
+            if self.estado == FECHADO:
+                return
+            if self.estado == MEIO_ABERTO and self._testes_em_andamento < self.testes:
+                self._testes_em_andamento += 1
+                return
+            self.recusadas += 1
+        raise CircuitoAberto(f'Serviço {self.nome} indisponível (disjuntor {self.estado})')
+
+    def registrar_sucesso(self):
+        with self._lock:
+            if self.estado == MEIO_ABERTO:
+                self._mudar(FECHADO)
+            self._falhas_seguidas = 0
+
+    def registrar_falha(self):
+        with self._lock:
+            if self.estado == MEIO_ABERTO:
+                self._mudar(ABERTO)
+            elif self.estado == FECHADO:
+                self._falhas_seguidas += 1
+                if self._falhas_seguidas >= self.limite_falhas:
+                    self._mudar(ABERTO)
+
+    def metricas(self):
+        with self._lock:
+            return {
+                'estado': self.estado,
+                'limite_falhas': self.limite_falhas,
+                'tempo_aberto': self.tempo_aberto,
+                'testes': self.testes,
+                'falhas_seguidas': self._falhas_seguidas,
+                'recusadas': self.recusadas,
+                'transicoes': dict(self.transicoes),
+                'ultimas_transicoes': list(self._historico)
+            }
@@ -0,0 +1,152 @@
+import threading
+import time
+import requests
+from flask import current_app
+from sqlalchemy.dialects.sqlite import insert
+from app import db
+from app.models.sincronizacao_model import Sincronizacao
+from app.models.turma_espelho_model import TurmaEspelho
+from app.utils.cliente_http import cliente_gerenciamento
+from app.utils.serializacao import ler_corpo
+
+class EspelhoIndisponivel(Exception):
+    """O espelho passou da defasagem máxima e o Gerenciamento não respondeu."""
+
+class EspelhoTurmas:
+    """Turmas do Gerenciamento (id -> ativo) para validar reservas sem chamada HTTP.
+
+    A tabela turmas_espelho e o cursor em sincronizacoes guardam o espelho entre
+    reinícios e são compartilhados pelos workers; cada worker mantém uma cópia
+    em memória, recarregada da tabela sempre que o cursor avança.
+    """
+
+    RECURSO = 'turmas'
+
+    def __init__(self):
+        self._turmas = {}
+        self._lock = threading.Lock()
+        self.ultimo_seq = None
+        self.sincronizado_em = None
+
+    def _ler_cursor(self):
+        """Último seq aplicado, gravado na tabela (cria a linha do recurso na primeira vez)."""
+        consulta = db.select(Sincronizacao.ultimo_seq).where(Sincronizacao.recurso == self.RECURSO)
+        cursor = db.session.execute(consulta).scalar()
+        if cursor is None:
+            # Dois workers podem chegar aqui juntos; o segundo INSERT é ignorado
+            db.session.execute(insert(Sincronizacao).values(recurso=self.RECURSO, ultimo_seq=0).on_conflict_do_nothing())
+            db.session.commit()
+            cursor = db.session.execute(consulta).scalar()
+        # Encerra a leitura antes da chamada HTTP: uma transação de leitura antiga
+        # não pode virar escrita no WAL depois que outro worker gravou
+        db.session.commit()
+        return cursor
+
+    def _avancar_cursor(self, antigo, novo):
+        """Compare-and-set do cursor: só avança se nenhum worker o moveu desde `antigo`.
+
+        O UPDATE também pega o lock de escrita, então a página só é aplicada
+        por quem ganhou o cursor.
+        """
+        resultado = db.session.execute(
+            db.update(Sincronizacao)
+            .where(Sincronizacao.recurso == self.RECURSO, Sincronizacao.ultimo_seq == antigo)
+            .values(ultimo_seq=novo, sincronizado_em=time.time()),
+            execution_options={'synchronize_session': False}
+        )
+        return resultado.rowcount == 1
+
+    def _aplicar(self, alteracoes):
+        for alteracao in alteracoes:
+            if alteracao['recurso'] != self.RECURSO:
+                continue
+            if alteracao['operacao'] == 'delete':
+                db.session.execute(db.delete(TurmaEspelho).where(TurmaEspelho.id == alteracao['id']))
+            else:
+                ativo = bool((alteracao['dados'] or {}).get('ativo', True))
+                db.session.execute(
+                    insert(TurmaEspelho)
+                    .values(id=alteracao['id'], ativo=ativo)
+                    .on_conflict_do_update(index_elements=[TurmaEspelho.id], set_={'ativo': ativo})
+                )
+
+    def sincronizar(self):
+        """Aplica as alterações do Gerenciamento desde o último seq conhecido.
+
+        Lê o log em páginas; cada página é gravada junto com o novo cursor, na
+        mesma transação, então uma falha no meio não perde nem repete alterações.
+        Os workers sincronizam cada um na sua thread: se outro worker avançou o
+        cursor enquanto esta página era buscada, ela é descartada (já foi
+        aplicada) e a leitura recomeça do cursor novo, sem nunca reaplicar
+        alterações antigas por cima de mais novas.
+        Retorna a quantidade de alterações lidas.
+        """
+        lote = current_app.config['SINCRONIZACAO_LOTE']
+        lidas = 0
+        with self._lock:
+            while True:
+                cursor = self._ler_cursor()
+                resposta = cliente_gerenciamento.get('/changes/', params={'since': cursor, 'limit': lote})
+                resposta.raise_for_status()
+                pagina = ler_corpo(resposta)
+
+                if not self._avancar_cursor(cursor, pagina['ultimo_seq']):
+                    db.session.rollback()
+                    continue
+                self._aplicar(pagina['alteracoes'])
+                db.session.commit()
+                cursor = pagina['ultimo_seq']
+                lidas += len(pagina['alteracoes'])
+                if not pagina['mais']:
+                    break
+
+            # O cursor também avança quando outro worker sincroniza
+            if cursor != self.ultimo_seq:
+                self._turmas = dict(db.session.execute(db.select(TurmaEspelho.id, TurmaEspelho.ativo)).all())
+                self.ultimo_seq = cursor
+            self.sincronizado_em = time.monotonic()
+        return lidas
+
+    def atual(self):
+        """Indica se a última sincronização deste worker está dentro da defasagem máxima."""
+        if self.sincronizado_em is None:
+            return False
+        return time.monotonic() - self.sincronizado_em <= current_app.config['SINCRONIZACAO_DEFASAGEM_MAXIMA']
+
+    def ativo(self, turma_id):
+        """Flag ativo da turma, ou None se ela não existe.
+
+        Se o espelho estiver defasado demais, sincroniza antes; sem resposta do
+        Gerenciamento, levanta EspelhoIndisponivel.
+        """
+        if not self.atual():
+            try:
+                self.sincronizar()
+            except (requests.RequestException, ValueError, KeyError) as erro:
+                db.session.rollback()
+                raise EspelhoIndisponivel() from erro
+        return self._turmas.get(turma_id)
+
+espelho_turmas = EspelhoTurmas()
+
+def iniciar_sincronizacao(app):
+    """Mantém o espelho em dia em uma thread de fundo (uma por worker)."""
+    intervalo = app.config['SINCRONIZACAO_INTERVALO']
+    if not intervalo:
+        return None
+
+    def executar():
+        while True:
+            with app.app_context():
+                try:
+                    espelho_turmas.sincronizar()
+                except Exception as erro:
+                    db.session.rollback()
+                    app.logger.warning('Falha ao sincronizar turmas com o Gerenciamento: %s', erro)
+                finally:
+                    db.session.remove()
+            time.sleep(intervalo)
+
+    thread = threading.Thread(target=executar, name='sincronizacao-turmas', daemon=True)
+    thread.start()
+    return thread
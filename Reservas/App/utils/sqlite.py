@@ -0,0 +1,13 @@
+from sqlalchemy import event
+
+def configurar_sqlite(engine, pragmas):
+    """Aplica os PRAGMAs (WAL, busy_timeout, cache...) a cada nova conexão do engine."""
+    if not pragmas or engine.dialect.name != 'sqlite':
+        return
+
+    @event.listens_for(engine, 'connect')
+    def aplicar_pragmas(conexao, _registro):
+        cursor = conexao.cursor()
+        for nome, valor in pragmas.items():
+            cursor.execute(f'PRAGMA {nome}={valor}')
+        cursor.close()
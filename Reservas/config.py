@@ -4,3 +4,43 @@ class Config:
     SQLALCHEMY_DATABASE_URI = 'sqlite:///reservas.db'
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     SECRET_KEY = os.urandom(24)
+
+    # Perfil de produção do SQLite, aplicado a cada conexão (ver app/utils/sqlite.py).
+    # WAL permite leituras durante uma escrita; busy_timeout faz o worker esperar
+    # pelo lock em vez de falhar com "database is locked".
+    SQLITE_PRAGMAS = {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'busy_timeout': 5000,
+        'cache_size': -8000,
+        'mmap_size': 67108864,
+    }
+
+    # Paginação das listas (?limit=&after=)
+    PAGINACAO_LIMITE_PADRAO = 100
+    PAGINACAO_LIMITE_MAXIMO = 1000
+
+    SERVICO_GERENCIAMENTO_URL = os.environ.get('SERVICO_GERENCIAMENTO_URL', 'http://localhost:5001')
+
+    # Chamadas ao Gerenciamento (app/utils/cliente_http.py): timeouts em segundos e
+    # conexões keep-alive mantidas por worker
+    HTTP_TIMEOUT_CONEXAO = float(os.environ.get('HTTP_TIMEOUT_CONEXAO', 1))
+    HTTP_TIMEOUT_LEITURA = float(os.environ.get('HTTP_TIMEOUT_LEITURA', 3))
+    HTTP_POOL_TAMANHO = 10
+    # Disjuntor: abre após DISJUNTOR_LIMITE_FALHAS falhas seguidas (erro de rede, timeout
+    # ou 5xx) e recusa as chamadas na hora por DISJUNTOR_TEMPO_ABERTO segundos; depois
+    # deixa passar DISJUNTOR_TESTES chamadas de teste antes de voltar a fechar
+    DISJUNTOR_LIMITE_FALHAS = int(os.environ.get('DISJUNTOR_LIMITE_FALHAS', 5))
+    DISJUNTOR_TEMPO_ABERTO = float(os.environ.get('DISJUNTOR_TEMPO_ABERTO', 10))
+    DISJUNTOR_TESTES = 1
+
+    # Espelho local das turmas, atualizado pelo log de alterações do Gerenciamento
+    # (GET /changes). Intervalo da sincronização de fundo em segundos; 0 desativa a thread.
+    SINCRONIZACAO_INTERVALO = int(os.environ.get('SINCRONIZACAO_INTERVALO', 5))
+    # Defasagem máxima (segundos) aceita para validar reservas só com o espelho;
+    # acima dela a validação sincroniza antes e responde 503 se o Gerenciamento não responder
+    SINCRONIZACAO_DEFASAGEM_MAXIMA = int(os.environ.get('SINCRONIZACAO_DEFASAGEM_MAXIMA', 60))
+    SINCRONIZACAO_LOTE = 1000
+
+    # Especificação OpenAPI gerada no build (flask --app app gerar-apispec) e servida da memória
+    APISPEC_ARQUIVO = os.environ.get('APISPEC_ARQUIVO', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'apispec.json'))
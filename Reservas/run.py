@@ -1,6 +1,8 @@
 from app import create_app
+from app.utils.sincronizacao import iniciar_sincronizacao
 
 app = create_app()
+iniciar_sincronizacao(app)
 
 if __name__ == "__main__":
   app.run(debug=True)
\ No newline at end of file
@@ -0,0 +1,16 @@
+import pytest
+from config import Config
+from app import create_app, db
+
+@pytest.fixture
+def app(tmp_path):
+    class ConfigTeste(Config):
+        TESTING = True
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'teste.db'}"
+
+    app = create_app(ConfigTeste)
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.engine.dispose()
@@ -0,0 +1,65 @@
+"""Espelho de turmas: workers sincronizando ao mesmo tempo não fazem o cursor voltar."""
+import json
+import pytest
+from app import db
+from app.models.sincronizacao_model import Sincronizacao
+from app.utils import sincronizacao
+from app.utils.sincronizacao import EspelhoTurmas
+
+# Log do Gerenciamento: a turma 1 é criada e depois apagada
+LOG = [
+    {'seq': 1, 'recurso': 'turmas', 'id': 1, 'operacao': 'create', 'dados': {'ativo': True}},
+    {'seq': 2, 'recurso': 'turmas', 'id': 1, 'operacao': 'delete', 'dados': None},
+]
+
+class RespostaFalsa:
+    status_code = 200
+    headers = {'Content-Type': 'application/json'}
+
+    def __init__(self, corpo):
+        self.content = json.dumps(corpo).encode()
+
+    def raise_for_status(self):
+        pass
+
+def pagina(desde, ate):
+    alteracoes = [alteracao for alteracao in LOG if desde < alteracao['seq'] <= ate]
+    ultimo = alteracoes[-1]['seq'] if alteracoes else desde
+    return RespostaFalsa({'alteracoes': alteracoes, 'ultimo_seq': ultimo, 'mais': False, 'seq_atual': len(LOG)})
+
+@pytest.fixture
+def chamadas(monkeypatch):
+    """Substitui o GET /changes/; cada chamada consome a próxima função da lista."""
+    roteiro = []
+
+    def get(_caminho, params):
+        return roteiro.pop(0)(params['since'])
+
+    monkeypatch.setattr(sincronizacao.cliente_gerenciamento, 'get', get)
+    return roteiro
+
+def test_pagina_de_worker_atrasado_e_descartada(app, chamadas):
+    lento = EspelhoTurmas()
+    rapido = EspelhoTurmas()
+
+    def lento_busca(desde):
+        # Enquanto a página do worker lento (só o seq 1) está em trânsito,
+        # o outro worker lê o log inteiro e grava o cursor em 2
+        resposta = pagina(desde, 1)
+        rapido.sincronizar()
+        return resposta
+
+    chamadas.extend([lento_busca, lambda desde: pagina(desde, 2), lambda desde: pagina(desde, 2)])
+    lento.sincronizar()
+
+    assert db.session.get(Sincronizacao, 'turmas').ultimo_seq == 2
+    # A criação (seq 1) não foi reaplicada por cima da exclusão (seq 2)
+    assert lento.ativo(1) is None
+    assert rapido.ativo(1) is None
+    assert chamadas == []
+
+def test_sincroniza_do_zero(app, chamadas):
+    espelho = EspelhoTurmas()
+    chamadas.append(lambda desde: pagina(desde, 1))
+    assert espelho.sincronizar() == 1
+    assert espelho.ativo(1) is True
@@ -1,16 +1,29 @@
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
-from flasgger import Swagger
 from config import Config
+from app.utils.cache import configurar_caches
+from app.utils.cliente_http import configurar_cliente_http
+from app.utils.documentacao import comando_gerar_apispec, documentacao_bp
+from app.utils.serializacao import ProvedorJSON
+from app.utils.sqlite import configurar_sqlite
 
 db = SQLAlchemy()
 
 def create_app(config_class=Config):
     app = Flask(__name__)
     app.config.from_object(config_class)
+    app.json = ProvedorJSON(app)
 
     db.init_app(app)
-    Swagger(app)
+    with app.app_context():
+        configurar_sqlite(db.engine, app.config.get('SQLITE_PRAGMAS'))
+    configurar_cliente_http(app)
+    configurar_caches(app)
+    app.register_blueprint(documentacao_bp)
+    app.cli.add_command(comando_gerar_apispec)
+
+    from app.migracoes import comando_migrar
+    app.cli.add_command(comando_migrar)
 
     from app.routes.atividade_routes import atividade_bp
     app.register_blueprint(atividade_bp)
@@ -18,4 +31,7 @@ def create_app(config_class=Config):
     from app.routes.nota_routes import nota_bp
     app.register_blueprint(nota_bp)
 
+    from app.routes.metricas_routes import metricas_bp
+    app.register_blueprint(metricas_bp)
+
     return app
\ No newline at end of file
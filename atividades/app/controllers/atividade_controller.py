@@ -1,44 +1,55 @@
 from app import db
 from app.models.atividade_model import Atividade
-import requests
-import os
+from app.models.nota_model import Nota
+from app.utils.campos import aplicar_campos
+from app.utils.paginacao import paginar
+from app.utils.existencia import ERRO_GERENCIAMENTO_INDISPONIVEL, GerenciamentoIndisponivel, existem_no_gerenciamento
 from datetime import datetime
 
-SERVICO_GERENCIAMENTO_URL = os.environ.get('SERVICO_GERENCIAMENTO_URL', 'http://localhost:5001')
+# Erro de cada referência ao Gerenciamento, na ordem em que são informados
+REFERENCIAS = (
+    ('turma_id', 'turmas', "Turma não encontrada"),
+    ('professor_id', 'professores', "Professor não encontrado"),
+)
+
+def validar_referencias(data, obrigatorias):
+    """Valida turma_id e professor_id presentes em data com consultas simultâneas ao Gerenciamento.
+
+    Retorna (erro, status) ou None se forem válidas; com `obrigatorias`, a
+    ausência de uma delas também é erro.
+    """
+    informadas = []
+    for campo, recurso, erro in REFERENCIAS:
+        if data.get(campo):
+            informadas.append((campo, recurso, erro))
+        elif obrigatorias or campo in data:
+            return {"error": erro}, 404
 
-def turma_existe(turma_id):
-    try:
-        url = f"{SERVICO_GERENCIAMENTO_URL}/turmas/{turma_id}"
-        response = requests.get(url)
-        return response.status_code == 200
-    except requests.RequestException:
-        return False
-    
-def professor_existe(professor_id):
     try:
-        url = f"{SERVICO_GERENCIAMENTO_URL}/professores/{professor_id}"
-        response = requests.get(url)
-        return response.status_code == 200
-    except requests.RequestException:
-        return False
+        existentes = existem_no_gerenciamento(*[(recurso, data[campo]) for campo, recurso, _ in informadas])
+    except GerenciamentoIndisponivel:
+        return ERRO_GERENCIAMENTO_INDISPONIVEL
+    for (_, _, erro), existe in zip(informadas, existentes):
+        if not existe:
+            return {"error": erro}, 404
+    return None
     
-def get_atividades():
-    atividades = Atividade.query.all()
-    return [atividade.to_dict() for atividade in atividades]
+def get_atividades(limite, apos=None, campos=None):
+    query = aplicar_campos(Atividade.query, Atividade, campos)
+    atividades, proximo = paginar(query, Atividade.id, limite, apos)
+    return [atividade.to_dict(campos) for atividade in atividades], proximo
 
-def get_atividade(atividade_id):
-    atividade = Atividade.query.get(atividade_id)
-    return atividade.to_dict() if atividade else None
+def get_atividade(atividade_id, campos=None):
+    atividade = aplicar_campos(Atividade.query, Atividade, campos).get(atividade_id)
+    return atividade.to_dict(campos) if atividade else None
 
 def create_atividade(data):
     turma_id = data.get('turma_id')
     professor_id = data.get('professor_id')
 
-    if not turma_id or not turma_existe(turma_id):
-        return {"error": "Turma não encontrada"}, 404
-
-    if not professor_id or not professor_existe(professor_id):
-        return {"error": "Professor não encontrado"}, 404
+    erro = validar_referencias(data, obrigatorias=True)
+    if erro:
+        return erro
     
     nova_atividade = Atividade(
         nome = data.get('nome'),
@@ -58,17 +69,12 @@ def update_atividade(atividade_id, data):
     if not atividade:
         return {"error": "Atividade não encontrada"}, 404
 
-    if 'turma_id' in data:
-        turma_id = data['turma_id']
-        if not turma_existe(turma_id):
-            return {"error": "Turma não encontrada"}, 404
-        atividade.turma_id = turma_id
+    erro = validar_referencias(data, obrigatorias=False)
+    if erro:
+        return erro
 
-    if 'professor_id' in data:
-        professor_id = data['professor_id']
-        if not professor_existe(professor_id):
-            return {"error": "Professor não encontrado"}, 404
-        atividade.professor_id = professor_id
+    atividade.turma_id = data.get('turma_id', atividade.turma_id)
+    atividade.professor_id = data.get('professor_id', atividade.professor_id)
 
     atividade.nome = data.get('nome', atividade.nome)
     atividade.descricao = data.get('descricao', atividade.descricao)
@@ -81,9 +87,9 @@ def update_atividade(atividade_id, data):
     return atividade.to_dict(), 200
 
 def delete_atividade(atividade_id):
-    atividade = Atividade.query.get(atividade_id)
-    if atividade:
-        db.session.delete(atividade)
-        db.session.commit()
-        return True
-    return False
\ No newline at end of file
+    # DELETEs em conjunto: as notas da atividade não são carregadas na sessão
+    sem_sincronizar = {'synchronize_session': False}
+    db.session.execute(db.delete(Nota).where(Nota.atividade_id == atividade_id), execution_options=sem_sincronizar)
+    resultado = db.session.execute(db.delete(Atividade).where(Atividade.id == atividade_id), execution_options=sem_sincronizar)
+    db.session.commit()
+    return resultado.rowcount > 0
\ No newline at end of file
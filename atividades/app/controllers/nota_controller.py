@@ -1,38 +1,41 @@
 from app import db
 from app.models.atividade_model import Atividade
 from app.models.nota_model import Nota
-import requests
-import os
-
-SERVICO_GERENCIAMENTO_URL = os.environ.get('SERVICO_GERENCIAMENTO_URL', 'http://localhost:5001')
+from app.utils.exportacao import em_lotes
+from app.utils.campos import aplicar_campos
+from app.utils.paginacao import paginar
+from app.utils.existencia import ERRO_GERENCIAMENTO_INDISPONIVEL, GerenciamentoIndisponivel, existe_no_gerenciamento, existentes_no_gerenciamento
 
 def aluno_existe(aluno_id):
-    """Verifica se o Aluno existe no serviço de Gerenciamento."""
-    try:
-        url = f"{SERVICO_GERENCIAMENTO_URL}/alunos/{aluno_id}"
-        response = requests.get(url, timeout=3)
-        return response.status_code == 200
-    except requests.RequestException:
-        return False
+    """Verifica se o Aluno existe no serviço de Gerenciamento; levanta GerenciamentoIndisponivel se não houver resposta."""
+    return existe_no_gerenciamento('alunos', aluno_id)
 
 def atividade_existe(atividade_id):
     """Verifica se a Atividade existe no banco de dados local."""
     return Atividade.query.get(atividade_id) is not None
 
-def get_notas():
-    notas = Nota.query.all()
-    return [nota.to_dict() for nota in notas]
+def get_notas(limite, apos=None, campos=None):
+    query = aplicar_campos(Nota.query, Nota, campos)
+    notas, proximo = paginar(query, Nota.id, limite, apos)
+    return [nota.to_dict(campos) for nota in notas], proximo
+
+def exportar_notas(campos=None):
+    query = aplicar_campos(Nota.query, Nota, campos)
+    return (nota.to_dict(campos) for nota in em_lotes(query, Nota.id))
 
-def get_nota(nota_id):
-    nota = Nota.query.get(nota_id)
-    return nota.to_dict() if nota else None
+def get_nota(nota_id, campos=None):
+    nota = aplicar_campos(Nota.query, Nota, campos).get(nota_id)
+    return nota.to_dict(campos) if nota else None
 
 def create_nota(data):
     aluno_id = data.get('aluno_id')
     atividade_id = data.get('atividade_id')
 
-    if not aluno_id or not aluno_existe(aluno_id):
-        return {'error': 'Aluno não encontrado no serviço de gerenciamento'}, 404
+    try:
+        if not aluno_id or not aluno_existe(aluno_id):
+            return {'error': 'Aluno não encontrado no serviço de gerenciamento'}, 404
+    except GerenciamentoIndisponivel:
+        return ERRO_GERENCIAMENTO_INDISPONIVEL
 
     if not atividade_id or not atividade_existe(atividade_id):
         return {'error': 'Atividade não encontrada neste serviço'}, 404
@@ -47,6 +50,73 @@ def create_nota(data):
     db.session.commit()
     return nova_nota.to_dict(), 201
 
+def _inteiro(valor):
+    return isinstance(valor, int) and not isinstance(valor, bool)
+
+def _numero(valor):
+    return isinstance(valor, (int, float)) and not isinstance(valor, bool)
+
+def salvar_notas_em_lote(atividade_id, registros):
+    """Lança as notas de vários alunos em uma atividade, em uma única transação.
+
+    A atividade é conferida uma vez e os alunos com uma só chamada ao
+    Gerenciamento. O aluno que já tem nota na atividade tem a nota atualizada
+    (200); os demais ganham uma nota nova (201). Cada registro recebe o seu
+    próprio resultado, de modo que registros inválidos não impedem os demais.
+    Retorna (resultados, status).
+    """
+    if not atividade_existe(atividade_id):
+        return {'error': 'Atividade não encontrada neste serviço'}, 404
+
+    aluno_ids = {r.get('aluno_id') for r in registros if isinstance(r, dict) and _inteiro(r.get('aluno_id'))}
+    try:
+        alunos_existentes = existentes_no_gerenciamento('alunos', aluno_ids)
+    except GerenciamentoIndisponivel:
+        return ERRO_GERENCIAMENTO_INDISPONIVEL
+
+    lancadas = {}
+    if alunos_existentes:
+        consulta = Nota.query.filter(Nota.atividade_id == atividade_id, Nota.aluno_id.in_(alunos_existentes)).order_by(Nota.id)
+        for nota_obj in consulta:
+            lancadas.setdefault(nota_obj.aluno_id, []).append(nota_obj)
+
+    resultados = []
+    vistos = set()
+    novas = []
+    for indice, data in enumerate(registros):
+        if not isinstance(data, dict) or not _inteiro(data.get('aluno_id')) or not _numero(data.get('nota')):
+            resultados.append({'indice': indice, 'status': 400, 'error': 'Dados insuficientes'})
+            continue
+        aluno_id = data['aluno_id']
+        if aluno_id in vistos:
+            resultados.append({'indice': indice, 'status': 400, 'error': 'Aluno repetido no lote'})
+            continue
+        vistos.add(aluno_id)
+        if aluno_id not in alunos_existentes:
+            resultados.append({'indice': indice, 'status': 404, 'error': 'Aluno não encontrado no serviço de gerenciamento'})
+            continue
+
+        existentes = lancadas.get(aluno_id)
+        if existentes:
+            # Registros duplicados de antes do lote recebem a mesma nota
+            for nota_obj in existentes:
+                nota_obj.nota = float(data['nota'])
+            resultados.append({'indice': indice, 'status': 200, 'nota': existentes[0]})
+        else:
+            nova_nota = Nota(nota=float(data['nota']), aluno_id=aluno_id, atividade_id=atividade_id)
+            novas.append(nova_nota)
+            resultados.append({'indice': indice, 'status': 201, 'nota': nova_nota})
+
+    if novas or lancadas:
+        db.session.add_all(novas)
+        # O flush envia os INSERTs em lote e preenche os ids antes da serialização
+        db.session.flush()
+        for resultado in resultados:
+            if 'nota' in resultado:
+                resultado['nota'] = resultado['nota'].to_dict()
+        db.session.commit()
+    return resultados, 200
+
 def update_nota(nota_id, data):
     nota_obj = Nota.query.get(nota_id)
     if not nota_obj:
@@ -54,8 +124,11 @@ def update_nota(nota_id, data):
 
     if 'aluno_id' in data:
         aluno_id = data.get('aluno_id')
-        if not aluno_existe(aluno_id):
-            return {'error': 'Aluno não encontrado no serviço de gerenciamento'}, 404
+        try:
+            if not aluno_existe(aluno_id):
+                return {'error': 'Aluno não encontrado no serviço de gerenciamento'}, 404
+        except GerenciamentoIndisponivel:
+            return ERRO_GERENCIAMENTO_INDISPONIVEL
         nota_obj.aluno_id = aluno_id
 
     if 'atividade_id' in data:
@@ -0,0 +1,44 @@
+"""Migrações versionadas do esquema.
+
+A versão aplicada fica em PRAGMA user_version. `flask --app app migrar`
+cria as tabelas que ainda não existem e aplica, em ordem, as migrações
+com número maior que o atual. Cada migração é idempotente, então um banco
+novo (criado já com o esquema atual) passa por elas sem efeito.
+"""
+import click
+from flask.cli import with_appcontext
+from sqlalchemy import text
+from app import db
+
+def _criar_indice(conexao, tabela, coluna):
+    conexao.execute(text(f'CREATE INDEX IF NOT EXISTS ix_{tabela}_{coluna} ON {tabela} ({coluna})'))
+
+def _indices(conexao):
+    _criar_indice(conexao, 'atividades', 'turma_id')
+    _criar_indice(conexao, 'atividades', 'professor_id')
+    _criar_indice(conexao, 'notas', 'aluno_id')
+    _criar_indice(conexao, 'notas', 'atividade_id')
+
+MIGRACOES = [
+    (1, 'Índices de atividades.turma_id/professor_id e notas.aluno_id/atividade_id', _indices),
+]
+
+def migrar():
+    """Leva o banco até a última migração e retorna a versão final."""
+    db.create_all()
+    with db.engine.begin() as conexao:
+        atual = conexao.execute(text('PRAGMA user_version')).scalar()
+        for versao, descricao, aplicar in MIGRACOES:
+            if versao > atual:
+                click.echo(f'Aplicando migração {versao}: {descricao}')
+                aplicar(conexao)
+                conexao.execute(text(f'PRAGMA user_version = {versao}'))
+                atual = versao
+    return atual
+
+@click.command('migrar')
+@with_appcontext
+def comando_migrar():
+    """Cria ou atualiza o esquema do banco de dados."""
+    versao = migrar()
+    click.echo(f'Esquema na versão {versao}')
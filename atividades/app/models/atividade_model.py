@@ -9,18 +9,21 @@ class Atividade(db.Model):
     peso_nota = db.Column(db.Integer)
     data_entrega = db.Column(db.Date)
 
-    turma_id = db.Column(db.Integer, nullable=False)
-    professor_id = db.Column(db.Integer, nullable=False)
+    turma_id = db.Column(db.Integer, nullable=False, index=True)
+    professor_id = db.Column(db.Integer, nullable=False, index=True)
 
     notas = db.relationship('Nota', back_populates='atividade', lazy=True, cascade="all, delete-orphan")
     
-    def to_dict(self):
-        return {
-            'id': self.id,
-            'nome': self.nome,
-            'descricao': self.descricao,
-            'peso_nota': self.peso_nota,
-            'data_entrega': str(self.data_entrega) if self.data_entrega else None,
-            'turma_id': self.turma_id,
-            'professor_id': self.professor_id
-        }
\ No newline at end of file
+    # Campos expostos pela API e como cada um é serializado (?fields= escolhe entre eles)
+    CAMPOS = {
+        'id': lambda atividade: atividade.id,
+        'nome': lambda atividade: atividade.nome,
+        'descricao': lambda atividade: atividade.descricao,
+        'peso_nota': lambda atividade: atividade.peso_nota,
+        'data_entrega': lambda atividade: str(atividade.data_entrega) if atividade.data_entrega else None,
+        'turma_id': lambda atividade: atividade.turma_id,
+        'professor_id': lambda atividade: atividade.professor_id
+    }
+
+    def to_dict(self, campos=None):
+        return {nome: valor(self) for nome, valor in self.CAMPOS.items() if campos is None or nome in campos}
\ No newline at end of file
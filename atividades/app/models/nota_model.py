@@ -6,16 +6,18 @@ class Nota(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     nota = db.Column(db.Float)
 
-    aluno_id = db.Column(db.Integer, nullable=False)
+    aluno_id = db.Column(db.Integer, nullable=False, index=True)
 
-    atividade_id = db.Column(db.Integer, db.ForeignKey('atividades.id'), nullable=False)
+    atividade_id = db.Column(db.Integer, db.ForeignKey('atividades.id'), nullable=False, index=True)
     atividade = db.relationship('Atividade', back_populates='notas')
 
-    def to_dict(self):
-        return {
-            'id': self.id,
-            'nota': self.nota,
-            'aluno_id': self.aluno_id,
-            'atividade_id': self.atividade_id,
-           
-        }
\ No newline at end of file
+    # Campos expostos pela API e como cada um é serializado (?fields= escolhe entre eles)
+    CAMPOS = {
+        'id': lambda nota: nota.id,
+        'nota': lambda nota: nota.nota,
+        'aluno_id': lambda nota: nota.aluno_id,
+        'atividade_id': lambda nota: nota.atividade_id
+    }
+
+    def to_dict(self, campos=None):
+        return {nome: valor(self) for nome, valor in self.CAMPOS.items() if campos is None or nome in campos}
\ No newline at end of file
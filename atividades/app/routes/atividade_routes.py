@@ -1,5 +1,8 @@
-from flask import Blueprint, jsonify, request
-from app.controllers import atividade_controller
+from flask import Blueprint, current_app, jsonify, request
+from app.controllers import atividade_controller, nota_controller
+from app.models.atividade_model import Atividade
+from app.utils.campos import ler_campos
+from app.utils.paginacao import ler_paginacao, resposta_paginada
 
 atividade_bp = Blueprint('atividade_bp', __name__, url_prefix='/atividades')
 
@@ -10,16 +13,34 @@ def get_atividades():
     ---
     tags:
       - Atividades
+    parameters:
+      - in: query
+        name: limit
+        type: integer
+        description: Quantidade de itens por página (o servidor aplica um máximo).
+      - in: query
+        name: after
+        type: integer
+        description: Cursor da página; retorna apenas itens com ID maior que este valor.
+      - in: query
+        name: fields
+        type: string
+        description: Campos a retornar, separados por vírgula (ex. id,nome).
     responses:
       200:
         description: Uma lista de todas as atividades
+        headers:
+          Link:
+            type: string
+            description: URL da próxima página (rel="next"), ausente na última página.
         schema:
           type: array
           items:
             $ref: '#/definitions/Atividade'
     """
-    atividades = atividade_controller.get_atividades()
-    return jsonify(atividades)
+    limite, apos = ler_paginacao()
+    atividades, proximo = atividade_controller.get_atividades(limite, apos, ler_campos(Atividade))
+    return resposta_paginada(atividades, proximo)
 
 @atividade_bp.route('/<int:atividade_id>', methods=['GET'])
 def get_atividade(atividade_id):
@@ -33,6 +54,10 @@ def get_atividade(atividade_id):
         name: atividade_id
         type: integer
         required: true
+      - in: query
+        name: fields
+        type: string
+        description: Campos a retornar, separados por vírgula (ex. id,nome).
     responses:
       200:
         description: Detalhes da atividade
@@ -41,7 +66,7 @@ def get_atividade(atividade_id):
       404:
         description: Atividade não encontrada
     """
-    atividade = atividade_controller.get_atividade(atividade_id)
+    atividade = atividade_controller.get_atividade(atividade_id, ler_campos(Atividade))
     if atividade:
         return jsonify(atividade)
     return jsonify({'error': 'Atividade não encontrada'}), 404
@@ -84,6 +109,8 @@ def create_atividade():
         description: Dados insuficientes
       404:
         description: Turma ou Professor não encontrado no serviço de gerenciamento
+      503:
+        description: Serviço de gerenciamento indisponível (timeout, erro ou disjuntor aberto)
     """
     data = request.get_json()
     if not data or not 'turma_id' in data or not 'professor_id' in data:
@@ -113,6 +140,8 @@ def update_atividade(atividade_id):
         description: Atividade atualizada com sucesso
       404:
         description: Atividade, Turma ou Professor não encontrado
+      503:
+        description: Serviço de gerenciamento indisponível (timeout, erro ou disjuntor aberto)
     """
     data = request.get_json()
     atividade, status_code = atividade_controller.update_atividade(atividade_id, data)
@@ -139,4 +168,84 @@ def delete_atividade(atividade_id):
     sucesso = atividade_controller.delete_atividade(atividade_id)
     if sucesso:
         return jsonify({'message': 'Atividade deletada com sucesso'})
-    return jsonify({'error': 'Atividade não encontrada'}), 404
\ No newline at end of file
+    return jsonify({'error': 'Atividade não encontrada'}), 404
+
+@atividade_bp.route('/<int:atividade_id>/notas/lote', methods=['POST'])
+def salvar_notas_em_lote(atividade_id):
+    """
+    Lança as notas de vários alunos em uma atividade, em uma única transação
+    ---
+    tags:
+      - Notas
+    parameters:
+      - in: path
+        name: atividade_id
+        type: integer
+        required: true
+      - in: body
+        name: body
+        required: true
+        schema:
+          type: array
+          items:
+            type: object
+            required:
+              - aluno_id
+              - nota
+            properties:
+              aluno_id:
+                type: integer
+              nota:
+                type: number
+                format: float
+    responses:
+      200:
+        description: >
+          Resultado de cada registro, na mesma ordem do envio: 201 para nota
+          criada, 200 para nota atualizada (o aluno já tinha nota na atividade).
+        schema:
+          type: object
+          properties:
+            criadas:
+              type: integer
+            atualizadas:
+              type: integer
+            falhas:
+              type: integer
+            resultados:
+              type: array
+              items:
+                type: object
+                properties:
+                  indice:
+                    type: integer
+                  status:
+                    type: integer
+                  nota:
+                    type: object
+                  error:
+                    type: string
+      400:
+        description: Corpo da requisição não é uma lista ou excede o tamanho máximo do lote.
+      404:
+        description: Atividade não encontrada
+      503:
+        description: Serviço de gerenciamento indisponível (timeout, erro ou disjuntor aberto)
+    """
+    data = request.get_json(silent=True)
+    if not isinstance(data, list) or not data:
+        return jsonify({'error': 'Dados insuficientes'}), 400
+    if len(data) > current_app.config['NOTAS_LOTE_MAXIMO']:
+        return jsonify({'error': 'Lote excede o tamanho máximo permitido'}), 400
+
+    resultados, status_code = nota_controller.salvar_notas_em_lote(atividade_id, data)
+    if status_code != 200:
+        return jsonify(resultados), status_code
+    criadas = sum(1 for resultado in resultados if resultado['status'] == 201)
+    atualizadas = sum(1 for resultado in resultados if resultado['status'] == 200)
+    return jsonify({
+        'criadas': criadas,
+        'atualizadas': atualizadas,
+        'falhas': len(resultados) - criadas - atualizadas,
+        'resultados': resultados
+    })
@@ -0,0 +1,18 @@
+from flask import Blueprint, jsonify
+from app.utils.cache import metricas_caches
+from app.utils.cliente_http import cliente_gerenciamento
+
+metricas_bp = Blueprint('metricas_bp', __name__, url_prefix='/metricas')
+
+@metricas_bp.route('/', methods=['GET'])
+def get_metricas():
+    """
+    Métricas internas deste worker
+    ---
+    tags:
+      - Métricas
+    responses:
+      200:
+        description: Caches de existência e chamadas ao Gerenciamento (falhas, latências média, p50, p95, p99, máxima, estado e transições do disjuntor)
+    """
+    return jsonify({'caches': metricas_caches(), 'http': [cliente_gerenciamento.metricas()]})
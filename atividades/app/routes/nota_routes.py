@@ -2,6 +2,10 @@
 
 from flask import Blueprint, request, jsonify
 from app.controllers import nota_controller
+from app.models.nota_model import Nota
+from app.utils.campos import ler_campos
+from app.utils.exportacao import quer_ndjson, resposta_ndjson
+from app.utils.paginacao import ler_paginacao, resposta_paginada
 
 nota_bp = Blueprint('nota_bp', __name__, url_prefix='/notas')
 
@@ -12,16 +16,42 @@ def get_notas():
     ---
     tags:
       - Notas
+    parameters:
+      - in: query
+        name: limit
+        type: integer
+        description: Quantidade de itens por página (o servidor aplica um máximo).
+      - in: query
+        name: after
+        type: integer
+        description: Cursor da página; retorna apenas itens com ID maior que este valor.
+      - in: query
+        name: stream
+        type: integer
+        enum: [1]
+        description: Exporta a coleção inteira em NDJSON (equivale a Accept application/x-ndjson).
+      - in: query
+        name: fields
+        type: string
+        description: Campos a retornar, separados por vírgula (ex. id,nome).
     responses:
       200:
         description: Uma lista de todas as notas
+        headers:
+          Link:
+            type: string
+            description: URL da próxima página (rel="next"), ausente na última página.
         schema:
           type: array
           items:
             $ref: '#/definitions/Nota'
     """
-    notas = nota_controller.get_notas()
-    return jsonify(notas)
+    if quer_ndjson():
+        return resposta_ndjson(nota_controller.exportar_notas(ler_campos(Nota)))
+
+    limite, apos = ler_paginacao()
+    notas, proximo = nota_controller.get_notas(limite, apos, ler_campos(Nota))
+    return resposta_paginada(notas, proximo)
 
 @nota_bp.route('/<int:nota_id>', methods=['GET'])
 def get_nota(nota_id):
@@ -35,6 +65,10 @@ def get_nota(nota_id):
         name: nota_id
         type: integer
         required: true
+      - in: query
+        name: fields
+        type: string
+        description: Campos a retornar, separados por vírgula (ex. id,nome).
     responses:
       200:
         description: Detalhes da nota
@@ -43,7 +77,7 @@ def get_nota(nota_id):
       404:
         description: Nota não encontrada
     """
-    nota = nota_controller.get_nota(nota_id)
+    nota = nota_controller.get_nota(nota_id, ler_campos(Nota))
     if nota:
         return jsonify(nota)
     return jsonify({'error': 'Nota não encontrada'}), 404
@@ -79,6 +113,8 @@ def create_nota():
         description: Dados insuficientes
       404:
         description: Aluno ou Atividade não encontrado
+      503:
+        description: Serviço de gerenciamento indisponível (timeout, erro ou disjuntor aberto)
     """
     data = request.get_json()
     if not data or not 'aluno_id' in data or not 'atividade_id' in data:
@@ -108,6 +144,8 @@ def update_nota(nota_id):
         description: Nota atualizada com sucesso
       404:
         description: Nota, Aluno ou Atividade não encontrado
+      503:
+        description: Serviço de gerenciamento indisponível (timeout, erro ou disjuntor aberto)
     """
     data = request.get_json()
     nota, status_code = nota_controller.update_nota(nota_id, data)
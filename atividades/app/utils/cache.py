@@ -0,0 +1,178 @@
+import threading
+import time
+from collections import OrderedDict
+from app.utils.cliente_http import cliente_gerenciamento
+from app.utils.serializacao import ler_corpo
+
+class CacheTTL:
+    """Cache LRU limitado, com expiração por tempo (TTL) e contadores de uso.
+
+    Funciona como read-through: `obter(chave, carregar)` devolve o valor em
+    cache ou chama `carregar()` e guarda o resultado. Resultados negativos
+    (falsy) ficam só `ttl_negativo` segundos, para que um registro criado
+    depois apareça logo; exceções de `carregar` não são guardadas.
+
+    Cada invalidação incrementa a geração do cache; um resultado carregado
+    enquanto a geração mudou é devolvido mas não é guardado, para que uma
+    invalidação vinda do log de alterações no meio da consulta não seja
+    desfeita por um valor já velho.
+    """
+
+    def __init__(self, nome, tamanho_maximo=4096, ttl=60, ttl_negativo=5):
+        self.nome = nome
+        self.tamanho_maximo = tamanho_maximo
+        self.ttl = ttl
+        self.ttl_negativo = ttl_negativo
+        self._itens = OrderedDict()
+        self._lock = threading.Lock()
+        self.acertos = 0
+        self.falhas = 0
+        self.expulsoes = 0
+        self.invalidacoes = 0
+        self._geracao = 0
+
+    def configurar(self, tamanho_maximo, ttl, ttl_negativo):
+        with self._lock:
+            self.tamanho_maximo = tamanho_maximo
+            self.ttl = ttl
+            self.ttl_negativo = ttl_negativo
+            self._itens.clear()
+            self._geracao += 1
+
+    def obter(self, chave, carregar):
+        agora = time.monotonic()
+        with self._lock:
+            item = self._itens.get(chave)
+            if item is not None and item[0] > agora:
+                self._itens.move_to_end(chave)
+                self.acertos += 1
+                return item[1]
+            self.falhas += 1
+            geracao = self._geracao
+
+        valor = carregar()
+        self.guardar(chave, valor, geracao)
+        return valor
+
+    def obter_varios(self, chaves, carregar):
+        """Como `obter`, para várias chaves de uma vez.
+
+        `carregar(faltantes)` recebe só as chaves fora do cache e retorna
+        {chave: valor} para todas elas; o resultado tem todas as chaves pedidas.
+        """
+        agora = time.monotonic()
+        valores = {}
+        faltantes = []
+        with self._lock:
+            for chave in dict.fromkeys(chaves):
+                item = self._itens.get(chave)
+                if item is not None and item[0] > agora:
+                    self._itens.move_to_end(chave)
+                    self.acertos += 1
+                    valores[chave] = item[1]
+                else:
+                    self.falhas += 1
+                    faltantes.append(chave)
+            geracao = self._geracao
+
+        if faltantes:
+            carregados = carregar(faltantes)
+            for chave in faltantes:
+                self.guardar(chave, carregados[chave], geracao)
+                valores[chave] = carregados[chave]
+        return valores
+
+    def guardar(self, chave, valor, geracao=None):
+        """Guarda o valor; com `geracao`, só se nada foi invalidado desde que ela foi lida."""
+        ttl = self.ttl if valor else self.ttl_negativo
+        with self._lock:
+            if geracao is not None and geracao != self._geracao:
+                return
+            self._itens[chave] = (time.monotonic() + ttl, valor)
+            self._itens.move_to_end(chave)
+            while len(self._itens) > self.tamanho_maximo:
+                self._itens.popitem(last=False)
+                self.expulsoes += 1
+
+    def invalidar(self, chave):
+        with self._lock:
+            # Mesmo sem a entrada: uma consulta a esta chave pode estar em andamento
+            self._geracao += 1
+            if self._itens.pop(chave, None) is not None:
+                self.invalidacoes += 1
+
+    def limpar(self):
+        with self._lock:
+            self._itens.clear()
+            self._geracao += 1
+
+    def metricas(self):
+        with self._lock:
+            consultas = self.acertos + self.falhas
+            return {
+                'nome': self.nome,
+                'itens': len(self._itens),
+                'tamanho_maximo': self.tamanho_maximo,
+                'ttl': self.ttl,
+                'ttl_negativo': self.ttl_negativo,
+                'acertos': self.acertos,
+                'falhas': self.falhas,
+                'expulsoes': self.expulsoes,
+                'invalidacoes': self.invalidacoes,
+                'taxa_acerto': self.acertos / consultas if consultas else None
+            }
+
+# Existência de turmas, professores e alunos no Gerenciamento, por recurso (chave: id em texto)
+CACHES = {nome: CacheTTL(nome) for nome in ('turmas', 'professores', 'alunos')}
+
+def configurar_caches(app):
+    for cache in CACHES.values():
+        cache.configurar(app.config['CACHE_TAMANHO_MAXIMO'], app.config['CACHE_TTL'], app.config['CACHE_TTL_NEGATIVO'])
+
+def invalidar_alteracoes(alteracoes):
+    """Gancho de invalidação: descarta as entradas afetadas por alterações do Gerenciamento.
+
+    Recebe entradas no formato de GET /changes ({'recurso', 'id', ...}). Criações
+    também invalidam, para derrubar um resultado negativo ainda em cache.
+    """
+    for alteracao in alteracoes:
+        cache = CACHES.get(alteracao['recurso'])
+        if cache is not None:
+            cache.invalidar(str(alteracao['id']))
+
+def _ler_alteracoes(desde, limite):
+    resposta = cliente_gerenciamento.get('/changes/', params={'since': desde, 'limit': limite})
+    resposta.raise_for_status()
+    return ler_corpo(resposta)
+
+def iniciar_invalidacao(app):
+    """Acompanha o log de alterações do Gerenciamento em uma thread de fundo (uma por worker).
+
+    Começa do seq atual: o que este worker guardar em cache já é mais novo que ele.
+    """
+    intervalo = app.config['INVALIDACAO_INTERVALO']
+    if not intervalo:
+        return None
+
+    def executar():
+        desde = None
+        while True:
+            try:
+                if desde is None:
+                    desde = _ler_alteracoes(0, 1)['seq_atual']
+                mais = True
+                while mais:
+                    pagina = _ler_alteracoes(desde, app.config['INVALIDACAO_LOTE'])
+                    invalidar_alteracoes(pagina['alteracoes'])
+                    desde, mais = pagina['ultimo_seq'], pagina['mais']
+            except Exception as erro:
+                # Sem o log, as entradas continuam expirando pelo TTL
+                app.logger.warning('Falha ao ler alterações do Gerenciamento: %s', erro)
+            time.sleep(intervalo)
+
+    thread = threading.Thread(target=executar, name='invalidacao-caches', daemon=True)
+    thread.start()
+    return thread
+
+def metricas_caches():
+    return [cache.metricas() for cache in CACHES.values()]
@@ -0,0 +1,188 @@
+import os
+import threading
+import time
+from collections import deque
+import requests
+from requests.adapters import HTTPAdapter
+from app.utils.disjuntor import Disjuntor
+from app.utils.serializacao import CABECALHOS_ENTRE_SERVICOS
+
+class _ChamadaEmAndamento:
+    """Resultado de uma chamada compartilhado com as threads que pediram a mesma coisa."""
+
+    def __init__(self):
+        self.concluida = threading.Event()
+        self.resposta = None
+        self.erro = None
+
+class ClienteHTTP:
+    """Cliente das chamadas a outro serviço, compartilhado pelo worker.
+
+    Mantém uma `requests.Session` por processo (conexões keep-alive em um pool
+    de tamanho configurado), aplica sempre os timeouts de conexão e de leitura
+    da configuração e registra a latência de cada chamada, por recurso.
+
+    GETs idênticos (mesmo caminho e parâmetros) feitos ao mesmo tempo por
+    threads do worker são agrupados (single-flight): só a primeira vai ao
+    serviço, e as demais esperam e recebem a mesma resposta ou o mesmo erro.
+
+    Todas as chamadas passam pelo disjuntor do serviço: com ele aberto, `get` e `post`
+    levantam CircuitoAberto (uma requests.RequestException) sem ir à rede.
+    """
+
+    # Latências guardadas por recurso para calcular os percentis
+    AMOSTRAS = 1000
+
+    def __init__(self, nome):
+        self.nome = nome
+        self.url_base = None
+        self.timeout = None
+        self.tamanho_pool = 10
+        self._sessao = None
+        self._pid = None
+        self._lock = threading.Lock()
+        self._metricas = {}
+        self._em_andamento = {}
+        self.disjuntor = Disjuntor(nome)
+
+    def configurar(self, url_base, timeout_conexao, timeout_leitura, tamanho_pool):
+        with self._lock:
+            self.url_base = url_base.rstrip('/')
+            self.timeout = (timeout_conexao, timeout_leitura)
+            self.tamanho_pool = tamanho_pool
+            self._sessao = None
+
+    def _obter_sessao(self):
+        # Uma sessão por processo: o pool de conexões não é compartilhado entre workers após o fork
+        with self._lock:
+            if self._sessao is None or self._pid != os.getpid():
+                sessao = requests.Session()
+                adaptador = HTTPAdapter(pool_connections=1, pool_maxsize=self.tamanho_pool)
+                sessao.mount('http://', adaptador)
+                sessao.mount('https://', adaptador)
+                sessao.headers.update(CABECALHOS_ENTRE_SERVICOS)
+                self._sessao = sessao
+                self._pid = os.getpid()
+            return self._sessao
+
+    def get(self, caminho, **kwargs):
+        """GET em url_base + caminho; levanta requests.RequestException em falha de rede ou timeout."""
+        recurso = caminho.strip('/').split('/')[0]
+        chave = (caminho, tuple(sorted((kwargs.get('params') or {}).items())))
+        with self._lock:
+            chamada = self._em_andamento.get(chave)
+            lider = chamada is None
+            if lider:
+                chamada = self._em_andamento[chave] = _ChamadaEmAndamento()
+            else:
+                self._metrica(recurso)['agrupadas'] += 1
+
+        if not lider:
+            # A chamada da outra thread já tem timeout, então a espera é limitada
+            chamada.concluida.wait()
+            if chamada.erro is not None:
+                raise chamada.erro
+            return chamada.resposta
+
+        try:
+            # Sem stream, o corpo já chega lido: a mesma resposta pode ser usada por várias threads
+            chamada.resposta = self._executar('GET', recurso, caminho, **kwargs)
+            return chamada.resposta
+        except Exception as erro:
+            chamada.erro = erro
+            raise
+        finally:
+            with self._lock:
+                del self._em_andamento[chave]
+            chamada.concluida.set()
+
+    def post(self, caminho, **kwargs):
+        """POST em url_base + caminho (sem agrupamento); levanta requests.RequestException como `get`."""
+        return self._executar('POST', caminho.strip('/').split('/')[0], caminho, **kwargs)
+
+    def _executar(self, metodo, recurso, caminho, **kwargs):
+        kwargs.setdefault('timeout', self.timeout)
+        self.disjuntor.permitir()
+        inicio = time.perf_counter()
+        try:
+            resposta = self._obter_sessao().request(metodo, self.url_base + caminho, **kwargs)
+        except BaseException:
+            # Qualquer exceção conta como falha: sem o registro, um teste do disjuntor
+            # meio aberto nunca liberaria a vaga e todas as chamadas seriam recusadas
+            self._registrar(recurso, time.perf_counter() - inicio, falha=True)
+            raise
+        self._registrar(recurso, time.perf_counter() - inicio, falha=resposta.status_code >= 500)
+        return resposta
+
+    def _metrica(self, recurso):
+        # Chamado com self._lock adquirido
+        metrica = self._metricas.get(recurso)
+        if metrica is None:
+            metrica = self._metricas[recurso] = {
+                'chamadas': 0, 'falhas': 0, 'agrupadas': 0, 'tempo_total': 0.0, 'tempo_maximo': 0.0,
+                'amostras': deque(maxlen=self.AMOSTRAS)
+            }
+        return metrica
+
+    def _registrar(self, recurso, duracao, falha):
+        if falha:
+            self.disjuntor.registrar_falha()
+        else:
+            self.disjuntor.registrar_sucesso()
+        with self._lock:
+            metrica = self._metrica(recurso)
+            metrica['chamadas'] += 1
+            metrica['falhas'] += falha
+            metrica['tempo_total'] += duracao
+            metrica['tempo_maximo'] = max(metrica['tempo_maximo'], duracao)
+            metrica['amostras'].append(duracao)
+
+    def metricas(self):
+        """Latências em milissegundos; percentis sobre as últimas chamadas de cada recurso.
+
+        `agrupadas` conta as chamadas que aproveitaram a resposta de outra já em
+        andamento e não foram ao serviço.
+        """
+        def percentil(amostras, p):
+            return round(amostras[min(len(amostras) - 1, int(len(amostras) * p))] * 1000, 2)
+
+        with self._lock:
+            recursos = {}
+            for recurso, metrica in self._metricas.items():
+                amostras = sorted(metrica['amostras'])
+                if not amostras:
+                    # Só chamadas agrupadas até agora; a primeira ainda não terminou
+                    continue
+                recursos[recurso] = {
+                    'chamadas': metrica['chamadas'],
+                    'falhas': metrica['falhas'],
+                    'agrupadas': metrica['agrupadas'],
+                    'media_ms': round(metrica['tempo_total'] / metrica['chamadas'] * 1000, 2),
+                    'p50_ms': percentil(amostras, 0.5),
+                    'p95_ms': percentil(amostras, 0.95),
+                    'p99_ms': percentil(amostras, 0.99),
+                    'maximo_ms': round(metrica['tempo_maximo'] * 1000, 2)
+                }
+            return {
+                'nome': self.nome,
+                'url_base': self.url_base,
+                'timeout': self.timeout,
+                'tamanho_pool': self.tamanho_pool,
+                'disjuntor': self.disjuntor.metricas(),
+                'recursos': recursos
+            }
+
+cliente_gerenciamento = ClienteHTTP('gerenciamento')
+
+def configurar_cliente_http(app):
+    cliente_gerenciamento.configurar(
+        app.config['SERVICO_GERENCIAMENTO_URL'],
+        app.config['HTTP_TIMEOUT_CONEXAO'],
+        app.config['HTTP_TIMEOUT_LEITURA'],
+        app.config['HTTP_POOL_TAMANHO']
+    )
+    cliente_gerenciamento.disjuntor.configurar(
+        app.config['DISJUNTOR_LIMITE_FALHAS'],
+        app.config['DISJUNTOR_TEMPO_ABERTO'],
+        app.config['DISJUNTOR_TESTES']
+    )
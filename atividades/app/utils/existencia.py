@@ -0,0 +1,86 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+import requests
+from flask import current_app
+from app.utils.cache import CACHES
+from app.utils.cliente_http import cliente_gerenciamento
+from app.utils.serializacao import ler_corpo
+
+class GerenciamentoIndisponivel(Exception):
+    """O Gerenciamento não respondeu (erro de rede, timeout, 5xx ou disjuntor aberto)."""
+
+# Resposta dos controllers quando a validação não pôde ser feita
+ERRO_GERENCIAMENTO_INDISPONIVEL = {'error': 'Não foi possível validar os dados: serviço de gerenciamento indisponível'}, 503
+
+def existe_no_gerenciamento(recurso, recurso_id):
+    """Consulta (com cache) se o registro existe no Gerenciamento.
+
+    404 é um resultado (negativo, guardado por menos tempo); falhas de rede,
+    respostas 5xx e o disjuntor aberto levantam GerenciamentoIndisponivel e
+    não vão para o cache.
+    """
+    chave = str(recurso_id)
+
+    def consultar():
+        resposta = cliente_gerenciamento.get(f"/{recurso}/{chave}")
+        if resposta.status_code == 404:
+            return False
+        resposta.raise_for_status()
+        return True
+
+    try:
+        return CACHES[recurso].obter(chave, consultar)
+    except requests.RequestException as erro:
+        raise GerenciamentoIndisponivel() from erro
+
+def existentes_no_gerenciamento(recurso, ids):
+    """Conjunto dos ids que existem no Gerenciamento.
+
+    Os ids fora do cache são consultados juntos, em um só POST /<recurso>/exists,
+    e os resultados (positivos e negativos) vão para o cache como os de
+    `existe_no_gerenciamento`.
+    """
+    def consultar(chaves):
+        resposta = cliente_gerenciamento.post(f"/{recurso}/exists", json={'ids': [int(chave) for chave in chaves]})
+        resposta.raise_for_status()
+        encontrados = {str(recurso_id) for recurso_id in ler_corpo(resposta)['ids']}
+        return {chave: chave in encontrados for chave in chaves}
+
+    try:
+        valores = CACHES[recurso].obter_varios([str(recurso_id) for recurso_id in ids], consultar)
+    except (requests.RequestException, ValueError, KeyError) as erro:
+        raise GerenciamentoIndisponivel() from erro
+    return {recurso_id for recurso_id in ids if valores[str(recurso_id)]}
+
+_executor = None
+_executor_pid = None
+_executor_lock = threading.Lock()
+
+def _obter_executor():
+    # Um pool por processo: as threads do pool não sobrevivem ao fork dos workers
+    global _executor, _executor_pid
+    with _executor_lock:
+        if _executor is None or _executor_pid != os.getpid():
+            _executor = ThreadPoolExecutor(current_app.config['VALIDACAO_THREADS'], thread_name_prefix='validacao')
+            _executor_pid = os.getpid()
+        return _executor
+
+def existem_no_gerenciamento(*consultas):
+    """Faz as consultas (recurso, id) ao mesmo tempo e retorna os resultados na mesma ordem.
+
+    Todas dividem um único prazo, VALIDACAO_PRAZO: a validação custa a consulta
+    mais lenta, não a soma delas. Se alguma falhar ou o prazo acabar, levanta
+    GerenciamentoIndisponivel.
+    """
+    if len(consultas) <= 1:
+        # Uma consulta só não precisa do pool; o timeout do cliente HTTP já a limita
+        return [existe_no_gerenciamento(recurso, recurso_id) for recurso, recurso_id in consultas]
+
+    executor = _obter_executor()
+    futuros = [executor.submit(existe_no_gerenciamento, recurso, recurso_id) for recurso, recurso_id in consultas]
+    _, pendentes = wait(futuros, timeout=current_app.config['VALIDACAO_PRAZO'])
+    if pendentes:
+        # As consultas pendentes terminam sozinhas, limitadas pelo timeout do cliente HTTP
+        raise GerenciamentoIndisponivel()
+    return [futuro.result() for futuro in futuros]
@@ -0,0 +1,41 @@
+from flask import abort, current_app, jsonify, make_response, request, url_for
+
+def ler_paginacao():
+    """Lê ?limit= e ?after= da requisição, aplicando o limite máximo do servidor."""
+    try:
+        limite = int(request.args.get('limit', current_app.config['PAGINACAO_LIMITE_PADRAO']))
+        apos = request.args.get('after')
+        apos = int(apos) if apos is not None else None
+    except ValueError:
+        limite = 0
+
+    if limite < 1:
+        abort(make_response(jsonify({'error': 'Parâmetros de paginação inválidos'}), 400))
+
+    return min(limite, current_app.config['PAGINACAO_LIMITE_MAXIMO']), apos
+
+def paginar(query, coluna_id, limite, apos=None):
+    """Paginação por chave (keyset): WHERE id > after ORDER BY id LIMIT n.
+
+    Retorna a página e o cursor da próxima página (None na última).
+    """
+    if apos is not None:
+        query = query.filter(coluna_id > apos)
+
+    itens = query.order_by(coluna_id).limit(limite + 1).all()
+    if len(itens) <= limite:
+        return itens, None
+
+    itens = itens[:limite]
+    return itens, getattr(itens[-1], coluna_id.key)
+
+def resposta_paginada(itens, proximo):
+    """Monta a resposta da lista com os links da próxima página nos cabeçalhos."""
+    resposta = jsonify(itens)
+    if proximo is not None:
+        args = request.args.to_dict()
+        args['after'] = proximo
+        link = url_for(request.endpoint, _external=True, **(request.view_args or {}), **args)
+        resposta.headers['Link'] = f'<{link}>; rel="next"'
+        resposta.headers['X-Next-Cursor'] = str(proximo)
+    return resposta
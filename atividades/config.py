@@ -4,4 +4,56 @@ class Config:
     SQLALCHEMY_DATABASE_URI = 'sqlite:///atividades.db'
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     SECRET_KEY = os.urandom(24)
-    
\ No newline at end of file
+
+    # Perfil de produção do SQLite, aplicado a cada conexão (ver app/utils/sqlite.py).
+    # WAL permite leituras durante uma escrita; busy_timeout faz o worker esperar
+    # pelo lock em vez de falhar com "database is locked".
+    SQLITE_PRAGMAS = {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'busy_timeout': 5000,
+        'cache_size': -8000,
+        'mmap_size': 134217728,
+    }
+
+    # Paginação das listas (?limit=&after=)
+    PAGINACAO_LIMITE_PADRAO = 100
+    PAGINACAO_LIMITE_MAXIMO = 1000
+
+    # Exportação em NDJSON: registros lidos do banco por lote
+    EXPORTACAO_TAMANHO_LOTE = 1000
+
+    SERVICO_GERENCIAMENTO_URL = os.environ.get('SERVICO_GERENCIAMENTO_URL', 'http://localhost:5001')
+
+    # Chamadas ao Gerenciamento (app/utils/cliente_http.py): timeouts em segundos e
+    # conexões keep-alive mantidas por worker
+    HTTP_TIMEOUT_CONEXAO = float(os.environ.get('HTTP_TIMEOUT_CONEXAO', 1))
+    HTTP_TIMEOUT_LEITURA = float(os.environ.get('HTTP_TIMEOUT_LEITURA', 3))
+    HTTP_POOL_TAMANHO = 10
+    # Disjuntor: abre após DISJUNTOR_LIMITE_FALHAS falhas seguidas (erro de rede, timeout
+    # ou 5xx) e recusa as chamadas na hora por DISJUNTOR_TEMPO_ABERTO segundos; depois
+    # deixa passar DISJUNTOR_TESTES chamadas de teste antes de voltar a fechar
+    DISJUNTOR_LIMITE_FALHAS = int(os.environ.get('DISJUNTOR_LIMITE_FALHAS', 5))
+    DISJUNTOR_TEMPO_ABERTO = float(os.environ.get('DISJUNTOR_TEMPO_ABERTO', 10))
+    DISJUNTOR_TESTES = 1
+
+    # Cache (por worker) da existência de turmas, professores e alunos no Gerenciamento.
+    # Resultados negativos ficam menos tempo, para que um cadastro novo apareça logo.
+    CACHE_TAMANHO_MAXIMO = 4096
+    CACHE_TTL = int(os.environ.get('CACHE_TTL', 60))
+    CACHE_TTL_NEGATIVO = int(os.environ.get('CACHE_TTL_NEGATIVO', 5))
+    # Leitura do log de alterações (GET /changes) que invalida o cache; 0 desativa a thread
+    INVALIDACAO_INTERVALO = int(os.environ.get('INVALIDACAO_INTERVALO', 2))
+    INVALIDACAO_LOTE = 1000
+
+    # Validações que consultam vários registros no Gerenciamento rodam em paralelo,
+    # em um pool por worker, com um prazo único (em segundos) para todas
+    VALIDACAO_PRAZO = float(os.environ.get('VALIDACAO_PRAZO', 3))
+    VALIDACAO_THREADS = 8
+
+    # Quantidade máxima de notas por requisição em POST /atividades/<id>/notas/lote;
+    # não deve passar do EXISTENCIA_IDS_MAXIMO do Gerenciamento (POST /alunos/exists)
+    NOTAS_LOTE_MAXIMO = 1000
+
+    # Especificação OpenAPI gerada no build (flask --app app gerar-apispec) e servida da memória
+    APISPEC_ARQUIVO = os.environ.get('APISPEC_ARQUIVO', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'apispec.json'))
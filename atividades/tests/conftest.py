@@ -0,0 +1,63 @@
+import threading
+import pytest
+from flask import Flask
+from werkzeug.serving import make_server
+from config import Config
+from app import create_app, db
+from app.utils.cliente_http import cliente_gerenciamento
+from app.utils.disjuntor import Disjuntor
+
+class GerenciamentoFalso:
+    """Gerenciamento local para os testes: responde, falha (500) ou trava, conforme `modo`."""
+
+    def __init__(self):
+        self.modo = 'responder'
+        self.chamadas = 0
+        self._liberar = threading.Event()
+        stub = Flask('gerenciamento_falso')
+
+        @stub.get('/<recurso>/<int:recurso_id>')
+        def detalhe(recurso, recurso_id):
+            self.chamadas += 1
+            if self.modo == 'falhar':
+                return {'error': 'Falha simulada'}, 500
+            if self.modo == 'travar':
+                self._liberar.wait(10)
+            return {'id': recurso_id}
+
+        self._servidor = make_server('127.0.0.1', 0, stub, threaded=True)
+        self.url = f'http://127.0.0.1:{self._servidor.server_port}'
+        threading.Thread(target=self._servidor.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True).start()
+
+    def encerrar(self):
+        self._liberar.set()
+        self._servidor.shutdown()
+
+@pytest.fixture
+def gerenciamento():
+    stub = GerenciamentoFalso()
+    yield stub
+    stub.encerrar()
+
+@pytest.fixture
+def app(tmp_path, monkeypatch, gerenciamento):
+    class ConfigTeste(Config):
+        TESTING = True
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'teste.db'}"
+        SERVICO_GERENCIAMENTO_URL = gerenciamento.url
+        HTTP_TIMEOUT_LEITURA = 0.3
+        DISJUNTOR_LIMITE_FALHAS = 3
+        DISJUNTOR_TEMPO_ABERTO = 0.2
+
+    # O cliente é do módulo: cada teste começa com um disjuntor novo (fechado)
+    monkeypatch.setattr(cliente_gerenciamento, 'disjuntor', Disjuntor('gerenciamento'))
+    app = create_app(ConfigTeste)
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.engine.dispose()
+
+@pytest.fixture
+def cliente(app):
+    return app.test_client()
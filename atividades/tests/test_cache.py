@@ -0,0 +1,52 @@
+"""CacheTTL: uma invalidação durante a consulta não pode ser desfeita pelo resultado dela."""
+from app.utils.cache import CacheTTL
+
+def carregar_contando(valor, durante=None):
+    """`carregar` que conta as chamadas e, opcionalmente, executa `durante` no meio da consulta."""
+    chamadas = []
+
+    def carregar(*args):
+        chamadas.append(args)
+        if durante:
+            durante()
+        return valor(*args) if callable(valor) else valor
+
+    return carregar, chamadas
+
+def test_guarda_o_resultado_sem_invalidacao():
+    cache = CacheTTL('teste')
+    carregar, chamadas = carregar_contando(True)
+
+    assert cache.obter('1', carregar) is True
+    assert cache.obter('1', carregar) is True
+    assert len(chamadas) == 1
+
+def test_invalidacao_durante_obter_nao_guarda_o_resultado():
+    cache = CacheTTL('teste')
+    carregar, _ = carregar_contando(True, durante=lambda: cache.invalidar('1'))
+
+    assert cache.obter('1', carregar) is True
+    assert cache.metricas()['itens'] == 0
+
+    carregar_de_novo, chamadas = carregar_contando(False)
+    assert cache.obter('1', carregar_de_novo) is False
+    assert len(chamadas) == 1
+
+def test_invalidacao_durante_obter_varios_nao_guarda_o_resultado():
+    cache = CacheTTL('teste')
+    cache.obter('2', lambda: True)
+    carregar, chamadas = carregar_contando(
+        lambda faltantes: dict.fromkeys(faltantes, True), durante=lambda: cache.invalidar('1')
+    )
+
+    assert cache.obter_varios(['1', '2', '3'], carregar) == {'1': True, '2': True, '3': True}
+    assert chamadas == [(['1', '3'],)]
+    # Só a entrada guardada antes da consulta continua valendo
+    assert cache.metricas()['itens'] == 1
+
+def test_limpar_durante_obter_nao_guarda_o_resultado():
+    cache = CacheTTL('teste')
+    carregar, _ = carregar_contando(True, durante=cache.limpar)
+
+    cache.obter('1', carregar)
+    assert cache.metricas()['itens'] == 0
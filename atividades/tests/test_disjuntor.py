@@ -0,0 +1,132 @@
+"""Disjuntor das chamadas ao Gerenciamento (app/utils/disjuntor.py), contra um Gerenciamento local."""
+import threading
+import time
+import pytest
+import requests
+from app.utils.cliente_http import cliente_gerenciamento
+from app.utils.disjuntor import ABERTO, FECHADO, MEIO_ABERTO, CircuitoAberto
+
+def abrir(gerenciamento):
+    gerenciamento.modo = 'falhar'
+    for turma_id in range(3):
+        assert cliente_gerenciamento.get(f'/turmas/{turma_id}').status_code == 500
+    assert cliente_gerenciamento.disjuntor.estado == ABERTO
+
+def test_abre_apos_o_limite_de_falhas(app, gerenciamento):
+    gerenciamento.modo = 'falhar'
+    for turma_id in range(2):
+        cliente_gerenciamento.get(f'/turmas/{turma_id}')
+    assert cliente_gerenciamento.disjuntor.estado == FECHADO
+
+    cliente_gerenciamento.get('/turmas/2')
+    assert cliente_gerenciamento.disjuntor.estado == ABERTO
+    with pytest.raises(CircuitoAberto):
+        cliente_gerenciamento.get('/turmas/3')
+    assert gerenciamento.chamadas == 3
+
+def test_sucesso_zera_as_falhas_seguidas(app, gerenciamento):
+    gerenciamento.modo = 'falhar'
+    for turma_id in range(2):
+        cliente_gerenciamento.get(f'/turmas/{turma_id}')
+    gerenciamento.modo = 'responder'
+    cliente_gerenciamento.get('/turmas/2')
+    gerenciamento.modo = 'falhar'
+    for turma_id in range(3, 5):
+        cliente_gerenciamento.get(f'/turmas/{turma_id}')
+    assert cliente_gerenciamento.disjuntor.estado == FECHADO
+
+def test_aberto_responde_503_sem_esperar(app, cliente, gerenciamento):
+    abrir(gerenciamento)
+    gerenciamento.modo = 'travar'
+
+    inicio = time.perf_counter()
+    resposta = cliente.post('/atividades/', json={'nome': 'Prova', 'turma_id': 10, 'professor_id': 10})
+    duracao = time.perf_counter() - inicio
+
+    assert resposta.status_code == 503
+    assert 'indisponível' in resposta.get_json()['error']
+    # Bem abaixo do timeout de leitura (0,3 s), e sem chegar ao serviço
+    assert duracao < 0.1
+    assert gerenciamento.chamadas == 3
+
+def test_meio_aberto_fecha_com_teste_bem_sucedido(app, gerenciamento):
+    abrir(gerenciamento)
+    time.sleep(0.25)
+    gerenciamento.modo = 'responder'
+
+    assert cliente_gerenciamento.get('/turmas/1').status_code == 200
+    metricas = cliente_gerenciamento.disjuntor.metricas()
+    assert metricas['estado'] == FECHADO
+    assert metricas['transicoes'] == {'fechado->aberto': 1, 'aberto->meio_aberto': 1, 'meio_aberto->fechado': 1}
+
+def test_meio_aberto_reabre_com_teste_que_falha(app, gerenciamento):
+    abrir(gerenciamento)
+    time.sleep(0.25)
+
+    assert cliente_gerenciamento.get('/turmas/1').status_code == 500
+    assert cliente_gerenciamento.disjuntor.estado == ABERTO
+    with pytest.raises(CircuitoAberto):
+        cliente_gerenciamento.get('/turmas/2')
+    assert cliente_gerenciamento.disjuntor.metricas()['transicoes']['meio_aberto->aberto'] == 1
+
+def test_meio_aberto_deixa_passar_um_teste_por_vez(app, gerenciamento):
+    abrir(gerenciamento)
+    time.sleep(0.25)
+    gerenciamento.modo = 'travar'
+
+    erros = []
+
+    def chamada_de_teste():
+        try:
+            cliente_gerenciamento.get('/turmas/1')
+        except requests.RequestException as erro:
+            erros.append(erro)
+
+    teste = threading.Thread(target=chamada_de_teste)
+    teste.start()
+    time.sleep(0.05)
+    assert cliente_gerenciamento.disjuntor.estado == MEIO_ABERTO
+    with pytest.raises(CircuitoAberto):
+        cliente_gerenciamento.get('/turmas/2')
+    teste.join()
+
+    assert len(erros) == 1 and isinstance(erros[0], requests.Timeout)
+    assert cliente_gerenciamento.disjuntor.estado == ABERTO
+
+def test_excecao_fora_do_requests_libera_o_teste(app, gerenciamento, monkeypatch):
+    """Uma exceção que não é RequestException conta como falha do teste e não prende a vaga."""
+    abrir(gerenciamento)
+    time.sleep(0.25)
+
+    def request_com_erro(*_args, **_kwargs):
+        raise ValueError('Erro fora do requests')
+
+    with monkeypatch.context() as contexto:
+        contexto.setattr(requests.Session, 'request', request_com_erro)
+        with pytest.raises(ValueError):
+            cliente_gerenciamento.get('/turmas/1')
+    assert cliente_gerenciamento.disjuntor.estado == ABERTO
+
+    time.sleep(0.25)
+    gerenciamento.modo = 'responder'
+    assert cliente_gerenciamento.get('/turmas/1').status_code == 200
+    assert cliente_gerenciamento.disjuntor.estado == FECHADO
+
+def test_travamento_limitado_pelo_timeout_de_leitura(app, gerenciamento):
+    gerenciamento.modo = 'travar'
+    inicio = time.perf_counter()
+    with pytest.raises(requests.Timeout):
+        cliente_gerenciamento.get('/turmas/1')
+    duracao = time.perf_counter() - inicio
+
+    assert app.config['HTTP_TIMEOUT_LEITURA'] <= duracao < app.config['HTTP_TIMEOUT_LEITURA'] + 0.2
+
+def test_estado_nas_metricas(app, cliente, gerenciamento):
+    abrir(gerenciamento)
+    with pytest.raises(CircuitoAberto):
+        cliente_gerenciamento.get('/turmas/9')
+
+    disjuntor = cliente.get('/metricas/').get_json()['http'][0]['disjuntor']
+    assert disjuntor['estado'] == ABERTO
+    assert disjuntor['recusadas'] == 1
+    assert disjuntor['ultimas_transicoes'][-1]['transicao'] == 'fechado->aberto'
@@ -0,0 +1,101 @@
+"""Tempo para apagar uma turma (Gerenciamento) e uma atividade (atividades) com cada vez mais filhos.
+
+Uso, a partir da raiz do repositório:
+
+    python scripts/benchmark_delete.py [--filhos 100 2000 20000] [--repeticoes 3]
+
+Cada serviço roda em um subprocesso, no seu próprio diretório (os pacotes dos
+serviços se chamam todos `app`), com um banco SQLite temporário e o perfil de
+PRAGMAs da configuração. Os filhos são inseridos em lote antes de cada medição,
+e o tempo medido é só o da chamada ao controller (DELETEs + commit); é mostrado
+o menor tempo entre as repetições.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+PREAMBULO = '''
+import json, os, sys, time
+from config import Config
+from app import create_app, db
+
+class ConfigBenchmark(Config):
+    SQLALCHEMY_DATABASE_URI = 'sqlite:///' + os.path.join(sys.argv[1], 'benchmark.db')
+    CACHE_COMPARTILHADO_ARQUIVO = os.path.join(sys.argv[1], 'cache.db')
+
+filhos_por_medicao, repeticoes = json.loads(sys.argv[2]), int(sys.argv[3])
+app = create_app(ConfigBenchmark)
+app.app_context().push()
+db.create_all()
+
+def medir(criar, apagar):
+    for filhos in filhos_por_medicao:
+        tempos = []
+        for _ in range(repeticoes):
+            pai_id = criar(filhos)
+            inicio = time.perf_counter()
+            apagar(pai_id)
+            tempos.append(time.perf_counter() - inicio)
+        print(json.dumps({'filhos': filhos, 'ms': round(min(tempos) * 1000, 1)}), flush=True)
+'''
+
+MEDICOES = {
+    'Gerenciamento': '''
+from app.controllers import turma_controller
+from app.models.aluno_model import Aluno
+from app.models.professor_model import Professor
+from app.models.turma_model import Turma
+
+def criar(filhos):
+    turma = Turma(descricao='Turma', professor=Professor(nome='Professor'))
+    db.session.add(turma)
+    db.session.commit()
+    db.session.execute(db.insert(Aluno), [{'nome': f'Aluno {i}', 'turma_id': turma.id} for i in range(filhos)])
+    db.session.commit()
+    return turma.id
+
+medir(criar, turma_controller.delete_turma)
+''',
+    'atividades': '''
+from app.controllers import atividade_controller
+from app.models.atividade_model import Atividade
+from app.models.nota_model import Nota
+
+def criar(filhos):
+    atividade = Atividade(nome='Atividade', turma_id=1, professor_id=1)
+    db.session.add(atividade)
+    db.session.commit()
+    db.session.execute(db.insert(Nota), [{'nota': 5.0, 'aluno_id': i, 'atividade_id': atividade.id} for i in range(filhos)])
+    db.session.commit()
+    return atividade.id
+
+medir(criar, atividade_controller.delete_atividade)
+''',
+}
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--filhos', type=int, nargs='+', default=[100, 2000, 20000])
+    parser.add_argument('--repeticoes', type=int, default=3)
+    parser.add_argument('--raiz', default=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                        help='Diretório com os serviços (padrão: a raiz do repositório)')
+    args = parser.parse_args()
+
+    print(f"{'serviço':<15}{'filhos':>8}{'ms':>10}{'µs/filho':>10}")
+    for servico, medicao in MEDICOES.items():
+        with tempfile.TemporaryDirectory() as temporario:
+            processo = subprocess.run(
+                [sys.executable, '-c', PREAMBULO + medicao, temporario, json.dumps(args.filhos), str(args.repeticoes)],
+                cwd=os.path.join(args.raiz, servico), env={**os.environ, 'PYTHONPATH': os.pathsep.join(filter(None, ['.', os.environ.get('PYTHONPATH')]))},
+                capture_output=True, text=True, check=True
+            )
+        for linha in processo.stdout.splitlines():
+            resultado = json.loads(linha)
+            por_filho = resultado['ms'] * 1000 / resultado['filhos']
+            print(f"{servico:<15}{resultado['filhos']:>8}{resultado['ms']:>10}{por_filho:>10.1f}")
+
+if __name__ == '__main__':
+    main()
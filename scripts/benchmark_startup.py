@@ -0,0 +1,81 @@
+"""Tempo de inicialização de cada serviço: do import do app até a primeira resposta de /apispec_1.json.
+
+Uso, a partir da raiz do repositório:
+
+    python scripts/benchmark_startup.py [--repeticoes 5] [--sem-apispec]
+
+Cada medição roda em um processo Python novo, no diretório do serviço (os
+pacotes se chamam todos `app`), com banco e cache em um diretório temporário.
+Antes das medições a especificação OpenAPI é gerada como no build da imagem
+(`flask --app app gerar-apispec`); com --sem-apispec o arquivo não existe e a
+primeira requisição gera a especificação em tempo de execução, para comparar.
+Mostra a mediana de cada etapa, em milissegundos.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+SERVICOS = ('Gerenciamento', 'Reservas', 'atividades')
+
+MEDICAO = '''
+import time
+inicio = time.perf_counter()
+import json, os, sys
+from config import Config
+from app import create_app
+importado = time.perf_counter()
+
+class ConfigBenchmark(Config):
+    SQLALCHEMY_DATABASE_URI = 'sqlite:///' + os.path.join(sys.argv[1], 'benchmark.db')
+    CACHE_COMPARTILHADO_ARQUIVO = os.path.join(sys.argv[1], 'cache.db')
+
+app = create_app(ConfigBenchmark)
+criado = time.perf_counter()
+resposta = app.test_client().get('/apispec_1.json')
+assert resposta.status_code == 200, resposta.status_code
+respondido = time.perf_counter()
+
+print(json.dumps({
+    'import': (importado - inicio) * 1000,
+    'create_app': (criado - importado) * 1000,
+    'primeira_requisicao': (respondido - criado) * 1000,
+    'total': (respondido - inicio) * 1000,
+}))
+'''
+
+def executar(comando, diretorio, ambiente):
+    return subprocess.run(comando, cwd=diretorio, env=ambiente, capture_output=True, text=True, check=True).stdout
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeticoes', type=int, default=5)
+    parser.add_argument('--sem-apispec', action='store_true', help='Não gera o arquivo da especificação antes de medir')
+    parser.add_argument('--raiz', default=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                        help='Diretório com os serviços (padrão: a raiz do repositório)')
+    args = parser.parse_args()
+
+    etapas = ('import', 'create_app', 'primeira_requisicao', 'total')
+    print(f"{'serviço':<15}" + ''.join(f'{etapa:>21}' for etapa in etapas))
+    for servico in SERVICOS:
+        diretorio = os.path.join(args.raiz, servico)
+        with tempfile.TemporaryDirectory() as temporario:
+            ambiente = {
+                **os.environ,
+                'PYTHONPATH': os.pathsep.join(filter(None, ['.', os.environ.get('PYTHONPATH')])),
+                'APISPEC_ARQUIVO': os.path.join(temporario, 'apispec.json'),
+            }
+            if not args.sem_apispec:
+                executar([sys.executable, '-m', 'flask', '--app', 'app', 'gerar-apispec'], diretorio, ambiente)
+
+            medicoes = [
+                json.loads(executar([sys.executable, '-c', MEDICAO, temporario], diretorio, ambiente))
+                for _ in range(args.repeticoes)
+            ]
+        print(f'{servico:<15}' + ''.join(f'{statistics.median(m[etapa] for m in medicoes):>21.1f}' for etapa in etapas))
+
+if __name__ == '__main__':
+    main()